@@ -0,0 +1,61 @@
+# Telemetry_tools/convert_to_csv.py
+# Convert a binary telemetry log (run_*.bin, written with TELEMETRY_FORMAT = "bin")
+# back into a CSV next to it, so the other tools can read it.
+#
+# File layout (self-describing):
+#   line 1: b"SBXT1 <struct format>"
+#   line 2: CSV column names
+#   then fixed-size records packed with that struct format
+
+import csv
+import os
+import struct
+import sys
+
+MAGIC = b"SBXT1"
+
+
+def read_bin(path: str):
+    with open(path, "rb") as f:
+        magic, _, fmt = f.readline().rstrip(b"\n").partition(b" ")
+        if magic != MAGIC:
+            raise ValueError(f"Not a telemetry log (bad magic {magic!r}): {path}")
+        columns = f.readline().decode("utf-8").rstrip("\n").split(",")
+        body = f.read()
+
+    rec = struct.Struct(fmt.decode("ascii"))
+    if len(body) % rec.size:
+        # a run that was killed mid-write: drop the partial tail record
+        body = body[: len(body) - len(body) % rec.size]
+
+    rows = []
+    for vals in rec.iter_unpack(body):
+        rows.append([v.rstrip(b"\0").decode("utf-8") if isinstance(v, bytes) else v for v in vals])
+    return columns, rows
+
+
+def convert(path: str) -> str:
+    columns, rows = read_bin(path)
+    out_path = os.path.splitext(path)[0] + ".csv"
+    with open(out_path, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(columns)
+        w.writerows(rows)
+    return out_path
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python Telemetry_tools/convert_to_csv.py telemetry\\runs\\run_*.bin")
+        sys.exit(1)
+
+    path = sys.argv[1]
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"Could not find log: {path}")
+
+    out_path = convert(path)
+    print(f"Saved CSV -> {out_path}")
+
+
+if __name__ == "__main__":
+    main()
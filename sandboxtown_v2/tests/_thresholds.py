@@ -0,0 +1,43 @@
+# sandboxtown_v2/tests/_thresholds.py
+from __future__ import annotations
+
+from typing import Dict, Tuple
+
+from sandboxtown_v2.core.agent_state import AgentState, AgentStatus
+from sandboxtown_v2.core.hysteresis import Thresholds, TransitionResult, next_agent_status
+
+
+# Canonical thresholds shared by the HELP/REST hysteresis suites
+CANON_TH = Thresholds(
+    help_enter=0.30,
+    help_exit=0.35,
+    rest_enter=0.60,
+    rest_exit=0.65,
+    visual_min_stable=0.80,
+)
+
+# HELP-only suite: REST kept well below the HELP values so it cannot interfere
+HELP_TH = Thresholds(
+    help_enter=0.30,
+    help_exit=0.35,
+    rest_enter=0.20,
+    rest_exit=0.25,
+    visual_min_stable=0.80,
+)
+
+# 0.00 .. 1.00 in 0.01 steps (rounded so keys compare equal to float literals)
+QUANTIZED_STABS = tuple(round(i * 0.01, 6) for i in range(101))
+
+StepTable = Dict[Tuple[AgentState, float], TransitionResult]
+
+
+def build_step_table(thresholds: Thresholds) -> StepTable:
+    """
+    next_agent_status results for every (state, grid stability) under `thresholds`.
+    Off-grid stabilities are not in the table; callers fall back to a direct call.
+    """
+    return {
+        (state, q): next_agent_status(AgentStatus(state=state, stability=q), thresholds)
+        for state in AgentState
+        for q in QUANTIZED_STABS
+    }
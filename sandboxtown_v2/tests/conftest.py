@@ -0,0 +1,18 @@
+# sandboxtown_v2/tests/conftest.py
+from __future__ import annotations
+
+import pytest
+
+from sandboxtown_v2.tests._thresholds import CANON_TH, HELP_TH, StepTable, build_step_table
+
+
+@pytest.fixture(scope="session")
+def step_table() -> StepTable:
+    """Precomputed next_agent_status results under CANON_TH."""
+    return build_step_table(CANON_TH)
+
+
+@pytest.fixture(scope="session")
+def help_step_table() -> StepTable:
+    """Precomputed next_agent_status results under HELP_TH."""
+    return build_step_table(HELP_TH)
@@ -1,39 +1,44 @@
 # sandboxtown_v2/tests/test_help_hysteresis.py
 from __future__ import annotations
 
+from typing import cast
+
 from sandboxtown_v2.core.agent_state import AgentState, AgentStatus
 from sandboxtown_v2.core.hysteresis import Thresholds, next_agent_status
+from sandboxtown_v2.tests._thresholds import HELP_TH, StepTable
 
 
 def th() -> Thresholds:
     # Keep REST well below our HELP test values so it cannot interfere
-    return Thresholds(
-        help_enter=0.30,
-        help_exit=0.35,
-        rest_enter=0.20,
-        rest_exit=0.25,
-        visual_min_stable=0.80,
-    )
+    return HELP_TH
 
 
-def run_sequence(start_state: AgentState, stabilities: list[float]) -> list[tuple[AgentState, str | None]]:
+def run_sequence(
+    start_state: AgentState,
+    stabilities: list[float],
+    table: StepTable | None = None,
+) -> list[tuple[AgentState, str | None]]:
     """
     Returns [(state_after_step, event), ...] for each stability input.
+
+    `table` is the session help_step_table; misses (off-grid stabilities)
+    fall back to a direct call.
     """
     t = th()
-    status = AgentStatus(state=start_state, stability=stabilities[0])
-    out: list[tuple[AgentState, str | None]] = []
+    state = start_state
+    out = cast("list[tuple[AgentState, str | None]]", [None] * len(stabilities))
 
-    for s in stabilities:
-        status = AgentStatus(state=status.state, stability=s)
-        r = next_agent_status(status, t)
-        status = r.next_status
-        out.append((status.state, r.event))
+    for i, s in enumerate(stabilities):
+        r = table.get((state, s)) if table is not None else None
+        if r is None:
+            r = next_agent_status(AgentStatus(state=state, stability=s), t)
+        state = r.next_status.state
+        out[i] = (state, r.event)
 
     return out
 
 
-def test_help_enters_once_and_holds_until_help_exit():
+def test_help_enters_once_and_holds_until_help_exit(help_step_table):
     """
     Dip below help_enter => ENTER_HELP.
     Hover below help_exit => remain HELP with no exit.
@@ -42,6 +47,7 @@ def test_help_enters_once_and_holds_until_help_exit():
     seq = run_sequence(
         start_state=AgentState.STABLE,
         stabilities=[0.40, 0.29, 0.34, 0.349, 0.35],
+        table=help_step_table,
     )
 
     # Must enter HELP at first dip
@@ -55,7 +61,7 @@ def test_help_enters_once_and_holds_until_help_exit():
     assert seq[4][1] == "EXIT_HELP"
 
 
-def test_help_exit_event_only_fires_once_then_never_repeats_above_exit():
+def test_help_exit_event_only_fires_once_then_never_repeats_above_exit(help_step_table):
     """
     After EXIT_HELP, further steps above help_exit must NOT emit EXIT_HELP again.
     (It may emit other events like STABLE depending on your band mapping.)
@@ -63,6 +69,7 @@ def test_help_exit_event_only_fires_once_then_never_repeats_above_exit():
     seq = run_sequence(
         start_state=AgentState.STABLE,
         stabilities=[0.40, 0.29, 0.35, 0.36, 0.40, 0.38],
+        table=help_step_table,
     )
 
     events = [e for _, e in seq]
@@ -75,13 +82,14 @@ def test_help_exit_event_only_fires_once_then_never_repeats_above_exit():
     assert all(e != "EXIT_HELP" for e in events[exit_idx + 1 :])
 
 
-def test_help_can_reenter_after_exit_when_dipping_below_help_enter_again():
+def test_help_can_reenter_after_exit_when_dipping_below_help_enter_again(help_step_table):
     """
     Enter HELP -> Exit HELP -> later dip again -> ENTER_HELP again.
     """
     seq = run_sequence(
         start_state=AgentState.STABLE,
         stabilities=[0.40, 0.29, 0.35, 0.40, 0.29],
+        table=help_step_table,
     )
 
     events = [e for _, e in seq]
@@ -3,23 +3,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, cast
 
 import pytest
 
 from sandboxtown_v2.core.agent_state import AgentState, AgentStatus
 from sandboxtown_v2.core.hysteresis import next_agent_status, Thresholds
+from sandboxtown_v2.tests._thresholds import CANON_TH, StepTable
 
 
 def th() -> Thresholds:
     # Default thresholds used across tests
-    return Thresholds(
-        help_enter=0.30,
-        help_exit=0.35,
-        rest_enter=0.60,
-        rest_exit=0.65,
-        visual_min_stable=0.80,
-    )
+    return CANON_TH
 
 
 def step(state: AgentState, stability: float) -> AgentStatus:
@@ -30,18 +25,26 @@ def run_sequence(
     start_state: AgentState,
     stabilities: List[float],
     thresholds: Thresholds,
+    table: Optional[StepTable] = None,
 ) -> List[Tuple[AgentState, Optional[str]]]:
     """
     Returns a per-step list of (state, event) after applying next_agent_status.
+
+    `table` is the session step_table; it is only consulted for CANON_TH and
+    misses (off-grid stabilities) fall back to a direct call.
     """
-    cur = step(start_state, stabilities[0])
-    out: List[Tuple[AgentState, Optional[str]]] = []
+    if thresholds != CANON_TH:
+        table = None
+
+    state = start_state
+    out = cast(List[Tuple[AgentState, Optional[str]]], [None] * len(stabilities))
 
-    for s in stabilities:
-        cur = AgentStatus(state=cur.state, stability=s)
-        res = next_agent_status(cur, thresholds)
-        cur = res.next_status
-        out.append((cur.state, res.event))
+    for i, s in enumerate(stabilities):
+        res = table.get((state, s)) if table is not None else None
+        if res is None:
+            res = next_agent_status(step(state, s), thresholds)
+        state = res.next_status.state
+        out[i] = (state, res.event)
 
     return out
 
@@ -50,7 +53,7 @@ def run_sequence(
 # Existing baseline tests (keep / extend as needed)
 # ============================================================
 
-def test_help_hysteresis_sequence():
+def test_help_hysteresis_sequence(step_table):
     """
     Dip below help_enter, hover below help_exit, then recover above help_exit.
     Verify HELP_SEEKING appears and doesn't exit until we cross help_exit.
@@ -58,7 +61,7 @@ def test_help_hysteresis_sequence():
     thresholds = th()
 
     seq = [0.40, 0.31, 0.29, 0.32, 0.34, 0.36, 0.40]
-    timeline = run_sequence(AgentState.STABLE, seq, thresholds)
+    timeline = run_sequence(AgentState.STABLE, seq, thresholds, step_table)
     states = [s for (s, _) in timeline]
 
     assert AgentState.HELP_SEEKING in states
@@ -73,7 +76,7 @@ def test_help_hysteresis_sequence():
     assert states[-1] != AgentState.HELP_SEEKING
 
 
-def test_help_exit_event_only_fires_once():
+def test_help_exit_event_only_fires_once(step_table):
     """
     After EXIT_HELP, further steps should not keep emitting EXIT_HELP unless you re-enter HELP again.
     """
@@ -82,6 +85,7 @@ def test_help_exit_event_only_fires_once():
         start_state=AgentState.STABLE,
         stabilities=[0.29, 0.35, 0.36, 0.40],
         thresholds=thresholds,
+        table=step_table,
     )
     events = [e for (_, e) in timeline]
 
@@ -98,60 +102,65 @@ def test_help_exit_event_only_fires_once():
 # B) Boundary precision tests
 # ============================================================
 
-def test_boundary_help_enter_exactly_enters_help():
+def test_boundary_help_enter_exactly_enters_help(step_table):
     thresholds = th()
     timeline = run_sequence(
         start_state=AgentState.STABLE,
         stabilities=[0.40, thresholds.help_enter],
         thresholds=thresholds,
+        table=step_table,
     )
     # At exactly help_enter, we expect HELP to enter (your code uses <=)
     assert timeline[-1][0] == AgentState.HELP_SEEKING
     assert timeline[-1][1] == "ENTER_HELP"
 
 
-def test_boundary_help_exit_exactly_exits_help():
+def test_boundary_help_exit_exactly_exits_help(step_table):
     thresholds = th()
     timeline = run_sequence(
         start_state=AgentState.HELP_SEEKING,
         stabilities=[0.34, thresholds.help_exit],
         thresholds=thresholds,
+        table=step_table,
     )
     # At exactly help_exit, we expect HELP to exit (your code uses >=)
     assert timeline[-1][0] != AgentState.HELP_SEEKING
     assert timeline[-1][1] == "EXIT_HELP"
 
 
-def test_boundary_rest_enter_exactly_does_not_enter_rest():
+def test_boundary_rest_enter_exactly_does_not_enter_rest(step_table):
     thresholds = th()
     timeline = run_sequence(
         start_state=AgentState.STABLE,
         stabilities=[0.80, thresholds.rest_enter],
         thresholds=thresholds,
+        table=step_table,
     )
     # REST triggers only when s < rest_enter (strict)
     assert timeline[-1][0] != AgentState.REST
     assert timeline[-1][1] is None
 
 
-def test_boundary_rest_enter_just_below_enters_rest():
+def test_boundary_rest_enter_just_below_enters_rest(step_table):
     thresholds = th()
     eps = 1e-6
     timeline = run_sequence(
         start_state=AgentState.STABLE,
         stabilities=[0.80, thresholds.rest_enter - eps],
         thresholds=thresholds,
+        table=step_table,
     )
     assert timeline[-1][0] == AgentState.REST
     assert timeline[-1][1] == "ENTER_REST"
 
 
-def test_boundary_rest_exit_exactly_exits_rest():
+def test_boundary_rest_exit_exactly_exits_rest(step_table):
     thresholds = th()
     timeline = run_sequence(
         start_state=AgentState.REST,
         stabilities=[0.64, thresholds.rest_exit],
         thresholds=thresholds,
+        table=step_table,
     )
     assert timeline[-1][0] != AgentState.REST
     assert timeline[-1][1] == "EXIT_REST"
@@ -161,24 +170,26 @@ def test_boundary_rest_exit_exactly_exits_rest():
 # A) REST symmetry tests (mirrors HELP suite)
 # ============================================================
 
-def test_rest_overrides_everything_even_if_help_seeking():
+def test_rest_overrides_everything_even_if_help_seeking(step_table):
     thresholds = th()
     # In HELP, but stability drops below rest_enter -> REST must win
     timeline = run_sequence(
         start_state=AgentState.HELP_SEEKING,
         stabilities=[0.40, 0.59],  # 0.59 < 0.60 => REST
         thresholds=thresholds,
+        table=step_table,
     )
     assert timeline[-1][0] == AgentState.REST
     assert timeline[-1][1] == "ENTER_REST"
 
 
-def test_rest_exit_event_only_fires_once():
+def test_rest_exit_event_only_fires_once(step_table):
     thresholds = th()
     timeline = run_sequence(
         start_state=AgentState.REST,
         stabilities=[0.62, 0.65, 0.66, 0.80],
         thresholds=thresholds,
+        table=step_table,
     )
     events = [e for (_, e) in timeline]
     assert events.count("EXIT_REST") == 1
@@ -186,13 +197,14 @@ def test_rest_exit_event_only_fires_once():
     assert all(ev != "EXIT_REST" for ev in events[exit_i + 1:])
 
 
-def test_rest_does_not_exit_until_crossing_rest_exit():
+def test_rest_does_not_exit_until_crossing_rest_exit(step_table):
     thresholds = th()
     # Hover below rest_exit should stay REST, then cross and exit.
     timeline = run_sequence(
         start_state=AgentState.REST,
         stabilities=[0.60, 0.64, 0.649, 0.65],
         thresholds=thresholds,
+        table=step_table,
     )
     states = [s for (s, _) in timeline]
     # first 3 should still be REST
@@ -204,7 +216,7 @@ def test_rest_does_not_exit_until_crossing_rest_exit():
     assert timeline[3][1] == "EXIT_REST"
 
 
-def test_rest_can_reenter_after_exiting_if_stability_drops_again():
+def test_rest_can_reenter_after_exiting_if_stability_drops_again(step_table):
     thresholds = th()
     eps = 1e-6
     timeline = run_sequence(
@@ -215,6 +227,7 @@ def test_rest_can_reenter_after_exiting_if_stability_drops_again():
             thresholds.rest_enter - eps,  # drop -> re-enter rest
         ],
         thresholds=thresholds,
+        table=step_table,
     )
     states = [s for (s, _) in timeline]
     events = [e for (_, e) in timeline]
@@ -11,18 +11,24 @@
 
 import math
 import os
+import inspect
 import csv
 import random
 import argparse
+import multiprocessing
+from collections import deque
 from datetime import datetime
 from dataclasses import dataclass, field
-from typing import Dict, Optional, List, Tuple, Set, Any
+from typing import Deque, Dict, Optional, List, Tuple, Set, Any
 
 import pygame
 
 from policy_engine import make_policy
 from profiles import get_profile, MotionProfile
 
+# make_policy may or may not accept trace_strength — checked once at import
+_MAKE_POLICY_HAS_TRACE = "trace_strength" in inspect.signature(make_policy).parameters
+
 
 # =========================
 # VARIANT SWITCH (edit this)
@@ -42,6 +48,9 @@ VARIANT = "BASE"
 W, H = 980, 560
 FPS = 60
 
+# longest trail draw_world keeps (18 + 90 * energy at full energy)
+TRAIL_MAX_LEN = 108
+
 BG = (16, 16, 18)
 TXT = (235, 235, 235)
 SUBTXT = (190, 190, 195)
@@ -61,6 +70,62 @@ AGENT_C_COLOR = (200, 220, 255)  # Kiwi slow
 AGENT_D_COLOR = (255, 255, 200)  # Sparrow
 
 
+# =========================
+# RNG
+# =========================
+# bound to the module-level generator, so random.seed() in run_sim still drives them
+_random = random.random
+_randint = random.randint
+_uniform = random.uniform
+
+
+# =========================
+# Telemetry
+# =========================
+TELEMETRY_BUF_ROWS = 1024  # rows held in memory between writerows() calls
+
+TELEMETRY_COLUMNS = [
+    "t_sec","dt","agent_id",
+    "x","y","vx","vy","speed",
+    "zone","commit_zone","commit_left","dwell_ticks","work_units","output_score",
+    "energy","load","coherence","curiosity",
+    "profile","model",
+    "variant","seed","policy","trace_strength"
+]
+
+
+class ParquetTelemetry:
+    """
+    Columnar sink for --format parquet (batch runs). Takes the same row batches as
+    csv.writer.writerows, but with raw values; pyarrow is only imported when used.
+    ncols keeps only the leading TELEMETRY_COLUMNS (run_batch.py writes the first 20).
+    """
+    def __init__(self, path: str, ncols: int = len(TELEMETRY_COLUMNS)):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        f64, i64, txt = pa.float64(), pa.int64(), pa.string()
+        types = [
+            f64, f64, txt,
+            f64, f64, f64, f64, f64,
+            txt, txt, i64, i64, i64, f64,
+            f64, f64, f64, f64,
+            txt, txt,
+            txt, i64, txt, f64,
+        ]
+        self._pa = pa
+        self.schema = pa.schema(list(zip(TELEMETRY_COLUMNS[:ncols], types[:ncols])))
+        self.writer = pq.ParquetWriter(path, self.schema, compression="zstd")
+
+    def writerows(self, rows: List[tuple]):
+        pa = self._pa
+        arrays = [pa.array(col, type=fld.type) for col, fld in zip(zip(*rows), self.schema)]
+        self.writer.write_table(pa.Table.from_arrays(arrays, schema=self.schema))
+
+    def close(self):
+        self.writer.close()
+
+
 # =========================
 # Helpers
 # =========================
@@ -82,6 +147,21 @@ def v2(x: float, y: float) -> pygame.Vector2:
     return pygame.Vector2(float(x), float(y))
 
 
+# rendered text memo for the HUD: (font, text, color) -> Surface; cleared when it fills up
+_TEXT_CACHE: Dict[Tuple[pygame.font.Font, str, Tuple[int, int, int]], pygame.Surface] = {}
+_TEXT_CACHE_MAX = 256
+
+
+def render_text(font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    key = (font, text, color)
+    surf = _TEXT_CACHE.get(key)
+    if surf is None:
+        if len(_TEXT_CACHE) >= _TEXT_CACHE_MAX:
+            _TEXT_CACHE.clear()
+        surf = _TEXT_CACHE[key] = font.render(text, True, color)
+    return surf
+
+
 def rounded_rect(
     surface: pygame.Surface,
     rect: pygame.Rect,
@@ -101,16 +181,18 @@ def inner_rect(rect: pygame.Rect, margin: int) -> pygame.Rect:
     return r
 
 
-def ensure_telemetry_paths(variant: str, runs: int | None = None) -> str:
+def ensure_telemetry_paths(variant: str, runs: int | None = None, run_index: int | None = None, ext: str = "csv") -> str:
     base_dir = r"C:\SandboxTown_Data\telemetry\runs"
     os.makedirs(base_dir, exist_ok=True)
 
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
     
     if runs and runs > 0:
-        filename = f"run_{runs}runs_{ts}_{variant.lower()}.csv"
+        # run_index keeps batch runs that start in the same second apart
+        idx = f"_{run_index:03d}" if run_index is not None else ""
+        filename = f"run_{runs}runs_{ts}_{variant.lower()}{idx}.{ext}"
     else:
-        filename = f"run_single_{ts}_{variant.lower()}.csv"
+        filename = f"run_single_{ts}_{variant.lower()}.{ext}"
 
     return os.path.join(base_dir, filename)
 
@@ -118,7 +200,10 @@ def ensure_telemetry_paths(variant: str, runs: int | None = None) -> str:
 # =========================
 # Data Models
 # =========================
-@dataclass
+# order of Zone.dvec (matches AgentState / integrate_state argument order)
+ZONE_DRIVES = ("energy", "load", "coherence", "curiosity")
+
+@dataclass(slots=True)
 class Zone:
     name: str
     rect: pygame.Rect
@@ -127,14 +212,37 @@ class Zone:
     pause_bias: float = 1.0
     commit_bias: float = 1.0
 
+    # flat bounds, cached once (zones never move); tests are half-open like Rect.collidepoint
+    left: int = field(init=False, repr=False)
+    top: int = field(init=False, repr=False)
+    right: int = field(init=False, repr=False)
+    bottom: int = field(init=False, repr=False)
+    # margin -> inner (left, top, right, bottom)
+    _soft_bounds: Dict[int, Tuple[int, int, int, int]] = field(init=False, repr=False, default_factory=dict)
+    # deltas flattened in ZONE_DRIVES order, so the tick path does no dict lookups
+    dvec: Tuple[float, float, float, float] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        r = self.rect
+        self.left, self.top, self.right, self.bottom = r.left, r.top, r.right, r.bottom
+        self.dvec = tuple(self.deltas.get(k, 0.0) for k in ZONE_DRIVES)
+
     def contains(self, pos: pygame.Vector2) -> bool:
-        return self.rect.collidepoint(pos.x, pos.y)
+        return self.left <= pos.x < self.right and self.top <= pos.y < self.bottom
 
     def center(self) -> pygame.Vector2:
         return pygame.Vector2(self.rect.centerx, self.rect.centery)
 
+    def soft_bounds(self, margin: int) -> Tuple[int, int, int, int]:
+        b = self._soft_bounds.get(margin)
+        if b is None:
+            r = inner_rect(self.rect, margin)
+            b = self._soft_bounds[margin] = (r.left, r.top, r.right, r.bottom)
+        return b
+
     def soft_contains(self, pos: pygame.Vector2, margin: int) -> bool:
-        return inner_rect(self.rect, margin).collidepoint(pos.x, pos.y)
+        l, t, r, b = self.soft_bounds(margin)
+        return l <= pos.x < r and t <= pos.y < b
 
     def near_edge(self, pos: pygame.Vector2, margin: int) -> bool:
         if not self.contains(pos):
@@ -142,7 +250,7 @@ class Zone:
         return not self.soft_contains(pos, margin)
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentState:
     energy: float = 0.70
     load: float = 0.20
@@ -150,7 +258,7 @@ class AgentState:
     curiosity: float = 0.70
 
 
-@dataclass
+@dataclass(slots=True)
 class Agent:
     agent_id: str
     profile: MotionProfile
@@ -180,7 +288,7 @@ class Agent:
     commit_zone: Optional[Zone] = None
     commit_ticks: int = 0
     last_choice: str = "None"
-    trail: List[pygame.Vector2] = field(default_factory=list)
+    trail: Deque[Tuple[float, float]] = field(default_factory=lambda: deque(maxlen=TRAIL_MAX_LEN))
 
     # --- exploration metrics (ants) ---
     last_zone_for_metrics: str = "None"
@@ -234,8 +342,9 @@ def build_zones(variant: str) -> List[Zone]:
 
 
 def zone_at(zones: List[Zone], pos: pygame.Vector2) -> Optional[Zone]:
+    x, y = pos.x, pos.y
     for z in zones:
-        if z.contains(pos):
+        if z.left <= x < z.right and z.top <= y < z.bottom:
             return z
     return None
 
@@ -245,24 +354,29 @@ def pick_point_in_zone(z: Zone, pad: int = 55) -> pygame.Vector2:
     r = z.rect
     max_pad_x = max(2, min(pad, (r.width // 2) - 2))
     max_pad_y = max(2, min(pad, (r.height // 2) - 2))
-    x = random.randint(r.left + max_pad_x, r.right - max_pad_x)
-    y = random.randint(r.top + max_pad_y, r.bottom - max_pad_y)
+    x = _randint(r.left + max_pad_x, r.right - max_pad_x)
+    y = _randint(r.top + max_pad_y, r.bottom - max_pad_y)
     return v2(x, y)
 
 
+def integrate_state(s: AgentState, de: float, dl: float, dc: float, dq: float, k: float):
+    # s.X = clamp01(s.X + dX * k) for all four drives; shared by the fish and ant engines
+    e = s.energy + de * k
+    l = s.load + dl * k
+    c = s.coherence + dc * k
+    q = s.curiosity + dq * k
+    s.energy = 0.0 if e < 0.0 else 1.0 if e > 1.0 else e
+    s.load = 0.0 if l < 0.0 else 1.0 if l > 1.0 else l
+    s.coherence = 0.0 if c < 0.0 else 1.0 if c > 1.0 else c
+    s.curiosity = 0.0 if q < 0.0 else 1.0 if q > 1.0 else q
+
+
 def apply_zone_effects(agent: Agent, z: Optional[Zone], dt: float):
-    s = agent.state
     if z is None:
-        s.energy = clamp01(s.energy + (-0.006) * dt)
-        s.load = clamp01(s.load + (-0.004) * dt)
-        s.coherence = clamp01(s.coherence + (+0.002) * dt)
-        s.curiosity = clamp01(s.curiosity + (+0.001) * dt)
+        integrate_state(agent.state, -0.006, -0.004, +0.002, +0.001, dt)
         return
 
-    s.energy = clamp01(s.energy + z.deltas.get("energy", 0.0) * dt)
-    s.load = clamp01(s.load + z.deltas.get("load", 0.0) * dt)
-    s.coherence = clamp01(s.coherence + z.deltas.get("coherence", 0.0) * dt)
-    s.curiosity = clamp01(s.curiosity + z.deltas.get("curiosity", 0.0) * dt)
+    integrate_state(agent.state, *z.dvec, dt)
 
 
 # =========================
@@ -274,21 +388,22 @@ def dwell_ramp_ant(agent: Agent) -> float:
 
 
 def soft_edge_factor_ant(z: Zone, pos: pygame.Vector2, margin: int) -> float:
-    inner = inner_rect(z.rect, margin)
-    if inner.collidepoint(pos.x, pos.y):
+    il, it, ir, ib = z.soft_bounds(margin)
+    x, y = pos.x, pos.y
+    if il <= x < ir and it <= y < ib:
         return 1.0
 
     dx = 0.0
-    if pos.x < inner.left:
-        dx = inner.left - pos.x
-    elif pos.x > inner.right:
-        dx = pos.x - inner.right
+    if x < il:
+        dx = il - x
+    elif x > ir:
+        dx = x - ir
 
     dy = 0.0
-    if pos.y < inner.top:
-        dy = inner.top - pos.y
-    elif pos.y > inner.bottom:
-        dy = pos.y - inner.bottom
+    if y < it:
+        dy = it - y
+    elif y > ib:
+        dy = y - ib
 
     d = math.hypot(dx, dy)
     if d <= 0:
@@ -307,35 +422,46 @@ def exposure_factor_ant(z: Zone, pos: pygame.Vector2) -> float:
     return max(0.35, 1.15 - d)
 
 
+# ant score slots; this order is also the tie-break order (first max wins)
+ZONE_IDX = {"Park": 0, "Library": 1, "Transition": 2, "Rest": 3}
+
+# (zones, by_slot) for the last zones list seen; zones never change within a run
+_slot_cache: Optional[Tuple[List[Zone], List[Optional[Zone]]]] = None
+
+
+def zones_by_slot(zones: List[Zone]) -> List[Optional[Zone]]:
+    global _slot_cache
+    if _slot_cache is None or _slot_cache[0] is not zones:
+        by_slot: List[Optional[Zone]] = [None] * len(ZONE_IDX)
+        for z in zones:
+            by_slot[ZONE_IDX[z.name]] = z
+        _slot_cache = (zones, by_slot)
+    return _slot_cache[1]
+
+
 def decide_target_zone_ant(agent: Agent, zones: List[Zone]) -> Zone:
     p = agent.profile
-    zmap = {z.name: z for z in zones}
     s = agent.state
+    by_slot = zones_by_slot(zones)
 
-    score_park = (1.0 - s.energy) * 1.25 + s.load * 1.20 + (1.0 - s.coherence) * 0.15
-    score_lib = s.curiosity * 1.10 + s.coherence * 0.75 - s.load * 0.30
-    score_trans = (1.0 - s.coherence) * 1.25 + s.load * 0.35
-    score_rest = (1.0 - s.energy) * 0.55 + s.load * 0.85 + (1.0 - s.coherence) * 0.25
-
-    scores: Dict[str, float] = {}
-    if "Park" in zmap:
-        scores["Park"] = score_park
-    if "Library" in zmap:
-        scores["Library"] = score_lib
-    if "Transition" in zmap:
-        scores["Transition"] = score_trans
-    if "Rest" in zmap:
-        scores["Rest"] = score_rest
+    scores = (
+        (1.0 - s.energy) * 1.25 + s.load * 1.20 + (1.0 - s.coherence) * 0.15,  # Park
+        s.curiosity * 1.10 + s.coherence * 0.75 - s.load * 0.30,               # Library
+        (1.0 - s.coherence) * 1.25 + s.load * 0.35,                           # Transition
+        (1.0 - s.energy) * 0.55 + s.load * 0.85 + (1.0 - s.coherence) * 0.25,  # Rest
+    )
 
-    best_name = max(scores.keys(), key=lambda k: scores[k])
-    best_score = scores[best_name]
+    best = -1
+    for i in range(4):
+        if by_slot[i] is not None and (best < 0 or scores[i] > scores[best]):
+            best = i
 
-    if agent.last_choice in scores and agent.last_choice in zmap:
-        last_score = scores[agent.last_choice]
-        if best_name != agent.last_choice and (best_score - last_score) < p.hysteresis_eps:
-            best_name = agent.last_choice
+    last = ZONE_IDX.get(agent.last_choice, -1)
+    if last >= 0 and last != best and by_slot[last] is not None:
+        if (scores[best] - scores[last]) < p.hysteresis_eps:
+            best = last
 
-    return zmap[best_name]
+    return by_slot[best]
 
 
 def edge_pause_check_ant(agent: Agent, prev_zone: Optional[Zone], now_zone: Optional[Zone]):
@@ -400,46 +526,59 @@ def update_agent_ant(agent: Agent, zones: List[Zone], dt: float):
         soft = soft_edge_factor_ant(now_zone, agent.pos, p.soft_edge_margin)
         expo = exposure_factor_ant(now_zone, agent.pos)
         strength = ramp * soft * expo
-        st = agent.state
-        st.energy = clamp01(st.energy + now_zone.deltas.get("energy", 0.0) * strength * dt * 60.0)
-        st.load = clamp01(st.load + now_zone.deltas.get("load", 0.0) * strength * dt * 60.0)
-        st.coherence = clamp01(st.coherence + now_zone.deltas.get("coherence", 0.0) * strength * dt * 60.0)
-        st.curiosity = clamp01(st.curiosity + now_zone.deltas.get("curiosity", 0.0) * strength * dt * 60.0)
+        integrate_state(agent.state, *now_zone.dvec, strength * dt * 60.0)
 
     if agent.commit_ticks <= 0 or agent.commit_zone is None:
         chosen = decide_target_zone_ant(agent, zones)
         agent.last_choice = chosen.name
         agent.commit_zone = chosen
-        agent.commit_ticks = random.randint(p.commit_min, p.commit_max)
+        agent.commit_ticks = _randint(p.commit_min, p.commit_max)
         agent.target = pick_point_in_zone(chosen, pad=55)
     else:
         agent.commit_ticks -= 1
 
     if agent.commit_zone and agent.commit_zone.contains(agent.pos):
-        if random.random() < p.inside_zone_retarget_p:
+        if _random() < p.inside_zone_retarget_p:
             agent.target = pick_point_in_zone(agent.commit_zone, pad=55)
-        if random.random() < p.orbit_impulse_p:
+        if _random() < p.orbit_impulse_p:
             agent.target += v2(
-                random.randint(-p.orbit_strength_x, p.orbit_strength_x),
-                random.randint(-p.orbit_strength_y, p.orbit_strength_y),
+                _randint(-p.orbit_strength_x, p.orbit_strength_x),
+                _randint(-p.orbit_strength_y, p.orbit_strength_y),
             )
 
-    to_target = agent.target - agent.pos
-    desired = safe_normalize(to_target)
-
-    ang = random.random() * math.tau
-    wander = v2(math.cos(ang), math.sin(ang))
-    desired = safe_normalize(desired + p.wander_mix * wander)
+    # steering + integration on plain floats (same arithmetic as safe_normalize /
+    # Vector2.lerp), written back into pos/vel in place: no temporary Vector2s per tick
+    pos, vel = agent.pos, agent.vel
+    px, py = pos.x, pos.y
+    dx, dy = agent.target.x - px, agent.target.y - py
+    l2 = dx * dx + dy * dy
+    if l2 <= 1e-9:
+        dx = dy = 0.0
+    else:
+        n = math.sqrt(l2)
+        dx, dy = dx / n, dy / n
+
+    ang = _random() * math.tau
+    dx += p.wander_mix * math.cos(ang)
+    dy += p.wander_mix * math.sin(ang)
+    l2 = dx * dx + dy * dy
+    if l2 <= 1e-9:
+        dx = dy = 0.0
+    else:
+        n = math.sqrt(l2)
+        dx, dy = dx / n, dy / n
 
     speed = p.base_speed * (0.35 + 1.05 * agent.state.energy)
     speed = max(p.crawl_speed_min, speed)
 
-    steer = desired * speed
-    agent.vel = agent.vel.lerp(steer, p.lerp_alpha)
-    agent.pos += agent.vel * dt
+    a = p.lerp_alpha
+    vx = vel.x * (1 - a) + dx * speed * a
+    vy = vel.y * (1 - a) + dy * speed * a
+    vel.update(vx, vy)
 
-    agent.pos.x = max(20, min(W - 20, agent.pos.x))
-    agent.pos.y = max(20, min(H - 20, agent.pos.y))
+    px += vx * dt
+    py += vy * dt
+    pos.update(max(20, min(W - 20, px)), max(20, min(H - 20, py)))
 
 
 # =========================
@@ -453,7 +592,7 @@ def maybe_edge_pause_fish(agent: Agent, z: Optional[Zone]):
 
     near = z.near_edge(agent.pos, p.soft_edge_margin)
     if near and not agent.fish_edge_pause_latch and agent.fish_pause_cooldown_s <= 0.0:
-        hold = random.uniform(p.fish_pause_min_s, p.fish_pause_max_s) * z.pause_bias
+        hold = _uniform(p.fish_pause_min_s, p.fish_pause_max_s) * z.pause_bias
         agent.fish_pause_hold_s = max(agent.fish_pause_hold_s, hold)
         agent.fish_edge_pause_latch = True
     elif not near:
@@ -494,9 +633,9 @@ def pick_commit_zone_fish(agent: Agent, zones: List[Zone], variant: str) -> Opti
     if not weights:
         return None
 
-    if random.random() < p.fish_commit_p:
+    if _random() < p.fish_commit_p:
         total = sum(weights.values())
-        r = random.random() * total
+        r = _random() * total
         acc = 0.0
         for name, wv in weights.items():
             acc += wv
@@ -550,7 +689,7 @@ def decide_target_fish(agent: Agent, zones: List[Zone], variant: str) -> pygame.
         if current is not None and current.name == z.name and current.near_edge(agent.pos, p.soft_edge_margin):
             score -= 0.35
 
-        score += random.uniform(-0.08, 0.08)
+        score += _uniform(-0.08, 0.08)
         scores[z.name] = score
 
     if not scores:
@@ -586,7 +725,7 @@ def update_agent_fish(agent: Agent, zones: List[Zone], dt: float, variant: str):
         agent.fish_commit_ticks_left -= 1
         if agent.fish_commit_ticks_left <= 0:
             agent.fish_commit_zone = None
-            agent.fish_commit_cooldown_ticks = random.randint(
+            agent.fish_commit_cooldown_ticks = _randint(
                 p.fish_commit_cooldown_min, p.fish_commit_cooldown_max
             )
 
@@ -609,7 +748,7 @@ def update_agent_fish(agent: Agent, zones: List[Zone], dt: float, variant: str):
         cz = pick_commit_zone_fish(agent, zones, variant)
         if cz is not None:
             agent.fish_commit_zone = cz
-            agent.fish_commit_ticks_left = random.randint(p.fish_commit_min, p.fish_commit_max)
+            agent.fish_commit_ticks_left = _randint(p.fish_commit_min, p.fish_commit_max)
 
     if (agent.dwell_ticks % 8 == 0 or agent.target.length_squared() == 0):
         agent.target = decide_target_fish(agent, zones, variant)
@@ -621,13 +760,16 @@ def update_agent_fish(agent: Agent, zones: List[Zone], dt: float, variant: str):
         agent.fish_pause_cooldown_s = max(agent.fish_pause_cooldown_s, 0.10)
 
     if not agent.paused:
-        to = (agent.target - agent.pos)
-        dist = to.length()
+        pos, vel = agent.pos, agent.vel
+        tx, ty = agent.target.x - pos.x, agent.target.y - pos.y
+        dist = math.sqrt(tx * tx + ty * ty)
         if dist > 1.0:
-            desired = to.normalize() * p.fish_base_speed
+            speed = p.fish_base_speed
             t = clamp(dt * p.fish_turn_rate, 0.0, 1.0)
-            agent.vel = agent.vel.lerp(desired, t)
-            agent.pos += agent.vel * dt
+            vx = vel.x * (1 - t) + tx / dist * speed * t
+            vy = vel.y * (1 - t) + ty / dist * speed * t
+            vel.update(vx, vy)
+            pos.update(pos.x + vx * dt, pos.y + vy * dt)
         else:
             agent.vel *= 0.85
     else:
@@ -637,14 +779,27 @@ def update_agent_fish(agent: Agent, zones: List[Zone], dt: float, variant: str):
 # =========================
 # Draw
 # =========================
-def draw_world(screen: pygame.Surface, zones: List[Zone], agents: List[Agent]):
-    screen.fill(BG)
-    margin = agents[0].profile.soft_edge_margin if agents else 35
+# (zones, margin, surface) of the last static background; zones never change within a run
+_world_bg: Optional[Tuple[List[Zone], int, pygame.Surface]] = None
+
 
+def _build_world_background(zones: List[Zone], margin: int) -> pygame.Surface:
+    bg = pygame.Surface((W, H)).convert()
+    bg.fill(BG)
     for z in zones:
-        rounded_rect(screen, z.rect, z.color, radius=26, width=0)
+        rounded_rect(bg, z.rect, z.color, radius=26, width=0)
         r_in = inner_rect(z.rect, margin)
-        rounded_rect(screen, r_in, (245, 245, 248), radius=20, width=2)
+        rounded_rect(bg, r_in, (245, 245, 248), radius=20, width=2)
+    return bg
+
+
+def draw_world(screen: pygame.Surface, zones: List[Zone], agents: List[Agent]):
+    global _world_bg
+    margin = agents[0].profile.soft_edge_margin if agents else 35
+
+    if _world_bg is None or _world_bg[0] is not zones or _world_bg[1] != margin:
+        _world_bg = (zones, margin, _build_world_background(zones, margin))
+    screen.blit(_world_bg[2], (0, 0))
 
     for a in agents:
         if a.agent_id == "A":
@@ -658,10 +813,11 @@ def draw_world(screen: pygame.Surface, zones: List[Zone], agents: List[Agent]):
 
         if a.profile.model == "ant":
             max_len = int(18 + 90 * a.state.energy)
-            if len(a.trail) > max_len:
-                del a.trail[:-max_len]
-            for i in range(1, len(a.trail)):
-                pygame.draw.line(screen, col, a.trail[i - 1], a.trail[i], width=2)
+            trail = a.trail
+            while len(trail) > max_len:
+                trail.popleft()
+            if len(trail) >= 2:
+                pygame.draw.lines(screen, col, False, trail, width=2)
         else:
             streak_len = 22
             dirv = a.vel.normalize() if a.vel.length() > 0.5 else pygame.Vector2(1, 0)
@@ -680,7 +836,7 @@ def draw_hud(screen: pygame.Surface, font: pygame.font.Font, agents: List[Agent]
     ]
     y = 12
     for ln in lines:
-        screen.blit(font.render(ln, True, TXT), (12, y))
+        screen.blit(render_text(font, ln, TXT), (12, y))
         y += 22
 
     for a in agents:
@@ -697,30 +853,91 @@ def draw_hud(screen: pygame.Surface, font: pygame.font.Font, agents: List[Agent]
             f"W:{a.work_units:<5} "
             f"O:{a.output_score:.2f}"
         )
-        screen.blit(font.render(line, True, SUBTXT), (12, y))
+        screen.blit(render_text(font, line, SUBTXT), (12, y))
         y += 20
 
 
 # =========================
 # Simulation runner
 # =========================
+# run_sim picks one of these loops up front, so the per-tick path carries no headless/visual branches.
+def _run_headless_loop(step, seconds: float, dt: float):
+    t_sec = 0.0
+    while True:
+        t_sec += dt
+        step(t_sec, dt)
+        if t_sec >= seconds:
+            return
+
+
+def _run_visual_loop(step, zones: List[Zone], agents: List[Agent], csv_path: str, variant: str, dt_clamp_min: float):
+    pygame.init()
+    try:
+        screen = pygame.display.set_mode((W, H))
+        pygame.display.set_caption(f"ORPIN / MOS Sandbox Town — Ecosystem ({variant})")
+        clock = pygame.time.Clock()
+        font = pygame.font.SysFont("consolas", 18)
+        # only QUIT / KEYDOWN are handled: keep everything else (mouse motion etc.) off the queue
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
+
+        tick_running = True
+        step_once = False
+        hud_on = True
+        t_sec = 0.0
+        running = True
+
+        while running:
+            dt = clock.tick(FPS) / 1000.0
+            dt = dt if dt < dt_clamp_min else dt_clamp_min
+
+            # peek() pumps SDL; the empty-queue case skips get()
+            if pygame.event.peek((pygame.QUIT, pygame.KEYDOWN)):
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        running = False
+                    if event.type == pygame.KEYDOWN:
+                        if event.key == pygame.K_ESCAPE:
+                            running = False
+                        elif event.key == pygame.K_SPACE:
+                            tick_running = not tick_running
+                        elif event.key == pygame.K_n:
+                            step_once = True
+                        elif event.key == pygame.K_o:
+                            hud_on = not hud_on
+
+            if tick_running or step_once:
+                t_sec += dt
+                step(t_sec, dt)
+                step_once = False
+
+            draw_world(screen, zones, agents)
+            if hud_on:
+                draw_hud(screen, font, agents, csv_path, variant)
+            pygame.display.flip()
+    finally:
+        pygame.quit()
+
+
 def run_sim(
     variant: str,
     seed: Optional[int],
     seconds: float,
     *,
     runs: Optional[int] = None,
+    run_index: Optional[int] = None,
     headless: bool,
     summarize: bool,
     policy_name: str,
     trace_strength: float,
+    out_format: str = "csv",
 ) -> str:
     if seed is not None:
         random.seed(seed)
 
     zones = build_zones(variant)
     zmap = {z.name: z for z in zones}
-    any_center = list(zmap.values())[0].center()
+    any_center = next(iter(zmap.values())).center()
 
     # Profiles
     fantail = get_profile("fish")
@@ -749,10 +966,9 @@ def run_sim(
     agents = [A, B, C, D]
 
     # Policy bundle (passive unless enabled)
-    # make_policy may or may not accept trace_strength — support both safely.
-    try:
+    if _MAKE_POLICY_HAS_TRACE:
         policy_bundle = make_policy(policy_name, trace_strength=trace_strength)
-    except TypeError:
+    else:
         policy_bundle = make_policy(policy_name)
 
     for ag in agents:
@@ -761,142 +977,126 @@ def run_sim(
     # init trails/commit for ANT agents only
     for ag in agents:
         if ag.profile.model == "ant":
-            start_zone = zmap.get("Library", list(zmap.values())[0])
+            start_zone = zmap.get("Library") or next(iter(zmap.values()))
             ag.commit_zone = start_zone
-            ag.commit_ticks = random.randint(ag.profile.commit_min, ag.profile.commit_max)
+            ag.commit_ticks = _randint(ag.profile.commit_min, ag.profile.commit_max)
             ag.last_choice = ag.commit_zone.name
             ag.target = pick_point_in_zone(ag.commit_zone, pad=55)
-            ag.trail = [ag.pos.copy()]
+            ag.trail.append((ag.pos.x, ag.pos.y))
 
     # Telemetry
-    csv_path = ensure_telemetry_paths(variant, runs)
+    raw_rows = out_format == "parquet"
+    csv_path = ensure_telemetry_paths(variant, runs, run_index, ext="parquet" if raw_rows else "csv")
     os.makedirs(os.path.dirname(csv_path), exist_ok=True)
 
-    f = open(csv_path, "w", newline="", encoding="utf-8")
-    w = csv.writer(f)
-    w.writerow([
-        "t_sec","dt","agent_id",
-        "x","y","vx","vy","speed",
-        "zone","commit_zone","commit_left","dwell_ticks","work_units","output_score",
-        "energy","load","coherence","curiosity",
-        "profile","model",
-        "variant","seed","policy","trace_strength"
-    ])
-
-    # Pygame only if not headless
-    screen = None
-    clock = None
-    font = None
-    tick_running = True
-    step_once = False
-    hud_on = True
-
-    if not headless:
-        pygame.init()
-        screen = pygame.display.set_mode((W, H))
-        pygame.display.set_caption(f"ORPIN / MOS Sandbox Town — Ecosystem ({variant})")
-        clock = pygame.time.Clock()
-        font = pygame.font.SysFont("consolas", 18)
-
-    t_sec = 0.0
-    running = True
+    row_buf: List[Any] = []
+    if raw_rows:
+        w = ParquetTelemetry(csv_path)
+        close_sink = w.close
+    else:
+        f = open(csv_path, "w", newline="", encoding="utf-8", buffering=1 << 20)
+        w = csv.writer(f)
+        w.writerow(TELEMETRY_COLUMNS)
+        close_sink = f.close
+    # per-run constant columns, formatted once
+    seed_s = seed if seed is not None else ""
+    trace_s = f"{trace_strength:.4f}"
+
+    # per-run constants, hoisted out of the tick loop
+    dt_clamp_min = min(a.profile.dt_clamp for a in agents)
+    # one ctx per run; only "dt" changes per tick (policies see it persist across ticks)
+    ctx: Dict[str, Any] = {
+        "zones": zones,
+        "dt": 0.0,
+        "variant": variant,
+        "policy_name": policy_name,
+        "trace_strength": trace_strength,
+    }
+
+    # per-agent dispatch resolved once per run: (agent, is_fish, before_step, after_step, trail_eps_sq)
+    hooks_on = policy_name != "none"
+    plan = [
+        (
+            ag,
+            ag.profile.model == "fish",
+            ag.policy.before_step if hooks_on and ag.policy is not None else None,
+            ag.policy.after_step if hooks_on and ag.policy is not None else None,
+            ag.profile.trail_move_eps ** 2,
+        )
+        for ag in agents
+    ]
 
-    try:
-        while running:
-            # dt selection
-            if headless:
-                dt = 1.0 / float(FPS)
-            else:
-                dt = (clock.tick(FPS) / 1000.0) if clock else (1.0 / float(FPS))
+    def step(t_sec: float, dt: float):
+        # one simulation tick for every agent + its telemetry rows (shared by both loops)
+        dt_s = f"{dt:.4f}"
+        ctx["dt"] = dt
 
-            # clamp dt by profiles
-            dt = min(dt, min(a.profile.dt_clamp for a in agents))
+        for ag, is_fish, before_step, after_step, trail_eps_sq in plan:
+            before = ag.pos.copy()
 
-            # events only when visual
-            if not headless:
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        running = False
-                    if event.type == pygame.KEYDOWN:
-                        if event.key == pygame.K_ESCAPE:
-                            running = False
-                        elif event.key == pygame.K_SPACE:
-                            tick_running = not tick_running
-                        elif event.key == pygame.K_n:
-                            step_once = True
-                        elif event.key == pygame.K_o:
-                            hud_on = not hud_on
+            # --- policy pre-step (PASSIVE unless enabled) ---
+            if before_step is not None:
+                before_step(ag, ctx)
 
-            ran = True if headless else (tick_running or step_once)
-            if ran:
-                t_sec += dt
+            # --- model update ---
+            if is_fish:
+                update_agent_fish(ag, zones, dt, variant)
+            else:
+                update_agent_ant(ag, zones, dt)
 
-                ctx = {
-                    "zones": zones,
-                    "dt": dt,
-                    "variant": variant,
-                    "policy_name": policy_name,
-                    "trace_strength": trace_strength,
-                }
-
-                for ag in agents:
-                    before = ag.pos.copy()
-
-                    # --- policy pre-step (PASSIVE unless enabled) ---
-                    if policy_name != "none" and ag.policy is not None:
-                        ag.policy.before_step(ag, ctx)
-
-                    # --- model update ---
-                    if ag.profile.model == "fish":
-                        update_agent_fish(ag, zones, dt, variant)
-                    else:
-                        update_agent_ant(ag, zones, dt)
-
-                    if (ag.pos - before).length() >= ag.profile.trail_move_eps:
-                        ag.trail.append(ag.pos.copy())
-
-                    # --- policy post-step ---
-                    if policy_name != "none" and ag.policy is not None:
-                        ag.policy.after_step(ag, ctx)
-
-                    s = ag.state
-                    speed = ag.vel.length()
-
-                    if ag.profile.model == "fish":
-                        commit_zone = ag.fish_commit_zone if ag.fish_commit_zone else "-"
-                        commit_left = ag.fish_commit_ticks_left
-                    else:
-                        commit_zone = ag.commit_zone.name if ag.commit_zone else "-"
-                        commit_left = ag.commit_ticks
-
-                    w.writerow([
-                        round(t_sec, 4), round(dt, 4), ag.agent_id,
-                        round(ag.pos.x, 2), round(ag.pos.y, 2),
-                        round(ag.vel.x, 2), round(ag.vel.y, 2),
-                        round(speed, 2),
-                        ag.current_zone, commit_zone, commit_left, ag.dwell_ticks, ag.work_units, round(ag.output_score, 4),
-                        round(s.energy, 4), round(s.load, 4), round(s.coherence, 4), round(s.curiosity, 4),
-                        ag.profile.name, ag.profile.model,
-                        variant, (seed if seed is not None else ""), policy_name, round(trace_strength, 4)
-                    ])
+            if ag.pos.distance_squared_to(before) >= trail_eps_sq:
+                ag.trail.append((ag.pos.x, ag.pos.y))
 
-                step_once = False
+            # --- policy post-step ---
+            if after_step is not None:
+                after_step(ag, ctx)
 
-            # headless auto-stop
-            if headless and t_sec >= seconds:
-                running = False
+            s = ag.state
+            speed = ag.vel.length()
 
-            # draw only when visual
-            if not headless and screen is not None:
-                draw_world(screen, zones, agents)
-                if hud_on and font is not None:
-                    draw_hud(screen, font, agents, csv_path, variant)
-                pygame.display.flip()
+            if is_fish:
+                commit_zone = ag.fish_commit_zone if ag.fish_commit_zone else "-"
+                commit_left = ag.fish_commit_ticks_left
+            else:
+                commit_zone = ag.commit_zone.name if ag.commit_zone else "-"
+                commit_left = ag.commit_ticks
+
+            if raw_rows:
+                row_buf.append((
+                    t_sec, dt, ag.agent_id,
+                    ag.pos.x, ag.pos.y, ag.vel.x, ag.vel.y, speed,
+                    ag.current_zone, commit_zone, commit_left, ag.dwell_ticks, ag.work_units, ag.output_score,
+                    s.energy, s.load, s.coherence, s.curiosity,
+                    ag.profile.name, ag.profile.model,
+                    variant, seed, policy_name, trace_strength,
+                ))
+                continue
+
+            # precision is fixed by the format specs (no round() + float repr per column)
+            row_buf.append([
+                f"{t_sec:.4f}", dt_s, ag.agent_id,
+                f"{ag.pos.x:.2f}", f"{ag.pos.y:.2f}",
+                f"{ag.vel.x:.2f}", f"{ag.vel.y:.2f}",
+                f"{speed:.2f}",
+                ag.current_zone, commit_zone, commit_left, ag.dwell_ticks, ag.work_units, f"{ag.output_score:.4f}",
+                f"{s.energy:.4f}", f"{s.load:.4f}", f"{s.coherence:.4f}", f"{s.curiosity:.4f}",
+                ag.profile.name, ag.profile.model,
+                variant, seed_s, policy_name, trace_s
+            ])
+
+        if len(row_buf) >= TELEMETRY_BUF_ROWS:
+            w.writerows(row_buf)
+            row_buf.clear()
 
+    try:
+        if headless:
+            _run_headless_loop(step, seconds, min(1.0 / float(FPS), dt_clamp_min))
+        else:
+            _run_visual_loop(step, zones, agents, csv_path, variant, dt_clamp_min)
     finally:
-        f.close()
-        if not headless:
-            pygame.quit()
+        if row_buf:
+            w.writerows(row_buf)
+        close_sink()
 
     if summarize:
         print(f"\nRun saved -> {csv_path}")
@@ -910,6 +1110,23 @@ def run_sim(
 # =========================
 # CLI entry
 # =========================
+def _run_one(job: Tuple[Optional[int], int, float, int, bool, str, float, str]) -> str:
+    # one headless batch run; top-level so the worker pool can pickle it
+    seed_i, i, seconds, runs, summarize, policy_name, trace_strength, out_format = job
+    return run_sim(
+        VARIANT,
+        seed_i,
+        seconds,
+        runs=runs,
+        run_index=i,
+        headless=True,
+        summarize=summarize,
+        policy_name=policy_name,
+        trace_strength=trace_strength,
+        out_format=out_format,
+    )
+
+
 def main() -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument("--runs", type=int, default=0, help="Number of headless runs to execute (batch mode).")
@@ -919,24 +1136,34 @@ def main() -> None:
     parser.add_argument("--summarize", action="store_true", help="Print the summarize_run.py command at the end.")
     parser.add_argument("--policy", type=str, default="none", help="Policy mode: none | trace")
     parser.add_argument("--trace-strength", type=float, default=1.0, help="Trace intensity (0 disables trace, 1 default, >1 stronger).")
+    parser.add_argument("--format", choices=("csv", "parquet"), default="csv", help="Telemetry file format (parquet needs pyarrow).")
     args = parser.parse_args()
 
     # Headless is forced for batch runs (low load, no visuals)
     headless = args.headless or (args.runs is not None and args.runs > 0)
 
     if args.runs and args.runs > 0:
-        for i in range(args.runs):
-            seed_i = (args.seed + i) if (args.seed is not None) else None
-            run_sim(
-                VARIANT,
-                seed_i,
+        # runs are independent (own seed, own CSV): spread them over the cores
+        jobs = [
+            (
+                (args.seed + i) if (args.seed is not None) else None,
+                i,
                 float(args.seconds),
-                runs=args.runs,
-                headless=True,
-                summarize=bool(args.summarize),
-                policy_name=str(args.policy),
-                trace_strength=float(args.trace_strength),
+                args.runs,
+                bool(args.summarize),
+                str(args.policy),
+                float(args.trace_strength),
+                str(args.format),
             )
+            for i in range(args.runs)
+        ]
+        if args.runs == 1:
+            _run_one(jobs[0])
+            return
+        # spawn: workers start clean instead of inheriting a forked pygame/SDL state
+        ctx = multiprocessing.get_context("spawn")
+        with ctx.Pool(processes=min(args.runs, os.cpu_count() or 1)) as pool:
+            pool.map(_run_one, jobs)
         return
 
     # Single run (interactive unless headless flag is set)
@@ -948,6 +1175,7 @@ def main() -> None:
         summarize=bool(args.summarize),
         policy_name=str(args.policy),
         trace_strength=float(args.trace_strength),
+        out_format=str(args.format),
     )
 
 
@@ -14,9 +14,11 @@ import os
 import csv
 import random
 import argparse
+import multiprocessing
+from collections import deque
 from datetime import datetime
 from dataclasses import dataclass, field
-from typing import Dict, Optional, List, Tuple, Set
+from typing import Deque, Dict, Optional, List, Tuple
 
 import pygame
 
@@ -41,6 +43,12 @@ VARIANT = "BASE"
 W, H = 980, 560
 FPS = 60
 
+# telemetry rows are handed to csv.writer in batches (~10 s of 4 agents at 60 FPS)
+TELEMETRY_BATCH_ROWS = 2400
+
+# upper bound of the energy-scaled ant trail drawn in draw_world (18 + 90 * energy)
+TRAIL_MAX_LEN = 108
+
 BG = (16, 16, 18)
 TXT = (235, 235, 235)
 SUBTXT = (190, 190, 195)
@@ -60,6 +68,15 @@ AGENT_C_COLOR = (200, 220, 255)  # Kiwi slow
 AGENT_D_COLOR = (255, 255, 200)  # Sparrow
 
 
+# =========================
+# RNG
+# =========================
+# bound methods of the module-level generator: random.seed() still reseeds them
+_random = random.random
+_randint = random.randint
+_uniform = random.uniform
+
+
 # =========================
 # Helpers
 # =========================
@@ -71,12 +88,6 @@ def clamp(x: float, a: float, b: float) -> float:
     return max(a, min(b, x))
 
 
-def safe_normalize(vec: pygame.Vector2) -> pygame.Vector2:
-    if vec.length_squared() <= 1e-9:
-        return pygame.Vector2(0, 0)
-    return vec.normalize()
-
-
 def v2(x: float, y: float) -> pygame.Vector2:
     return pygame.Vector2(float(x), float(y))
 
@@ -94,16 +105,29 @@ def inner_rect(rect: pygame.Rect, margin: int) -> pygame.Rect:
     return r
 
 
-def ensure_telemetry_paths(variant: str) -> str:
+def ensure_telemetry_paths(variant: str, tag: Optional[str] = None) -> str:
+    # tag keeps batch runs started in the same second from sharing a file
     out_dir = os.path.join("telemetry", "runs")
     os.makedirs(out_dir, exist_ok=True)
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-    return os.path.join(out_dir, f"run_{ts}_{variant.lower()}.csv")
+    suffix = f"_{tag}" if tag else ""
+    return os.path.join(out_dir, f"run_{ts}_{variant.lower()}{suffix}.csv")
 
 
 # =========================
 # Data Models
 # =========================
+# column order of Zone.dvec (matches AgentState field order)
+ZONE_DRIVES = ("energy", "load", "coherence", "curiosity")
+
+# fixed score slots (build order); a variant that drops a zone leaves its slot empty
+ZONE_SLOTS = {"Library": 0, "Park": 1, "Transition": 2, "Rest": 3}
+SLOT_LIBRARY, SLOT_PARK, SLOT_TRANSITION, SLOT_REST = 0, 1, 2, 3
+# ant decision scan order: Park first, like the original scores dict, so exact ties still go to Park
+_ANT_SCAN = (SLOT_PARK, SLOT_LIBRARY, SLOT_TRANSITION, SLOT_REST)
+NEG_INF = float("-inf")
+
+
 @dataclass
 class Zone:
     name: str
@@ -113,14 +137,44 @@ class Zone:
     pause_bias: float = 1.0
     commit_bias: float = 1.0
 
+    # cached bounds (zones never move); same half-open test as Rect.collidepoint
+    left: int = field(init=False, repr=False)
+    top: int = field(init=False, repr=False)
+    right: int = field(init=False, repr=False)
+    bottom: int = field(init=False, repr=False)
+
+    # deltas flattened to (energy, load, coherence, curiosity); idx = row in build_zones() order
+    dvec: Tuple[float, float, float, float] = field(init=False, repr=False)
+    idx: int = field(init=False, default=-1)
+    slot: int = field(init=False, default=-1)
+
+    # center is shared, not copied: callers must not mutate it in place
+    _center: pygame.Vector2 = field(init=False, repr=False)
+    # margin -> (inner Rect, left, top, right, bottom); profiles only use a couple of margins
+    _inner: Dict[int, Tuple[pygame.Rect, int, int, int, int]] = field(init=False, repr=False, default_factory=dict)
+
+    def __post_init__(self):
+        self.left, self.top, self.right, self.bottom = self.rect.left, self.rect.top, self.rect.right, self.rect.bottom
+        self.dvec = tuple(self.deltas.get(k, 0.0) for k in ZONE_DRIVES)
+        self.slot = ZONE_SLOTS[self.name]
+        self._center = pygame.Vector2(self.rect.centerx, self.rect.centery)
+
     def contains(self, pos: pygame.Vector2) -> bool:
-        return self.rect.collidepoint(pos.x, pos.y)
+        return self.left <= pos.x < self.right and self.top <= pos.y < self.bottom
 
     def center(self) -> pygame.Vector2:
-        return pygame.Vector2(self.rect.centerx, self.rect.centery)
+        return self._center
+
+    def inner(self, margin: int) -> Tuple[pygame.Rect, int, int, int, int]:
+        cached = self._inner.get(margin)
+        if cached is None:
+            r = inner_rect(self.rect, margin)
+            cached = self._inner[margin] = (r, r.left, r.top, r.right, r.bottom)
+        return cached
 
     def soft_contains(self, pos: pygame.Vector2, margin: int) -> bool:
-        return inner_rect(self.rect, margin).collidepoint(pos.x, pos.y)
+        _, l, t, r, b = self.inner(margin)
+        return l <= pos.x < r and t <= pos.y < b
 
     def near_edge(self, pos: pygame.Vector2, margin: int) -> bool:
         if not self.contains(pos):
@@ -128,7 +182,26 @@ class Zone:
         return not self.soft_contains(pos, margin)
 
 
-@dataclass
+class ZoneList(list):
+    """
+    The zones of one run, plus lookups built once (zones never change mid-run):
+      by_name     -> {name: Zone}
+      by_slot[k]  -> Zone or None
+      slot_mask   -> 0.0 for present slots, -inf for dropped ones (add to raw scores)
+      scan_order  -> slots in zone-list order (first maximum wins, as in a scan over the list)
+    """
+
+    def __init__(self, zones: List[Zone]):
+        super().__init__(zones)
+        self.by_name: Dict[str, Zone] = {z.name: z for z in self}
+        self.by_slot: List[Optional[Zone]] = [None] * len(ZONE_SLOTS)
+        for z in self:
+            self.by_slot[z.slot] = z
+        self.slot_mask = tuple(0.0 if z is not None else NEG_INF for z in self.by_slot)
+        self.scan_order = tuple(z.slot for z in self)
+
+
+@dataclass(slots=True)
 class AgentState:
     energy: float = 0.70
     load: float = 0.20
@@ -136,7 +209,7 @@ class AgentState:
     curiosity: float = 0.70
 
 
-@dataclass
+@dataclass(slots=True)
 class Agent:
     agent_id: str
     profile: MotionProfile
@@ -148,6 +221,7 @@ class Agent:
 
     # --- zone tracking ---
     current_zone: str = "None"
+    current_zone_idx: int = -1  # Zone.idx of current_zone, -1 for "None"
     dwell_ticks: int = 0
     paused: bool = False
 
@@ -163,13 +237,13 @@ class Agent:
     commit_zone: Optional[Zone] = None
     commit_ticks: int = 0
     last_choice: str = "None"
-    trail: List[pygame.Vector2] = field(default_factory=list)
+    trail: Deque[Tuple[float, float]] = field(default_factory=lambda: deque(maxlen=TRAIL_MAX_LEN))
 
     # --- exploration metrics (ants) ---
-    last_zone_for_metrics: str = "None"
+    last_zone_idx_for_metrics: int = -1
     zone_switches: int = 0
     unique_zone_entries: int = 0
-    visited_zones: Set[str] = field(default_factory=set)
+    visited_zone_mask: int = 0  # bit (idx + 1) per visited zone; bit 0 = outside all zones ("None")
 
     # =====================================
     # FISH FIELDS
@@ -187,7 +261,7 @@ class Agent:
 # =========================
 # Zones (variant-safe)
 # =========================
-def build_zones(variant: str) -> List[Zone]:
+def build_zones(variant: str) -> ZoneList:
     lib_d = {"energy": -0.030, "load": +0.020, "coherence": +0.015, "curiosity": +0.020}
     park_d = {"energy": +0.050, "load": -0.020, "coherence": +0.012, "curiosity": -0.005}
     trans_d = {"energy": -0.010, "load": -0.010, "coherence": +0.006, "curiosity": +0.002}
@@ -213,12 +287,16 @@ def build_zones(variant: str) -> List[Zone]:
     if variant == "B1_NO_TRANSITION":
         zones = [z for z in zones if z.name != "Transition"]
 
-    return zones
+    for i, z in enumerate(zones):
+        z.idx = i
+
+    return ZoneList(zones)
 
 
 def zone_at(zones: List[Zone], pos: pygame.Vector2) -> Optional[Zone]:
+    x, y = pos.x, pos.y
     for z in zones:
-        if z.contains(pos):
+        if z.left <= x < z.right and z.top <= y < z.bottom:
             return z
     return None
 
@@ -228,24 +306,30 @@ def pick_point_in_zone(z: Zone, pad: int = 55) -> pygame.Vector2:
     r = z.rect
     max_pad_x = max(2, min(pad, (r.width // 2) - 2))
     max_pad_y = max(2, min(pad, (r.height // 2) - 2))
-    x = random.randint(r.left + max_pad_x, r.right - max_pad_x)
-    y = random.randint(r.top + max_pad_y, r.bottom - max_pad_y)
+    x = _randint(r.left + max_pad_x, r.right - max_pad_x)
+    y = _randint(r.top + max_pad_y, r.bottom - max_pad_y)
     return v2(x, y)
 
 
+def integrate_state(s: AgentState, de: float, dl: float, dc: float, dq: float, k: float):
+    # plain-float core shared by both engines: s.X = clamp01(s.X + dX * k)
+    # (one fused pass, clamp inlined so there is no call per drive)
+    e = s.energy + de * k
+    l = s.load + dl * k
+    c = s.coherence + dc * k
+    q = s.curiosity + dq * k
+    s.energy = 0.0 if e < 0.0 else 1.0 if e > 1.0 else e
+    s.load = 0.0 if l < 0.0 else 1.0 if l > 1.0 else l
+    s.coherence = 0.0 if c < 0.0 else 1.0 if c > 1.0 else c
+    s.curiosity = 0.0 if q < 0.0 else 1.0 if q > 1.0 else q
+
+
 def apply_zone_effects(agent: Agent, z: Optional[Zone], dt: float):
-    s = agent.state
     if z is None:
-        s.energy = clamp01(s.energy + (-0.006) * dt)
-        s.load = clamp01(s.load + (-0.004) * dt)
-        s.coherence = clamp01(s.coherence + (+0.002) * dt)
-        s.curiosity = clamp01(s.curiosity + (+0.001) * dt)
+        integrate_state(agent.state, -0.006, -0.004, +0.002, +0.001, dt)
         return
 
-    s.energy = clamp01(s.energy + z.deltas.get("energy", 0.0) * dt)
-    s.load = clamp01(s.load + z.deltas.get("load", 0.0) * dt)
-    s.coherence = clamp01(s.coherence + z.deltas.get("coherence", 0.0) * dt)
-    s.curiosity = clamp01(s.curiosity + z.deltas.get("curiosity", 0.0) * dt)
+    integrate_state(agent.state, *z.dvec, dt)
 
 
 # =========================
@@ -257,27 +341,32 @@ def dwell_ramp_ant(agent: Agent) -> float:
 
 
 def soft_edge_factor_ant(z: Zone, pos: pygame.Vector2, margin: int) -> float:
-    inner = inner_rect(z.rect, margin)
-    if inner.collidepoint(pos.x, pos.y):
+    _, il, it, ir, ib = z.inner(margin)
+    x, y = pos.x, pos.y
+    if il <= x < ir and it <= y < ib:
         return 1.0
 
     dx = 0.0
-    if pos.x < inner.left:
-        dx = inner.left - pos.x
-    elif pos.x > inner.right:
-        dx = pos.x - inner.right
+    if x < il:
+        dx = il - x
+    elif x > ir:
+        dx = x - ir
 
     dy = 0.0
-    if pos.y < inner.top:
-        dy = inner.top - pos.y
-    elif pos.y > inner.bottom:
-        dy = pos.y - inner.bottom
+    if y < it:
+        dy = it - y
+    elif y > ib:
+        dy = y - ib
 
-    d = math.hypot(dx, dy)
-    if d <= 0:
+    d_sq = dx * dx + dy * dy
+    if d_sq <= 0:
         return 1.0
+    m = max(1.0, float(margin))
+    if d_sq >= m * m:
+        return 0.0  # 1 - d/m <= 0: skip the sqrt
 
-    return max(0.0, min(1.0, 1.0 - (d / max(1.0, float(margin)))))
+    d = math.hypot(dx, dy)
+    return max(0.0, min(1.0, 1.0 - (d / m)))
 
 
 def exposure_factor_ant(z: Zone, pos: pygame.Vector2) -> float:
@@ -286,39 +375,32 @@ def exposure_factor_ant(z: Zone, pos: pygame.Vector2) -> float:
     cx, cy = z.rect.center
     dx = (pos.x - cx) / max(1.0, z.rect.width / 2)
     dy = (pos.y - cy) / max(1.0, z.rect.height / 2)
-    d = math.sqrt(dx * dx + dy * dy)
-    return max(0.35, 1.15 - d)
+    d_sq = dx * dx + dy * dy
+    if d_sq >= 0.64:
+        return 0.35  # 1.15 - d hits the floor once d >= 0.8
+    return max(0.35, 1.15 - math.sqrt(d_sq))
 
 
-def decide_target_zone_ant(agent: Agent, zones: List[Zone]) -> Zone:
+def decide_target_zone_ant(agent: Agent, zones: ZoneList) -> Zone:
     p = agent.profile
-    zmap = {z.name: z for z in zones}
     s = agent.state
+    m_lib, m_park, m_trans, m_rest = zones.slot_mask
 
-    score_park = (1.0 - s.energy) * 1.25 + s.load * 1.20 + (1.0 - s.coherence) * 0.15
-    score_lib = s.curiosity * 1.10 + s.coherence * 0.75 - s.load * 0.30
-    score_trans = (1.0 - s.coherence) * 1.25 + s.load * 0.35
-    score_rest = (1.0 - s.energy) * 0.55 + s.load * 0.85 + (1.0 - s.coherence) * 0.25
-
-    scores: Dict[str, float] = {}
-    if "Park" in zmap:
-        scores["Park"] = score_park
-    if "Library" in zmap:
-        scores["Library"] = score_lib
-    if "Transition" in zmap:
-        scores["Transition"] = score_trans
-    if "Rest" in zmap:
-        scores["Rest"] = score_rest
-
-    best_name = max(scores.keys(), key=lambda k: scores[k])
-    best_score = scores[best_name]
+    # slot order: Library, Park, Transition, Rest
+    scores = (
+        s.curiosity * 1.10 + s.coherence * 0.75 - s.load * 0.30 + m_lib,
+        (1.0 - s.energy) * 1.25 + s.load * 1.20 + (1.0 - s.coherence) * 0.15 + m_park,
+        (1.0 - s.coherence) * 1.25 + s.load * 0.35 + m_trans,
+        (1.0 - s.energy) * 0.55 + s.load * 0.85 + (1.0 - s.coherence) * 0.25 + m_rest,
+    )
+    best = max(_ANT_SCAN, key=scores.__getitem__)
 
-    if agent.last_choice in scores and agent.last_choice in zmap:
-        last_score = scores[agent.last_choice]
-        if best_name != agent.last_choice and (best_score - last_score) < p.hysteresis_eps:
-            best_name = agent.last_choice
+    last = ZONE_SLOTS.get(agent.last_choice, -1)
+    if last >= 0 and last != best and zones.by_slot[last] is not None:
+        if (scores[best] - scores[last]) < p.hysteresis_eps:
+            best = last
 
-    return zmap[best_name]
+    return zones.by_slot[best]
 
 
 def edge_pause_check_ant(agent: Agent, prev_zone: Optional[Zone], now_zone: Optional[Zone]):
@@ -345,7 +427,7 @@ def edge_pause_check_ant(agent: Agent, prev_zone: Optional[Zone], now_zone: Opti
         agent.pause_cooldown_ticks = p.edge_pause_cooldown
 
 
-def update_agent_ant(agent: Agent, zones: List[Zone], dt: float):
+def update_agent_ant(agent: Agent, zones: ZoneList, dt: float):
     p = agent.profile
 
     if agent.pause_hold_ticks > 0:
@@ -355,7 +437,7 @@ def update_agent_ant(agent: Agent, zones: List[Zone], dt: float):
         return
     agent.paused = False
 
-    prev_zone = next((z for z in zones if z.name == agent.current_zone), None) if agent.current_zone != "None" else None
+    prev_zone = zones[agent.current_zone_idx] if agent.current_zone_idx >= 0 else None
     now_zone = zone_at(zones, agent.pos)
     now_name = now_zone.name if now_zone else "None"
 
@@ -363,15 +445,18 @@ def update_agent_ant(agent: Agent, zones: List[Zone], dt: float):
         agent.dwell_ticks += 1
     else:
         agent.current_zone = now_name
+        agent.current_zone_idx = now_zone.idx if now_zone else -1
         agent.dwell_ticks = 0
 
     # --- exploration metrics (ants) ---
-    if agent.current_zone != agent.last_zone_for_metrics:
+    idx = agent.current_zone_idx
+    if idx != agent.last_zone_idx_for_metrics:
         agent.zone_switches += 1
-        if agent.current_zone not in agent.visited_zones:
-            agent.visited_zones.add(agent.current_zone)
+        bit = 1 << (idx + 1)
+        if not agent.visited_zone_mask & bit:
+            agent.visited_zone_mask |= bit
             agent.unique_zone_entries += 1
-        agent.last_zone_for_metrics = agent.current_zone
+        agent.last_zone_idx_for_metrics = idx
 
     # simple exploration score (ant-side)
     agent.output_score = agent.unique_zone_entries * 10 + agent.zone_switches * 2
@@ -383,60 +468,73 @@ def update_agent_ant(agent: Agent, zones: List[Zone], dt: float):
         soft = soft_edge_factor_ant(now_zone, agent.pos, p.soft_edge_margin)
         expo = exposure_factor_ant(now_zone, agent.pos)
         strength = ramp * soft * expo
-        st = agent.state
-        st.energy = clamp01(st.energy + now_zone.deltas.get("energy", 0.0) * strength * dt * 60.0)
-        st.load = clamp01(st.load + now_zone.deltas.get("load", 0.0) * strength * dt * 60.0)
-        st.coherence = clamp01(st.coherence + now_zone.deltas.get("coherence", 0.0) * strength * dt * 60.0)
-        st.curiosity = clamp01(st.curiosity + now_zone.deltas.get("curiosity", 0.0) * strength * dt * 60.0)
+        integrate_state(agent.state, *now_zone.dvec, strength * dt * 60.0)
 
     if agent.commit_ticks <= 0 or agent.commit_zone is None:
         chosen = decide_target_zone_ant(agent, zones)
         agent.last_choice = chosen.name
         agent.commit_zone = chosen
-        agent.commit_ticks = random.randint(p.commit_min, p.commit_max)
+        agent.commit_ticks = _randint(p.commit_min, p.commit_max)
         agent.target = pick_point_in_zone(chosen, pad=55)
     else:
         agent.commit_ticks -= 1
 
     if agent.commit_zone and agent.commit_zone.contains(agent.pos):
-        if random.random() < p.inside_zone_retarget_p:
+        if _random() < p.inside_zone_retarget_p:
             agent.target = pick_point_in_zone(agent.commit_zone, pad=55)
-        if random.random() < p.orbit_impulse_p:
-            agent.target += v2(
-                random.randint(-p.orbit_strength_x, p.orbit_strength_x),
-                random.randint(-p.orbit_strength_y, p.orbit_strength_y),
+        if _random() < p.orbit_impulse_p:
+            # rebind, never += in place: the target may be a zone's shared cached center
+            agent.target = agent.target + v2(
+                _randint(-p.orbit_strength_x, p.orbit_strength_x),
+                _randint(-p.orbit_strength_y, p.orbit_strength_y),
             )
 
-    to_target = agent.target - agent.pos
-    desired = safe_normalize(to_target)
-
-    ang = random.random() * math.tau
-    wander = v2(math.cos(ang), math.sin(ang))
-    desired = safe_normalize(desired + p.wander_mix * wander)
+    # kinematics on plain floats (same arithmetic as a guarded normalize / Vector2.lerp),
+    # written back into pos/vel in place
+    pos, vel = agent.pos, agent.vel
+    px, py = pos.x, pos.y
+    dx, dy = agent.target.x - px, agent.target.y - py
+    l2 = dx * dx + dy * dy
+    if l2 <= 1e-9:
+        dx = dy = 0.0
+    else:
+        n = math.sqrt(l2)
+        dx, dy = dx / n, dy / n
+
+    ang = _random() * math.tau
+    dx += p.wander_mix * math.cos(ang)
+    dy += p.wander_mix * math.sin(ang)
+    l2 = dx * dx + dy * dy
+    if l2 <= 1e-9:
+        dx = dy = 0.0
+    else:
+        n = math.sqrt(l2)
+        dx, dy = dx / n, dy / n
 
     speed = p.base_speed * (0.35 + 1.05 * agent.state.energy)
     speed = max(p.crawl_speed_min, speed)
 
-    steer = desired * speed
-    agent.vel = agent.vel.lerp(steer, p.lerp_alpha)
-    agent.pos += agent.vel * dt
+    a = p.lerp_alpha
+    vx = vel.x * (1 - a) + dx * speed * a
+    vy = vel.y * (1 - a) + dy * speed * a
+    vel.update(vx, vy)
 
-    agent.pos.x = max(20, min(W - 20, agent.pos.x))
-    agent.pos.y = max(20, min(H - 20, agent.pos.y))
+    px += vx * dt
+    py += vy * dt
+    pos.update(max(20, min(W - 20, px)), max(20, min(H - 20, py)))
 
 
 # =========================
 # FISH ENGINE
 # =========================
-def maybe_edge_pause_fish(agent: Agent, z: Optional[Zone]):
+def maybe_edge_pause_fish(agent: Agent, z: Optional[Zone], near: bool):
     p = agent.profile
     if z is None:
         agent.fish_edge_pause_latch = False
         return
 
-    near = z.near_edge(agent.pos, p.soft_edge_margin)
     if near and not agent.fish_edge_pause_latch and agent.fish_pause_cooldown_s <= 0.0:
-        hold = random.uniform(p.fish_pause_min_s, p.fish_pause_max_s) * z.pause_bias
+        hold = _uniform(p.fish_pause_min_s, p.fish_pause_max_s) * z.pause_bias
         agent.fish_pause_hold_s = max(agent.fish_pause_hold_s, hold)
         agent.fish_edge_pause_latch = True
     elif not near:
@@ -477,9 +575,9 @@ def pick_commit_zone_fish(agent: Agent, zones: List[Zone], variant: str) -> Opti
     if not weights:
         return None
 
-    if random.random() < p.fish_commit_p:
+    if _random() < p.fish_commit_p:
         total = sum(weights.values())
-        r = random.random() * total
+        r = _random() * total
         acc = 0.0
         for name, wv in weights.items():
             acc += wv
@@ -488,24 +586,25 @@ def pick_commit_zone_fish(agent: Agent, zones: List[Zone], variant: str) -> Opti
     return None
 
 
-def decide_target_fish(agent: Agent, zones: List[Zone], variant: str) -> pygame.Vector2:
+def decide_target_fish(agent: Agent, zones: ZoneList, variant: str,
+                       current: Optional[Zone], near: bool) -> pygame.Vector2:
+    # current / near: zone_at(agent.pos) and its near_edge result, already computed this tick
     p = agent.profile
     s = agent.state
 
     if agent.fish_commit_ticks_left > 0 and agent.fish_commit_zone is not None:
-        for z in zones:
-            if z.name == agent.fish_commit_zone:
-                return z.center()
+        cz = zones.by_name.get(agent.fish_commit_zone)
+        if cz is not None:
+            return cz.center()
 
     if agent.fish_leaving_lock_ticks > 0:
         return agent.target
 
-    current = zone_at(zones, agent.pos)
     if current is not None and agent.dwell_ticks < p.fish_min_dwell_ticks:
         return current.center()
 
-    scores: Dict[str, float] = {}
-    current_name = current.name if current else "None"
+    scores = [NEG_INF] * len(ZONE_SLOTS)
+    scored = False
 
     for z in zones:
         if variant == "B3_FISH_NO_REST" and z.name == "Rest":
@@ -530,31 +629,28 @@ def decide_target_fish(agent: Agent, zones: List[Zone], variant: str) -> pygame.
             score += 0.25
             score += 0.6 * (1.0 - s.coherence)
 
-        if current is not None and current.name == z.name and current.near_edge(agent.pos, p.soft_edge_margin):
+        if near and current is z:
             score -= 0.35
 
-        score += random.uniform(-0.08, 0.08)
-        scores[z.name] = score
+        score += _uniform(-0.08, 0.08)
+        scores[z.slot] = score
+        scored = True
 
-    if not scores:
+    if not scored:
         return pygame.Vector2(W / 2, H / 2)
 
-    best_name = max(scores, key=scores.get)
+    best = max(zones.scan_order, key=scores.__getitem__)
 
-    if current is not None and best_name != current_name:
-        if not current.near_edge(agent.pos, p.soft_edge_margin):
+    if current is not None and best != current.slot:
+        if not near:
             return current.center()
         else:
             agent.fish_leaving_lock_ticks = p.fish_exit_lock_ticks
 
-    for z in zones:
-        if z.name == best_name:
-            return z.center()
-
-    return pygame.Vector2(W / 2, H / 2)
+    return zones.by_slot[best].center()
 
 
-def update_agent_fish(agent: Agent, zones: List[Zone], dt: float, variant: str):
+def update_agent_fish(agent: Agent, zones: ZoneList, dt: float, variant: str):
     p = agent.profile
 
     agent.fish_pause_cooldown_s = max(0.0, agent.fish_pause_cooldown_s - dt)
@@ -569,7 +665,7 @@ def update_agent_fish(agent: Agent, zones: List[Zone], dt: float, variant: str):
         agent.fish_commit_ticks_left -= 1
         if agent.fish_commit_ticks_left <= 0:
             agent.fish_commit_zone = None
-            agent.fish_commit_cooldown_ticks = random.randint(p.fish_commit_cooldown_min, p.fish_commit_cooldown_max)
+            agent.fish_commit_cooldown_ticks = _randint(p.fish_commit_cooldown_min, p.fish_commit_cooldown_max)
 
     z = zone_at(zones, agent.pos)
     zname = z.name if z else "None"
@@ -581,19 +677,23 @@ def update_agent_fish(agent: Agent, zones: List[Zone], dt: float, variant: str):
             agent.output_score = agent.work_units * agent.state.coherence
     else:
         agent.current_zone = zname
+        agent.current_zone_idx = z.idx if z else -1
         agent.dwell_ticks = 0
 
+    # pos does not move until the kinematics below, so z / near hold for the whole decision phase
+    near = z is not None and z.near_edge(agent.pos, p.soft_edge_margin)
+
     apply_zone_effects(agent, z, dt)
-    maybe_edge_pause_fish(agent, z)
+    maybe_edge_pause_fish(agent, z, near)
 
     if agent.fish_commit_zone is None and agent.fish_commit_ticks_left <= 0:
         cz = pick_commit_zone_fish(agent, zones, variant)
         if cz is not None:
             agent.fish_commit_zone = cz
-            agent.fish_commit_ticks_left = random.randint(p.fish_commit_min, p.fish_commit_max)
+            agent.fish_commit_ticks_left = _randint(p.fish_commit_min, p.fish_commit_max)
 
     if (agent.dwell_ticks % 8 == 0 or agent.target.length_squared() == 0):
-        agent.target = decide_target_fish(agent, zones, variant)
+        agent.target = decide_target_fish(agent, zones, variant, z, near)
 
     if agent.fish_pause_hold_s > 0.0:
         agent.paused = True
@@ -602,13 +702,18 @@ def update_agent_fish(agent: Agent, zones: List[Zone], dt: float, variant: str):
         agent.fish_pause_cooldown_s = max(agent.fish_pause_cooldown_s, 0.10)
 
     if not agent.paused:
-        to = (agent.target - agent.pos)
-        dist = to.length()
-        if dist > 1.0:
-            desired = to.normalize() * p.fish_base_speed
-            t = clamp(dt * p.fish_turn_rate, 0.0, 1.0)
-            agent.vel = agent.vel.lerp(desired, t)
-            agent.pos += agent.vel * dt
+        pos, vel = agent.pos, agent.vel
+        tx, ty = agent.target.x - pos.x, agent.target.y - pos.y
+        dist_sq = tx * tx + ty * ty
+        if dist_sq > 1.0:
+            dist = math.sqrt(dist_sq)
+            speed = p.fish_base_speed
+            t = dt * p.fish_turn_rate
+            t = 0.0 if t < 0.0 else 1.0 if t > 1.0 else t
+            vx = vel.x * (1 - t) + tx / dist * speed * t
+            vy = vel.y * (1 - t) + ty / dist * speed * t
+            vel.update(vx, vy)
+            pos.update(pos.x + vx * dt, pos.y + vy * dt)
         else:
             agent.vel *= 0.85
     else:
@@ -624,7 +729,7 @@ def draw_world(screen: pygame.Surface, zones: List[Zone], agents: List[Agent]):
 
     for z in zones:
         rounded_rect(screen, z.rect, z.color, radius=26, width=0)
-        r_in = inner_rect(z.rect, margin)
+        r_in = z.inner(margin)[0]
         rounded_rect(screen, r_in, (245, 245, 248), radius=20, width=2)
 
     for a in agents:
@@ -638,11 +743,15 @@ def draw_world(screen: pygame.Surface, zones: List[Zone], agents: List[Agent]):
             col = AGENT_D_COLOR
 
         if a.profile.model == "ant":
+            trail = a.trail
             max_len = int(18 + 90 * a.state.energy)
-            if len(a.trail) > max_len:
-                del a.trail[:-max_len]
-            for i in range(1, len(a.trail)):
-                pygame.draw.line(screen, col, a.trail[i - 1], a.trail[i], width=2)
+            while len(trail) > max_len:
+                trail.popleft()
+            prev = None
+            for pt in trail:
+                if prev is not None:
+                    pygame.draw.line(screen, col, prev, pt, width=2)
+                prev = pt
         else:
             streak_len = 22
             dirv = a.vel.normalize() if a.vel.length() > 0.5 else pygame.Vector2(1, 0)
@@ -653,15 +762,23 @@ def draw_world(screen: pygame.Surface, zones: List[Zone], agents: List[Agent]):
         pygame.draw.circle(screen, col, (int(a.pos.x), int(a.pos.y)), 8)
 
 
+# rendered HUD text: header lines never change within a run, agent lines only when their text does
+_HUD_STATIC: Dict[Tuple[pygame.font.Font, str], List[pygame.Surface]] = {}
+_HUD_AGENT_LINES: Dict[Tuple[pygame.font.Font, str], Tuple[str, pygame.Surface]] = {}
+
+
 def draw_hud(screen: pygame.Surface, font: pygame.font.Font, agents: List[Agent], csv_path: str, variant: str):
-    lines = [
-        "SPACE Play/Pause | N Step | O HUD | ESC Quit",
-        f"VARIANT: {variant}   telemetry: {csv_path}",
-        "A=Fantail(FISH)  D=Sparrow(BIRD-profile)  B,C=Kiwi(ANT)",
-    ]
+    header = _HUD_STATIC.get((font, csv_path))
+    if header is None:
+        lines = [
+            "SPACE Play/Pause | N Step | O HUD | ESC Quit",
+            f"VARIANT: {variant}   telemetry: {csv_path}",
+            "A=Fantail(FISH)  D=Sparrow(BIRD-profile)  B,C=Kiwi(ANT)",
+        ]
+        header = _HUD_STATIC[(font, csv_path)] = [font.render(ln, True, TXT) for ln in lines]
     y = 12
-    for ln in lines:
-        screen.blit(font.render(ln, True, TXT), (12, y))
+    for surf in header:
+        screen.blit(surf, (12, y))
         y += 22
 
     for a in agents:
@@ -678,19 +795,24 @@ def draw_hud(screen: pygame.Surface, font: pygame.font.Font, agents: List[Agent]
             f"W:{a.work_units:<5} "
             f"O:{a.output_score:.2f}"
         )
-        screen.blit(font.render(line, True, SUBTXT), (12, y))
+        key = (font, a.agent_id)
+        cached = _HUD_AGENT_LINES.get(key)
+        if cached is None or cached[0] != line:
+            cached = _HUD_AGENT_LINES[key] = (line, font.render(line, True, SUBTXT))
+        screen.blit(cached[1], (12, y))
         y += 20
 
 
 # =========================
 # Main
 # =========================
-def run_sim(variant: str, seed: Optional[int], seconds: float, headless: bool, summarize: bool) -> str:
+def run_sim(variant: str, seed: Optional[int], seconds: float, headless: bool, summarize: bool,
+            tag: Optional[str] = None) -> str:
     if seed is not None:
         random.seed(seed)
 
     zones = build_zones(variant)
-    zmap = {z.name: z for z in zones}
+    zmap = zones.by_name
     any_center = list(zmap.values())[0].center()
 
     # Profiles
@@ -724,17 +846,18 @@ def run_sim(variant: str, seed: Optional[int], seconds: float, headless: bool, s
         if ag.profile.model == "ant":
             start_zone = zmap.get("Library", list(zmap.values())[0])
             ag.commit_zone = start_zone
-            ag.commit_ticks = random.randint(ag.profile.commit_min, ag.profile.commit_max)
+            ag.commit_ticks = _randint(ag.profile.commit_min, ag.profile.commit_max)
             ag.last_choice = ag.commit_zone.name
             ag.target = pick_point_in_zone(ag.commit_zone, pad=55)
-            ag.trail = [ag.pos.copy()]
+            ag.trail.append((ag.pos.x, ag.pos.y))
 
     # Telemetry
-    csv_path = ensure_telemetry_paths(variant)
+    csv_path = ensure_telemetry_paths(variant, tag)
     os.makedirs(os.path.dirname(csv_path), exist_ok=True)
 
-    f = open(csv_path, "w", newline="", encoding="utf-8")
+    f = open(csv_path, "w", newline="", encoding="utf-8", buffering=1 << 20)
     w = csv.writer(f)
+    rows: List[list] = []
     w.writerow([
         "t_sec","dt","agent_id",
         "x","y","vx","vy","speed",
@@ -799,7 +922,7 @@ def run_sim(variant: str, seed: Optional[int], seconds: float, headless: bool, s
                     else:
                         update_agent_ant(ag, zones, dt)
                         if (ag.pos - before).length() >= ag.profile.trail_move_eps:
-                            ag.trail.append(ag.pos.copy())
+                            ag.trail.append((ag.pos.x, ag.pos.y))
 
                     s = ag.state
                     speed = ag.vel.length()
@@ -811,7 +934,7 @@ def run_sim(variant: str, seed: Optional[int], seconds: float, headless: bool, s
                         commit_zone = ag.commit_zone.name if ag.commit_zone else "-"
                         commit_left = ag.commit_ticks
 
-                    w.writerow([
+                    rows.append([
                         round(t_sec, 4), round(dt, 4), ag.agent_id,
                         round(ag.pos.x, 2), round(ag.pos.y, 2),
                         round(ag.vel.x, 2), round(ag.vel.y, 2),
@@ -823,6 +946,10 @@ def run_sim(variant: str, seed: Optional[int], seconds: float, headless: bool, s
 
                 step_once = False
 
+                if len(rows) >= TELEMETRY_BATCH_ROWS:
+                    w.writerows(rows)
+                    rows.clear()
+
             # headless auto-stop
             if headless and t_sec >= seconds:
                 running = False
@@ -835,6 +962,8 @@ def run_sim(variant: str, seed: Optional[int], seconds: float, headless: bool, s
                 pygame.display.flip()
 
     finally:
+        if rows:
+            w.writerows(rows)
         f.close()
         if not headless:
             pygame.quit()
@@ -849,6 +978,23 @@ def run_sim(variant: str, seed: Optional[int], seconds: float, headless: bool, s
     return csv_path
 
 
+def run_one(variant: str, seed: Optional[int], seconds: float, summarize: bool, tag: str) -> str:
+    # top-level (picklable) headless run for the batch pool
+    return run_sim(variant, seed, seconds, headless=True, summarize=summarize, tag=tag)
+
+
+def run_batch(variant: str, runs: int, seed: Optional[int], seconds: float, summarize: bool) -> List[str]:
+    # runs share no state, so they spread over processes; each writes its own CSV
+    jobs = [
+        (variant, (seed + i) if seed is not None else None, seconds, summarize, f"{i:03d}")
+        for i in range(runs)
+    ]
+    if runs == 1:
+        return [run_one(*jobs[0])]
+    with multiprocessing.Pool(min(runs, os.cpu_count() or 1)) as pool:
+        return pool.starmap(run_one, jobs)
+
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--runs", type=int, default=0, help="Number of headless runs to execute (batch mode).")
@@ -862,10 +1008,8 @@ def main():
     HEADLESS = args.headless or (args.runs is not None and args.runs > 0)
 
     if args.runs and args.runs > 0:
-        # Batch mode: multiple headless runs
-        for i in range(args.runs):
-            seed_i = (args.seed + i) if (args.seed is not None) else None
-            run_sim(VARIANT, seed_i, args.seconds, headless=True, summarize=args.summarize)
+        # Batch mode: multiple headless runs (one process per core)
+        run_batch(VARIANT, args.runs, args.seed, args.seconds, args.summarize)
         return
 
     # Interactive mode (visual)
@@ -10,9 +10,10 @@ import os
 import csv
 import math
 import random
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, Optional, List, Tuple
+from typing import Deque, Dict, Optional, List, Tuple
 
 import pygame
 
@@ -54,11 +55,14 @@ DWELL_RAMP_RATE = 1 / 240.0
 BASE_SPEED = 95.0
 CRAWL_SPEED_MIN = 32.0          # <— keeps it moving even at low energy
 TRAIL_MOVE_EPS = 2.5            # <— only add trail point if moved this many pixels since last
+TRAIL_MOVE_EPS_SQ = TRAIL_MOVE_EPS * TRAIL_MOVE_EPS
+TRAIL_MAX_LEN = 108             # longest energy-scaled trail (18 + 90 * energy)
 DT_CLAMP = 0.045
 
 # Telemetry toggles
 TELEMETRY_ENABLED = True
 TELEMETRY_LOG_EVERY_N_TICKS = 1     # set to 5/10 if you want smaller files
+TELEMETRY_BUF_ROWS = 1024           # rows held in memory between writerows() calls
 
 
 # =========================================================
@@ -71,6 +75,7 @@ class TelemetryLogger:
         self.fp = None
         self.writer = None
         self.path = None
+        self._row_buf: List[list] = []
 
         if not self.enabled:
             return
@@ -79,7 +84,7 @@ class TelemetryLogger:
         ts = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.path = os.path.join(self.base_dir, f"run_{ts}.csv")
 
-        self.fp = open(self.path, "w", newline="", encoding="utf-8")
+        self.fp = open(self.path, "w", newline="", encoding="utf-8", buffering=1 << 20)
         self.writer = csv.writer(self.fp)
         self.writer.writerow([
             "tick",
@@ -114,35 +119,41 @@ class TelemetryLogger:
         spd = math.hypot(vx, vy)
         cz = agent.commit_zone.name if agent.commit_zone else ""
 
-        self.writer.writerow([
+        # precision is fixed by the format specs (no round() + float repr per column)
+        self._row_buf.append([
             tick,
-            round(t_sec, 4),
+            f"{t_sec:.4f}",
             agent.current_zone,
             cz,
             int(agent.commit_ticks),
             int(agent.dwell_ticks),
             int(agent.pause_hold),
             int(agent.pause_cooldown),
-            round(agent.state.energy, 5),
-            round(agent.state.load, 5),
-            round(agent.state.coherence, 5),
-            round(agent.state.curiosity, 5),
-            round(float(agent.pos.x), 3),
-            round(float(agent.pos.y), 3),
-            round(vx, 5),
-            round(vy, 5),
-            round(spd, 5),
-            round(float(agent.target.x), 3),
-            round(float(agent.target.y), 3),
+            f"{agent.state.energy:.5f}",
+            f"{agent.state.load:.5f}",
+            f"{agent.state.coherence:.5f}",
+            f"{agent.state.curiosity:.5f}",
+            f"{agent.pos.x:.3f}",
+            f"{agent.pos.y:.3f}",
+            f"{vx:.5f}",
+            f"{vy:.5f}",
+            f"{spd:.5f}",
+            f"{agent.target.x:.3f}",
+            f"{agent.target.y:.3f}",
         ])
 
-        # keep it reliable on Windows
-        if tick % 60 == 0:
-            self.fp.flush()
+        if len(self._row_buf) >= TELEMETRY_BUF_ROWS:
+            self._flush_rows()
+
+    def _flush_rows(self):
+        if self._row_buf and self.writer is not None:
+            self.writer.writerows(self._row_buf)
+        self._row_buf.clear()
 
     def close(self):
         if self.fp:
             try:
+                self._flush_rows()
                 self.fp.flush()
             except Exception:
                 pass
@@ -158,9 +169,13 @@ def clamp01(x: float) -> float:
     return 0.0 if x < 0.0 else 1.0 if x > 1.0 else x
 
 
+# shared zero result of safe_normalize (callers only read it)
+_ZERO = pygame.Vector2()
+
+
 def safe_normalize(vec: pygame.Vector2) -> pygame.Vector2:
     if vec.length_squared() <= 1e-9:
-        return pygame.Vector2(0, 0)
+        return _ZERO
     return vec.normalize()
 
 
@@ -168,6 +183,21 @@ def v2(x: float, y: float) -> pygame.Vector2:
     return pygame.Vector2(float(x), float(y))
 
 
+# rendered text memo for the HUD: (font, text, color) -> Surface; cleared when it fills up
+_TEXT_CACHE: Dict[Tuple[pygame.font.Font, str, Tuple[int, int, int]], pygame.Surface] = {}
+_TEXT_CACHE_MAX = 256
+
+
+def render_text(font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    key = (font, text, color)
+    surf = _TEXT_CACHE.get(key)
+    if surf is None:
+        if len(_TEXT_CACHE) >= _TEXT_CACHE_MAX:
+            _TEXT_CACHE.clear()
+        surf = _TEXT_CACHE[key] = font.render(text, True, color)
+    return surf
+
+
 def rounded_rect(surface: pygame.Surface, rect: pygame.Rect, color: Tuple[int, int, int], radius: int, width: int = 0):
     pygame.draw.rect(surface, color, rect, width=width, border_radius=radius)
 
@@ -181,12 +211,18 @@ def inner_rect(rect: pygame.Rect, margin: int) -> pygame.Rect:
     return r
 
 
-@dataclass
+@dataclass(slots=True)
 class Zone:
     name: str
     rect: pygame.Rect
     deltas: Dict[str, float]
     color: Tuple[int, int, int]
+    # deltas as (energy, load, coherence, curiosity), built once
+    dvec: Tuple[float, float, float, float] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        d = self.deltas
+        self.dvec = (d.get("energy", 0.0), d.get("load", 0.0), d.get("coherence", 0.0), d.get("curiosity", 0.0))
 
     def contains(self, pos: pygame.Vector2) -> bool:
         return self.rect.collidepoint(pos.x, pos.y)
@@ -195,7 +231,7 @@ class Zone:
         return inner_rect(self.rect, margin).collidepoint(pos.x, pos.y)
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentState:
     energy: float = 0.70
     load: float = 0.20
@@ -203,7 +239,7 @@ class AgentState:
     curiosity: float = 0.70
 
 
-@dataclass
+@dataclass(slots=True)
 class Agent:
     pos: pygame.Vector2
     vel: pygame.Vector2
@@ -303,35 +339,40 @@ def exposure_factor(z: Zone, pos: pygame.Vector2) -> float:
     return max(0.35, 1.15 - d)
 
 
-def decide_target_zone(agent: Agent, zones: List[Zone]) -> Zone:
-    zmap = {z.name: z for z in zones}
-    park = zmap["Park"]
-    lib = zmap["Library"]
-    trans = zmap["Transition"]
-    rest = zmap["Rest"]
+# score slots; this order is also the tie-break order (first max wins)
+ZONE_IDX = {"Park": 0, "Library": 1, "Transition": 2, "Rest": 3}
 
-    s = agent.state
-    score_park = (1.0 - s.energy) * 1.25 + s.load * 1.20 + (1.0 - s.coherence) * 0.15
-    score_lib = s.curiosity * 1.10 + s.coherence * 0.75 - s.load * 0.30
-    score_trans = (1.0 - s.coherence) * 1.25 + s.load * 0.35
-    score_rest = (1.0 - s.energy) * 0.55 + s.load * 0.85 + (1.0 - s.coherence) * 0.25
+# (zones, zones by score slot) of the last resolved slot table; zones never change within a run
+_zone_slots: Optional[Tuple[List[Zone], Tuple[Zone, ...]]] = None
+
+
+def zone_slots(zones: List[Zone]) -> Tuple[Zone, ...]:
+    global _zone_slots
+    if _zone_slots is None or _zone_slots[0] is not zones:
+        by_name = {z.name: z for z in zones}
+        _zone_slots = (zones, tuple(by_name[name] for name in ZONE_IDX))
+    return _zone_slots[1]
 
-    scores = {
-        "Park": score_park,
-        "Library": score_lib,
-        "Transition": score_trans,
-        "Rest": score_rest,
-    }
 
-    best_name = max(scores.keys(), key=lambda k: scores[k])
-    best_score = scores[best_name]
+def decide_target_zone(agent: Agent, zones: List[Zone]) -> Zone:
+    s = agent.state
+    scores = (
+        (1.0 - s.energy) * 1.25 + s.load * 1.20 + (1.0 - s.coherence) * 0.15,  # Park
+        s.curiosity * 1.10 + s.coherence * 0.75 - s.load * 0.30,               # Library
+        (1.0 - s.coherence) * 1.25 + s.load * 0.35,                           # Transition
+        (1.0 - s.energy) * 0.55 + s.load * 0.85 + (1.0 - s.coherence) * 0.25,  # Rest
+    )
+
+    best = 0
+    for i in (1, 2, 3):
+        if scores[i] > scores[best]:
+            best = i
 
-    if agent.last_choice in scores and agent.last_choice in zmap:
-        last_score = scores[agent.last_choice]
-        if best_name != agent.last_choice and (best_score - last_score) < HYSTERESIS_EPS:
-            best_name = agent.last_choice
+    last = ZONE_IDX.get(agent.last_choice, -1)
+    if last >= 0 and last != best and (scores[best] - scores[last]) < HYSTERESIS_EPS:
+        best = last
 
-    return zmap.get(best_name, trans)
+    return zone_slots(zones)[best]
 
 
 def edge_pause_check(agent: Agent, prev_zone: Optional[Zone], now_zone: Optional[Zone]):
@@ -381,11 +422,18 @@ def update_agent(agent: Agent, zones: List[Zone], dt: float):
         expo = exposure_factor(now_zone, agent.pos)
         strength = ramp * soft * expo
 
+        k = strength * dt * 60.0
+        de, dl, dc, dq = now_zone.dvec
         st = agent.state
-        st.energy = clamp01(st.energy + now_zone.deltas.get("energy", 0.0) * strength * dt * 60.0)
-        st.load = clamp01(st.load + now_zone.deltas.get("load", 0.0) * strength * dt * 60.0)
-        st.coherence = clamp01(st.coherence + now_zone.deltas.get("coherence", 0.0) * strength * dt * 60.0)
-        st.curiosity = clamp01(st.curiosity + now_zone.deltas.get("curiosity", 0.0) * strength * dt * 60.0)
+        # clamp01 inlined
+        e = st.energy + de * k
+        l = st.load + dl * k
+        c = st.coherence + dc * k
+        q = st.curiosity + dq * k
+        st.energy = 0.0 if e < 0.0 else 1.0 if e > 1.0 else e
+        st.load = 0.0 if l < 0.0 else 1.0 if l > 1.0 else l
+        st.coherence = 0.0 if c < 0.0 else 1.0 if c > 1.0 else c
+        st.curiosity = 0.0 if q < 0.0 else 1.0 if q > 1.0 else q
 
     # Commit
     if agent.commit_ticks <= 0 or agent.commit_zone is None:
@@ -443,29 +491,39 @@ def draw_hud(screen: pygame.Surface, font: pygame.font.Font, agent: Agent, hud_o
     y = 12
     for i, t in enumerate(lines):
         col = TXT if i < 2 else SUBTXT
-        surf = font.render(t, True, col)
+        surf = render_text(font, t, col)
         screen.blit(surf, (12, y))
         y += 22
 
 
-def draw_world(screen: pygame.Surface, zones: List[Zone], agent: Agent, trail: List[pygame.Vector2]):
-    screen.fill(BG)
+# (zones, surface) of the static background; zones never change after build_zones()
+_world_bg: Optional[Tuple[List[Zone], pygame.Surface]] = None
+
 
+def _build_world_background(zones: List[Zone]) -> pygame.Surface:
+    bg = pygame.Surface((W, H)).convert()
+    bg.fill(BG)
     for z in zones:
-        rounded_rect(screen, z.rect, z.color, radius=26, width=0)
+        rounded_rect(bg, z.rect, z.color, radius=26, width=0)
         r_in = inner_rect(z.rect, SOFT_EDGE_MARGIN)
-        rounded_rect(screen, r_in, (245, 245, 248), radius=20, width=2)
+        rounded_rect(bg, r_in, (245, 245, 248), radius=20, width=2)
+    return bg
+
+
+def draw_world(screen: pygame.Surface, zones: List[Zone], agent: Agent, trail: Deque[Tuple[float, float]]):
+    global _world_bg
+    if _world_bg is None or _world_bg[0] is not zones:
+        _world_bg = (zones, _build_world_background(zones))
+    screen.blit(_world_bg[1], (0, 0))
 
     # trail length scales with energy
     max_len = int(18 + 90 * agent.state.energy)
-    if len(trail) > max_len:
-        del trail[:-max_len]
+    while len(trail) > max_len:
+        trail.popleft()
 
     # draw trail first
-    for i in range(1, len(trail)):
-        a = trail[i - 1]
-        b = trail[i]
-        pygame.draw.line(screen, (175, 255, 220), a, b, width=2)
+    if len(trail) >= 2:
+        pygame.draw.lines(screen, (175, 255, 220), False, trail, width=2)
 
     # agent
     pygame.draw.circle(screen, AGENT_COLOR, (int(agent.pos.x), int(agent.pos.y)), 8)
@@ -500,7 +558,7 @@ def main():
     sim_running = True
     step_once = False
 
-    trail: List[pygame.Vector2] = [agent.pos.copy()]
+    trail: Deque[Tuple[float, float]] = deque([(agent.pos.x, agent.pos.y)], maxlen=TRAIL_MAX_LEN)
 
     # Telemetry init
     telemetry = TelemetryLogger(enabled=TELEMETRY_ENABLED)
@@ -535,8 +593,8 @@ def main():
                 update_agent(agent, zones, dt)
 
                 # only add to trail if moved enough (prevents smear / "front tail")
-                if (agent.pos - before).length() >= TRAIL_MOVE_EPS:
-                    trail.append(agent.pos.copy())
+                if agent.pos.distance_squared_to(before) >= TRAIL_MOVE_EPS_SQ:
+                    trail.append((agent.pos.x, agent.pos.y))
 
                 step_once = False
 
@@ -3,10 +3,14 @@
 
 import math
 import os
+import queue
 import random
+import struct
+import threading
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, Optional, List, Tuple
+from typing import Any, Callable, Deque, Dict, Optional, List, Tuple
 
 import pygame
 
@@ -26,9 +30,23 @@ COLOR_REST = (205, 195, 160)
 
 AGENT_COLOR = (210, 255, 230)
 
+TRAIL_MAX_LEN = 108  # longest energy-scaled trail (18 + 90 * energy)
 
-def clamp01(x: float) -> float:
-    return 0.0 if x < 0.0 else 1.0 if x > 1.0 else x
+# tick-random update: each tick an agent gets the full update with this probability,
+# otherwise it just coasts on its velocity (1.0 = full update every tick)
+UPDATE_P = 1.0
+
+# RNG bound to the module-level generator, so random.seed() still drives them
+_random = random.random
+_randint = random.randint
+_getrandbits = random.getrandbits
+
+# unit wander directions, sampled with _getrandbits(WANDER_BITS)
+WANDER_BITS = 12
+_WANDER: Tuple[Tuple[float, float], ...] = tuple(
+    (math.cos(a), math.sin(a))
+    for a in (i * math.tau / (1 << WANDER_BITS) for i in range(1 << WANDER_BITS))
+)
 
 
 def safe_normalize(vec: pygame.Vector2) -> pygame.Vector2:
@@ -60,12 +78,43 @@ class Zone:
     rect: pygame.Rect
     deltas: Dict[str, float]
     color: Tuple[int, int, int]
+    # flat bounds, cached once (zones never move); tests are half-open like Rect.collidepoint
+    left: int = field(init=False, repr=False)
+    top: int = field(init=False, repr=False)
+    right: int = field(init=False, repr=False)
+    bottom: int = field(init=False, repr=False)
+    # center + half extents (floored at 1) for exposure_factor
+    cx: int = field(init=False, repr=False)
+    cy: int = field(init=False, repr=False)
+    hx: float = field(init=False, repr=False)
+    hy: float = field(init=False, repr=False)
+    # margin -> (inner Rect, left, top, right, bottom)
+    _inner: Dict[int, Tuple[pygame.Rect, int, int, int, int]] = field(init=False, repr=False, default_factory=dict)
+    # deltas as (energy, load, coherence, curiosity), built once
+    dvec: Tuple[float, float, float, float] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        r = self.rect
+        self.left, self.top, self.right, self.bottom = r.left, r.top, r.right, r.bottom
+        self.cx, self.cy = r.center
+        self.hx = max(1.0, r.width / 2)
+        self.hy = max(1.0, r.height / 2)
+        d = self.deltas
+        self.dvec = (d.get("energy", 0.0), d.get("load", 0.0), d.get("coherence", 0.0), d.get("curiosity", 0.0))
 
     def contains(self, pos: pygame.Vector2) -> bool:
-        return self.rect.collidepoint(pos.x, pos.y)
+        return self.left <= pos.x < self.right and self.top <= pos.y < self.bottom
+
+    def inner(self, margin: int) -> Tuple[pygame.Rect, int, int, int, int]:
+        cached = self._inner.get(margin)
+        if cached is None:
+            r = inner_rect(self.rect, margin)
+            cached = self._inner[margin] = (r, r.left, r.top, r.right, r.bottom)
+        return cached
 
     def soft_contains(self, pos: pygame.Vector2, margin: int) -> bool:
-        return inner_rect(self.rect, margin).collidepoint(pos.x, pos.y)
+        _, l, t, r, b = self.inner(margin)
+        return l <= pos.x < r and t <= pos.y < b
 
 
 @dataclass
@@ -84,6 +133,7 @@ class Agent:
     state: AgentState = field(default_factory=AgentState)
 
     current_zone: str = "None"
+    current_zone_idx: int = -1  # ZONE_IDX slot of current_zone, -1 = outside every zone
     dwell_ticks: int = 0
 
     pause_hold: int = 0
@@ -92,7 +142,7 @@ class Agent:
     commit_zone: Optional[Zone] = None
     commit_ticks: int = 0
 
-    last_choice: str = "None"
+    last_choice_idx: int = -1  # ZONE_IDX slot of the last chosen zone, -1 = none yet
 
 
 def build_zones() -> List[Zone]:
@@ -123,83 +173,87 @@ def build_zones() -> List[Zone]:
     return [library, park, transition, rest]
 
 
+# score slots; this order is also the tie-break order (first max wins)
+ZONE_IDX = {"Park": 0, "Library": 1, "Transition": 2, "Rest": 3}
+
+
+@dataclass
+class World:
+    # zone lookups built once per run instead of per tick
+    zones: List[Zone]
+    by_name: Dict[str, Zone]
+    by_idx: Tuple[Zone, ...]  # ZONE_IDX slot order
+    name_to_idx: Dict[str, int]
+
+
+def build_world(zones: List[Zone]) -> World:
+    by_name = {z.name: z for z in zones}
+    return World(
+        zones=zones,
+        by_name=by_name,
+        by_idx=tuple(by_name[name] for name in ZONE_IDX),
+        name_to_idx=dict(ZONE_IDX),
+    )
+
+
 def zone_at(zones: List[Zone], pos: pygame.Vector2) -> Optional[Zone]:
+    x, y = pos.x, pos.y
     for z in zones:
-        if z.contains(pos):
+        if z.left <= x < z.right and z.top <= y < z.bottom:
             return z
     return None
 
 
 def pick_point_in_zone(z: Zone, pad: int = 45) -> pygame.Vector2:
     r = z.rect
-    x = random.randint(r.left + pad, r.right - pad)
-    y = random.randint(r.top + pad, r.bottom - pad)
+    x = _randint(r.left + pad, r.right - pad)
+    y = _randint(r.top + pad, r.bottom - pad)
     return v2(x, y)
 
 
-def dwell_ramp(agent: Agent, p: MotionProfile) -> float:
-    return min(p.dwell_ramp_cap, 1.0 + agent.dwell_ticks * p.dwell_ramp_rate)
+# the two factors below take plain float coords (no Vector2 in/out)
+def soft_edge_factor(z: Zone, x: float, y: float, margin: int) -> float:
+    _, left, top, right, bottom = z.inner(margin)
 
-
-def soft_edge_factor(z: Zone, pos: pygame.Vector2, margin: int) -> float:
-    inner = inner_rect(z.rect, margin)
-    if inner.collidepoint(pos.x, pos.y):
+    # distance outside the inner rect per axis (0 when inside on that axis)
+    dx = left - x if x < left else x - right if x > right else 0.0
+    dy = top - y if y < top else y - bottom if y > bottom else 0.0
+    if dx == 0.0 and dy == 0.0:
         return 1.0
 
-    dx = 0.0
-    if pos.x < inner.left:
-        dx = inner.left - pos.x
-    elif pos.x > inner.right:
-        dx = pos.x - inner.right
-
-    dy = 0.0
-    if pos.y < inner.top:
-        dy = inner.top - pos.y
-    elif pos.y > inner.bottom:
-        dy = pos.y - inner.bottom
-
     d = math.hypot(dx, dy)
-    if d <= 0:
-        return 1.0
-
     t = max(0.0, min(1.0, 1.0 - (d / max(1.0, float(margin)))))
     return t
 
 
-def exposure_factor(z: Zone, pos: pygame.Vector2) -> float:
+def exposure_factor(z: Zone, x: float, y: float) -> float:
     if z.name not in ("Transition", "Rest"):
         return 1.0
-    cx, cy = z.rect.center
-    dx = (pos.x - cx) / max(1.0, z.rect.width / 2)
-    dy = (pos.y - cy) / max(1.0, z.rect.height / 2)
+    dx = (x - z.cx) / z.hx
+    dy = (y - z.cy) / z.hy
     d = math.sqrt(dx * dx + dy * dy)
     return max(0.35, 1.15 - d)
 
 
-def decide_target_zone(agent: Agent, zones: List[Zone], p: MotionProfile) -> Zone:
-    zmap = {z.name: z for z in zones}
-    park = zmap["Park"]
-    lib = zmap["Library"]
-    trans = zmap["Transition"]
-    rest = zmap["Rest"]
-
+def decide_target_zone(agent: Agent, world: World, p: MotionProfile) -> Zone:
     s = agent.state
-    score_park = (1.0 - s.energy) * 1.25 + s.load * 1.20 + (1.0 - s.coherence) * 0.15
-    score_lib = s.curiosity * 1.10 + s.coherence * 0.75 - s.load * 0.30
-    score_trans = (1.0 - s.coherence) * 1.25 + s.load * 0.35
-    score_rest = (1.0 - s.energy) * 0.55 + s.load * 0.85 + (1.0 - s.coherence) * 0.25
-
-    scores = {"Park": score_park, "Library": score_lib, "Transition": score_trans, "Rest": score_rest}
+    scores = (
+        (1.0 - s.energy) * 1.25 + s.load * 1.20 + (1.0 - s.coherence) * 0.15,  # Park
+        s.curiosity * 1.10 + s.coherence * 0.75 - s.load * 0.30,               # Library
+        (1.0 - s.coherence) * 1.25 + s.load * 0.35,                           # Transition
+        (1.0 - s.energy) * 0.55 + s.load * 0.85 + (1.0 - s.coherence) * 0.25,  # Rest
+    )
 
-    best_name = max(scores.keys(), key=lambda k: scores[k])
-    best_score = scores[best_name]
+    best = 0
+    for i in (1, 2, 3):
+        if scores[i] > scores[best]:
+            best = i
 
-    if agent.last_choice in scores and agent.last_choice in zmap:
-        last_score = scores[agent.last_choice]
-        if best_name != agent.last_choice and (best_score - last_score) < p.hysteresis_eps:
-            best_name = agent.last_choice
+    last = agent.last_choice_idx
+    if last >= 0 and last != best and (scores[best] - scores[last]) < p.hysteresis_eps:
+        best = last
 
-    return zmap.get(best_name, trans)
+    return world.by_idx[best]
 
 
 def edge_pause_check(agent: Agent, prev_zone: Optional[Zone], now_zone: Optional[Zone], p: MotionProfile):
@@ -225,70 +279,132 @@ def edge_pause_check(agent: Agent, prev_zone: Optional[Zone], now_zone: Optional
         agent.pause_cooldown = p.edge_pause_cooldown
 
 
-def update_agent(agent: Agent, zones: List[Zone], dt: float, p: MotionProfile):
+def make_steer(p: MotionProfile) -> Callable[[Agent, float], None]:
+    # profile constants bound once as closure cells instead of attribute reads per tick
+    wander_mix = p.wander_mix
+    base_speed = p.base_speed
+    crawl_speed_min = p.crawl_speed_min
+
+    def steer(agent: Agent, dt: float):
+        # steering + integration on plain floats (same arithmetic as safe_normalize /
+        # Vector2.lerp), written back into pos/vel in place: no temporary Vector2s per tick
+        pos, vel = agent.pos, agent.vel
+        px, py = pos.x, pos.y
+        dx, dy = agent.target.x - px, agent.target.y - py
+        l2 = dx * dx + dy * dy
+        if l2 <= 1e-9:
+            dx = dy = 0.0
+        else:
+            n = math.sqrt(l2)
+            dx, dy = dx / n, dy / n
+
+        wx, wy = _WANDER[_getrandbits(WANDER_BITS)]
+        dx += wander_mix * wx
+        dy += wander_mix * wy
+        l2 = dx * dx + dy * dy
+        if l2 <= 1e-9:
+            dx = dy = 0.0
+        else:
+            n = math.sqrt(l2)
+            dx, dy = dx / n, dy / n
+
+        # speed with crawl minimum
+        speed = base_speed * (0.35 + 1.05 * agent.state.energy)
+        speed = max(crawl_speed_min, speed)
+
+        vx = vel.x * (1 - 0.08) + dx * speed * 0.08
+        vy = vel.y * (1 - 0.08) + dy * speed * 0.08
+        vel.update(vx, vy)
+
+        px += vx * dt
+        py += vy * dt
+        pos.update(max(20, min(W - 20, px)), max(20, min(H - 20, py)))
+
+    return steer
+
+
+# (profile, steer) for the active profile; rebuilt only when the profile switches
+_steer_cache: Optional[Tuple[MotionProfile, Callable[[Agent, float], None]]] = None
+
+
+def steer_for(p: MotionProfile) -> Callable[[Agent, float], None]:
+    global _steer_cache
+    if _steer_cache is None or _steer_cache[0] is not p:
+        _steer_cache = (p, make_steer(p))
+    return _steer_cache[1]
+
+
+def coast_agent(agent: Agent, dt: float):
+    # skipped tick: keep velocity, integrate + bounds only; dwell still counts
+    agent.dwell_ticks += 1
+    pos, vel = agent.pos, agent.vel
+    px = pos.x + vel.x * dt
+    py = pos.y + vel.y * dt
+    pos.update(max(20, min(W - 20, px)), max(20, min(H - 20, py)))
+
+
+def update_agent(agent: Agent, world: World, dt: float, p: MotionProfile) -> bool:
+    # returns False on edge-pause ticks, where the position is left untouched
     if agent.pause_hold > 0:
         agent.pause_hold -= 1
         agent.vel *= 0.88
-        return
+        return False
+
+    # agent.pos is only ever updated in place, so one local serves the whole tick
+    pos = agent.pos
 
-    prev_zone = next((z for z in zones if z.name == agent.current_zone), None) if agent.current_zone != "None" else None
-    now_zone = zone_at(zones, agent.pos)
+    prev_zone = world.by_idx[agent.current_zone_idx] if agent.current_zone_idx >= 0 else None
+    now_zone = zone_at(world.zones, pos)
     now_name = now_zone.name if now_zone else "None"
 
     if now_name == agent.current_zone:
         agent.dwell_ticks += 1
     else:
         agent.current_zone = now_name
+        agent.current_zone_idx = world.name_to_idx[now_name] if now_zone else -1
         agent.dwell_ticks = 0
 
     edge_pause_check(agent, prev_zone, now_zone, p)
 
     if now_zone:
-        ramp = dwell_ramp(agent, p)
-        soft = soft_edge_factor(now_zone, agent.pos, p.soft_edge_margin)
-        expo = exposure_factor(now_zone, agent.pos)
+        ramp = min(p.dwell_ramp_cap, 1.0 + agent.dwell_ticks * p.dwell_ramp_rate)  # dwell ramp, capped
+        px, py = pos.x, pos.y
+        soft = soft_edge_factor(now_zone, px, py, p.soft_edge_margin)
+        expo = exposure_factor(now_zone, px, py)
         strength = ramp * soft * expo
 
+        k = strength * dt * 60.0
+        de, dl, dc, dq = now_zone.dvec
         st = agent.state
-        st.energy = clamp01(st.energy + now_zone.deltas.get("energy", 0.0) * strength * dt * 60.0)
-        st.load = clamp01(st.load + now_zone.deltas.get("load", 0.0) * strength * dt * 60.0)
-        st.coherence = clamp01(st.coherence + now_zone.deltas.get("coherence", 0.0) * strength * dt * 60.0)
-        st.curiosity = clamp01(st.curiosity + now_zone.deltas.get("curiosity", 0.0) * strength * dt * 60.0)
+        # clamp to [0, 1] inlined
+        e = st.energy + de * k
+        l = st.load + dl * k
+        c = st.coherence + dc * k
+        q = st.curiosity + dq * k
+        st.energy = 0.0 if e < 0.0 else 1.0 if e > 1.0 else e
+        st.load = 0.0 if l < 0.0 else 1.0 if l > 1.0 else l
+        st.coherence = 0.0 if c < 0.0 else 1.0 if c > 1.0 else c
+        st.curiosity = 0.0 if q < 0.0 else 1.0 if q > 1.0 else q
 
     # Commit
     if agent.commit_ticks <= 0 or agent.commit_zone is None:
-        chosen = decide_target_zone(agent, zones, p)
-        agent.last_choice = chosen.name
+        chosen = decide_target_zone(agent, world, p)
+        agent.last_choice_idx = world.name_to_idx[chosen.name]
         agent.commit_zone = chosen
-        agent.commit_ticks = random.randint(p.commit_min, p.commit_max)
+        agent.commit_ticks = _randint(p.commit_min, p.commit_max)
         agent.target = pick_point_in_zone(chosen, pad=55)
     else:
         agent.commit_ticks -= 1
 
     # Fish-like retarget + orbit impulse (profile-controlled)
-    if agent.commit_zone and agent.commit_zone.contains(agent.pos):
-        if random.random() < p.inside_zone_retarget_p:
+    if agent.commit_zone and agent.commit_zone.contains(pos):
+        if _random() < p.inside_zone_retarget_p:
             agent.target = pick_point_in_zone(agent.commit_zone, pad=55)
-        if random.random() < p.orbit_impulse_p:
-            agent.target += v2(random.randint(-90, 90), random.randint(-60, 60))
-
-    to_target = agent.target - agent.pos
-    desired = safe_normalize(to_target)
-
-    ang = random.random() * math.tau
-    wander = v2(math.cos(ang), math.sin(ang))
-    desired = safe_normalize(desired + p.wander_mix * wander)
+        if _random() < p.orbit_impulse_p:
+            agent.target += v2(_randint(-90, 90), _randint(-60, 60))
 
-    # speed with crawl minimum
-    speed = p.base_speed * (0.35 + 1.05 * agent.state.energy)
-    speed = max(p.crawl_speed_min, speed)
-
-    steer = desired * speed
-    agent.vel = agent.vel.lerp(steer, 0.08)
-    agent.pos += agent.vel * dt
-
-    agent.pos.x = max(20, min(W - 20, agent.pos.x))
-    agent.pos.y = max(20, min(H - 20, agent.pos.y))
+    steer_for(p)(agent, dt)
+    return True
 
 
 def draw_hud(screen: pygame.Surface, font: pygame.font.Font, agent: Agent, hud_on: bool, p: MotionProfile, csv_path: str):
@@ -316,23 +432,22 @@ def draw_hud(screen: pygame.Surface, font: pygame.font.Font, agent: Agent, hud_o
         y += 22
 
 
-def draw_world(screen: pygame.Surface, zones: List[Zone], agent: Agent, trail: List[pygame.Vector2], p: MotionProfile):
+def draw_world(screen: pygame.Surface, zones: List[Zone], agent: Agent, trail: Deque[Tuple[float, float]], p: MotionProfile):
     screen.fill(BG)
 
     for z in zones:
         rounded_rect(screen, z.rect, z.color, radius=26, width=0)
-        r_in = inner_rect(z.rect, p.soft_edge_margin)
+        r_in = z.inner(p.soft_edge_margin)[0]
         rounded_rect(screen, r_in, (245, 245, 248), radius=20, width=2)
 
     # trail length scales with energy
     max_len = int(18 + 90 * agent.state.energy)
-    if len(trail) > max_len:
-        del trail[:-max_len]
+    while len(trail) > max_len:
+        trail.popleft()
 
-    for i in range(1, len(trail)):
-        a = trail[i - 1]
-        b = trail[i]
-        pygame.draw.line(screen, (175, 255, 220), a, b, width=2)
+    # whole polyline in one call
+    if len(trail) >= 2:
+        pygame.draw.lines(screen, (175, 255, 220), False, trail, width=2)
 
     pygame.draw.circle(screen, AGENT_COLOR, (int(agent.pos.x), int(agent.pos.y)), 8)
 
@@ -344,13 +459,70 @@ def draw_world(screen: pygame.Surface, zones: List[Zone], agent: Agent, trail: L
         pygame.draw.line(screen, (160, 255, 210), agent.pos, tip, width=3)
 
 
-def ensure_telemetry_paths() -> str:
+TELEMETRY_QUEUE_ROWS = 4096  # rows the sim may run ahead of the writer thread
+
+# "csv" (text) or "bin" (fixed-size struct records; Telemetry_tools/convert_to_csv.py turns them back into CSV)
+TELEMETRY_FORMAT = "csv"
+
+TELEMETRY_COLUMNS = "t_sec,dt,x,y,vx,vy,speed,zone,commit_zone,commit_ticks,dwell_ticks,energy,load,coherence,curiosity,profile"
+
+
+# one row, in the order main() queues it:
+# t, dt, x, y, vx, vy, speed, zone, commit_zone, commit_ticks, dwell_ticks, energy, load, coherence, curiosity, profile
+_ROW_FMT = "%.4f,%.4f,%.2f,%.2f,%.2f,%.2f,%.2f,%s,%s,%d,%d,%.4f,%.4f,%.4f,%.4f,%s\n"
+
+
+def format_row(row: tuple) -> str:
+    return _ROW_FMT % row
+
+
+# binary log: b"SBXT1 <struct format>\n" + TELEMETRY_COLUMNS line, then one packed record per row
+TELEMETRY_MAGIC = b"SBXT1"
+_ROW_STRUCT = struct.Struct("<7d16s16s2i4d8s")
+
+
+def pack_row(row: tuple) -> bytes:
+    t, dt, x, y, vx, vy, spd, cz, commit, commit_ticks, dwell_ticks, e, l, c, q, key = row
+    return _ROW_STRUCT.pack(
+        t, dt, x, y, vx, vy, spd,
+        cz.encode(), commit.encode(), commit_ticks, dwell_ticks,
+        e, l, c, q, key.encode(),
+    )
+
+
+def telemetry_writer(f, rows: "queue.Queue[Optional[tuple]]", encode: Callable[[tuple], Any],
+                     failed: threading.Event, error: List[BaseException]):
+    # runs on its own thread: encodes + writes rows until the None sentinel.
+    # A write error is stored in `error` and flagged on `failed`; nothing drains `rows` after that.
+    try:
+        while True:
+            row = rows.get()
+            if row is None:
+                break
+            f.write(encode(row))
+    except BaseException as e:
+        error.append(e)
+        failed.set()
+
+
+def put_unless(q: "queue.Queue[Any]", item: Any, failed: threading.Event) -> bool:
+    # blocking put that gives up (returns False) once the consumer has flagged `failed`
+    while True:
+        try:
+            q.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            if failed.is_set():
+                return False
+
+
+def ensure_telemetry_paths(ext: str = "csv") -> str:
     # Keeps it simple and avoids the double-telemetry folder confusion.
-    # Output: <project>/telemetry/runs/run_YYYYMMDD_HHMMSS.csv
+    # Output: <project>/telemetry/runs/run_YYYYMMDD_HHMMSS.<ext>
     out_dir = os.path.join("telemetry", "runs")
     os.makedirs(out_dir, exist_ok=True)
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-    return os.path.join(out_dir, f"run_{ts}.csv")
+    return os.path.join(out_dir, f"run_{ts}.{ext}")
 
 
 def main():
@@ -366,12 +538,12 @@ def main():
     font = pygame.font.SysFont("consolas", 18)
 
     zones = build_zones()
-    zmap = {z.name: z for z in zones}
+    world = build_world(zones)
 
     agent = Agent(pos=v2(250, 310), vel=v2(0, 0), target=v2(250, 310))
-    agent.commit_zone = zmap["Library"]
+    agent.commit_zone = world.by_name["Library"]
     agent.commit_ticks = random.randint(p.commit_min, p.commit_max)
-    agent.last_choice = "Library"
+    agent.last_choice_idx = world.name_to_idx["Library"]
     agent.target = pick_point_in_zone(agent.commit_zone, pad=60)
 
     hud_on = True
@@ -379,13 +551,81 @@ def main():
     sim_running = True
     step_once = False
 
-    trail: List[pygame.Vector2] = [agent.pos.copy()]
+    trail: Deque[Tuple[float, float]] = deque([(agent.pos.x, agent.pos.y)], maxlen=TRAIL_MAX_LEN)
 
     # Telemetry
-    csv_path = ensure_telemetry_paths()
-    f = open(csv_path, "w", encoding="utf-8")
-    f.write("t_sec,dt,x,y,vx,vy,speed,zone,commit_zone,commit_ticks,dwell_ticks,energy,load,coherence,curiosity,profile\n")
-    t = 0.0
+    if TELEMETRY_FORMAT == "bin":
+        csv_path = ensure_telemetry_paths("bin")
+        f = open(csv_path, "wb", buffering=1 << 20)
+        f.write(TELEMETRY_MAGIC + b" " + _ROW_STRUCT.format.encode() + b"\n")
+        f.write(TELEMETRY_COLUMNS.encode() + b"\n")
+        encode = pack_row
+    else:
+        csv_path = ensure_telemetry_paths()
+        f = open(csv_path, "w", encoding="utf-8", buffering=1 << 20)
+        f.write(TELEMETRY_COLUMNS + "\n")
+        encode = format_row
+    rows: "queue.Queue[Optional[tuple]]" = queue.Queue(maxsize=TELEMETRY_QUEUE_ROWS)
+    writer_failed = threading.Event()
+    writer_error: List[BaseException] = []
+    writer = threading.Thread(
+        target=telemetry_writer, args=(f, rows, encode, writer_failed, writer_error), name="telemetry", daemon=True
+    )
+    writer.start()
+
+    # Sim thread: runs one update per (dt, profile) tick handed over by the main loop,
+    # so the step overlaps the previous frame's flip. Events + drawing stay on the
+    # main thread (pygame requires it); state_lock guards the agent/trail while drawing.
+    ticks: "queue.Queue[Optional[Tuple[float, MotionProfile]]]" = queue.Queue(maxsize=1)
+    state_lock = threading.Lock()
+    sim_failed = threading.Event()
+    sim_error: List[BaseException] = []
+
+    def sim_loop():
+        t = 0.0
+        try:
+            while True:
+                tick = ticks.get()
+                if tick is None:
+                    return
+                if writer_failed.is_set():
+                    raise writer_error[0]
+                dt, tp = tick
+                with state_lock:
+                    pos = agent.pos
+                    bx, by = pos.x, pos.y
+                    if UPDATE_P >= 1.0 or _random() < UPDATE_P:
+                        moved = update_agent(agent, world, dt, tp)
+                    else:
+                        coast_agent(agent, dt)
+                        moved = True
+
+                    # paused ticks can't have moved: skip the distance test entirely
+                    if moved:
+                        dx, dy = pos.x - bx, pos.y - by
+                        if dx * dx + dy * dy >= tp.trail_move_eps * tp.trail_move_eps:
+                            trail.append((pos.x, pos.y))
+
+                    # telemetry row (raw values; the writer thread formats it)
+                    t += dt
+                    s = agent.state
+                    commit = agent.commit_zone.name if agent.commit_zone else "None"
+                    row = (
+                        t, dt, agent.pos.x, agent.pos.y,
+                        agent.vel.x, agent.vel.y, agent.vel.length(),
+                        agent.current_zone, commit, agent.commit_ticks, agent.dwell_ticks,
+                        s.energy, s.load, s.coherence, s.curiosity,
+                        tp.key,
+                    )
+                # enqueue after releasing state_lock so a slow writer never stalls drawing
+                if not put_unless(rows, row, writer_failed):
+                    raise writer_error[0]
+        except BaseException as e:
+            sim_error.append(e)
+            sim_failed.set()
+
+    sim = threading.Thread(target=sim_loop, name="sim", daemon=True)
+    sim.start()
 
     try:
         while running:
@@ -415,37 +655,37 @@ def main():
                         p = get_profile(active_key)
                         pygame.display.set_caption(f"ORPIN / MOS Sandbox Town v1.1.11 ({p.title}) + Telemetry")
 
-            if sim_running or step_once:
-                before = agent.pos.copy()
-                update_agent(agent, zones, dt, p)
-
-                if (agent.pos - before).length() >= p.trail_move_eps:
-                    trail.append(agent.pos.copy())
-
-                # telemetry row
-                t += dt
-                s = agent.state
-                cz = agent.current_zone
-                commit = agent.commit_zone.name if agent.commit_zone else "None"
-                spd = agent.vel.length()
-                f.write(
-                    f"{t:.4f},{dt:.4f},{agent.pos.x:.2f},{agent.pos.y:.2f},"
-                    f"{agent.vel.x:.2f},{agent.vel.y:.2f},{spd:.2f},"
-                    f"{cz},{commit},{agent.commit_ticks},{agent.dwell_ticks},"
-                    f"{s.energy:.4f},{s.load:.4f},{s.coherence:.4f},{s.curiosity:.4f},"
-                    f"{p.key}\n"
-                )
+            if sim_failed.is_set():
+                raise sim_error[0]
+            if writer_failed.is_set():
+                raise writer_error[0]
 
+            if sim_running or step_once:
+                # the sim thread may stop between the check above and this hand-off
+                if not put_unless(ticks, (dt, p), sim_failed):
+                    raise sim_error[0]
                 step_once = False
 
-            draw_world(screen, zones, agent, trail, p)
-            draw_hud(screen, font, agent, hud_on, p, csv_path)
+            with state_lock:
+                draw_world(screen, zones, agent, trail, p)
+                draw_hud(screen, font, agent, hud_on, p, csv_path)
             pygame.display.flip()
 
     finally:
+        try:
+            ticks.put(None, timeout=1.0)
+        except queue.Full:
+            pass  # sim thread already died; sim_error holds the cause
+        sim.join()
+        put_unless(rows, None, writer_failed)
+        writer.join()
         f.close()
         pygame.quit()
 
+    # a write that failed while flushing the tail of the run
+    if writer_error:
+        raise writer_error[0]
+
 
 if __name__ == "__main__":
     main()
@@ -2,9 +2,10 @@ import math
 import os
 import csv
 import random
+from collections import deque
 from datetime import datetime
 from dataclasses import dataclass, field
-from typing import Dict, Optional, List, Tuple
+from typing import Deque, Dict, Optional, List, Tuple
 
 import pygame
 
@@ -16,6 +17,9 @@ from profiles import get_profile, PROFILES, MotionProfile
 W, H = 980, 560
 FPS = 60
 
+# Telemetry
+TELEMETRY_BATCH_ROWS = 128  # rows buffered between writerows() calls
+
 # Colors
 BG = (16, 16, 18)
 TXT = (235, 235, 235)
@@ -28,6 +32,14 @@ COLOR_REST = (205, 195, 160)
 
 AGENT_COLOR = (210, 255, 230)
 
+TRAIL_MAX_LEN = 108  # longest energy-scaled trail (18 + 90 * energy)
+
+# RNG bound to the module-level generator, so random.seed() still drives them
+_random = random.random
+_randint = random.randint
+_uniform = random.uniform
+_choices = random.choices
+
 # Zones
 ZONE_COLORS = {
     "Library": COLOR_LIBRARY,
@@ -55,6 +67,21 @@ def v2(x: float, y: float) -> pygame.Vector2:
     return pygame.Vector2(float(x), float(y))
 
 
+# rendered text memo for the HUD: (font, text, color) -> Surface; cleared when it fills up
+_TEXT_CACHE: Dict[Tuple[pygame.font.Font, str, Tuple[int, int, int]], pygame.Surface] = {}
+_TEXT_CACHE_MAX = 256
+
+
+def render_text(font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    key = (font, text, color)
+    surf = _TEXT_CACHE.get(key)
+    if surf is None:
+        if len(_TEXT_CACHE) >= _TEXT_CACHE_MAX:
+            _TEXT_CACHE.clear()
+        surf = _TEXT_CACHE[key] = font.render(text, True, color)
+    return surf
+
+
 def rounded_rect(surface: pygame.Surface, rect: pygame.Rect, color: Tuple[int, int, int], radius: int, width: int = 0):
     pygame.draw.rect(surface, color, rect, width=width, border_radius=radius)
 
@@ -78,7 +105,7 @@ def ensure_telemetry_paths() -> str:
 # -------------------------
 # Data Models
 # -------------------------
-@dataclass
+@dataclass(slots=True)
 class Zone:
     name: str
     rect: pygame.Rect
@@ -87,12 +114,20 @@ class Zone:
     pause_bias: float = 1.0
     commit_bias: float = 1.0
 
+    # this zone's rows of FISH_TARGET_COEFFS / FISH_COMMIT_COEFFS, bound once so scoring skips the name lookup
+    fish_target_k: Tuple[float, float, float, float, float] = field(init=False, repr=False)
+    fish_commit_k: Tuple[float, float, float, float, float] = field(init=False, repr=False)
+    # shared center vector (zones never move); handed out as a target, so never mutate a target in place
+    center_vec: pygame.Vector2 = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.fish_target_k = FISH_TARGET_COEFFS[self.name]
+        self.fish_commit_k = FISH_COMMIT_COEFFS[self.name]
+        self.center_vec = pygame.Vector2(self.rect.centerx, self.rect.centery)
+
     def contains(self, pos: pygame.Vector2) -> bool:
         return self.rect.collidepoint(pos.x, pos.y)
 
-    def center(self) -> pygame.Vector2:
-        return pygame.Vector2(self.rect.centerx, self.rect.centery)
-
     def soft_contains(self, pos: pygame.Vector2, margin: int) -> bool:
         return inner_rect(self.rect, margin).collidepoint(pos.x, pos.y)
 
@@ -102,7 +137,7 @@ class Zone:
         return not self.soft_contains(pos, margin)
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentState:
     energy: float = 0.70
     load: float = 0.20
@@ -110,7 +145,7 @@ class AgentState:
     curiosity: float = 0.70
 
 
-@dataclass
+@dataclass(slots=True)
 class Agent:
     pos: pygame.Vector2
     vel: pygame.Vector2
@@ -145,6 +180,9 @@ class Agent:
     fish_commit_ticks_left: int = 0
     fish_commit_cooldown_ticks: int = 0
 
+    # ---------- FISH target cadence ----------
+    fish_decide_cooldown: int = 0
+
 
 # -------------------------
 # World Build
@@ -194,8 +232,8 @@ def zone_at(zones: List[Zone], pos: pygame.Vector2) -> Optional[Zone]:
 
 def pick_point_in_zone(z: Zone, pad: int = 55) -> pygame.Vector2:
     r = z.rect
-    x = random.randint(r.left + pad, r.right - pad)
-    y = random.randint(r.top + pad, r.bottom - pad)
+    x = _randint(r.left + pad, r.right - pad)
+    y = _randint(r.top + pad, r.bottom - pad)
     return v2(x, y)
 
 
@@ -352,26 +390,27 @@ def update_agent_ant(agent: Agent, zones: List[Zone], dt: float, p: MotionProfil
         chosen = decide_target_zone_ant(agent, zones, p)
         agent.last_choice = chosen.name
         agent.commit_zone = chosen
-        agent.commit_ticks = random.randint(p.commit_min, p.commit_max)
+        agent.commit_ticks = _randint(p.commit_min, p.commit_max)
         agent.target = pick_point_in_zone(chosen, pad=55)
     else:
         agent.commit_ticks -= 1
 
     # Retarget + orbit impulse
     if agent.commit_zone and agent.commit_zone.contains(agent.pos):
-        if random.random() < p.inside_zone_retarget_p:
+        if _random() < p.inside_zone_retarget_p:
             agent.target = pick_point_in_zone(agent.commit_zone, pad=55)
-        if random.random() < p.orbit_impulse_p:
-            agent.target += v2(
-                random.randint(-p.orbit_strength_x, p.orbit_strength_x),
-                random.randint(-p.orbit_strength_y, p.orbit_strength_y),
+        if _random() < p.orbit_impulse_p:
+            # rebinds rather than +=: the target may be a zone's shared center_vec
+            agent.target = agent.target + v2(
+                _randint(-p.orbit_strength_x, p.orbit_strength_x),
+                _randint(-p.orbit_strength_y, p.orbit_strength_y),
             )
 
     to_target = agent.target - agent.pos
     desired = safe_normalize(to_target)
 
     # wander blend
-    ang = random.random() * math.tau
+    ang = _random() * math.tau
     wander = v2(math.cos(ang), math.sin(ang))
     desired = safe_normalize(desired + p.wander_mix * wander)
 
@@ -390,14 +429,31 @@ def update_agent_ant(agent: Agent, zones: List[Zone], dt: float, p: MotionProfil
 # ============================================================
 # FISH MODEL (ported from v1.1.7: glide + seconds-pauses + centers)
 # ============================================================
-def maybe_edge_pause_fish(agent: Agent, z: Optional[Zone], p: MotionProfile):
+FISH_DECIDE_EVERY = 8  # ticks between target decisions
+
+# fish scores/weights as linear forms over (1, energy, load, coherence, curiosity);
+# the (1 - x) terms are expanded into the constant
+FISH_TARGET_COEFFS: Dict[str, Tuple[float, float, float, float, float]] = {
+    "Park": (2.3, -2.0, 1.5, -0.3, 0.0),         # 2(1-E) + 1.5L + 0.3(1-C)
+    "Library": (0.0, 0.0, -1.2, 1.2, 2.0),       # 2Q + 1.2C - 1.2L
+    "Rest": (2.2, -0.6, 1.0, -1.6, 0.0),         # 1.6(1-C) + L + 0.6(1-E)
+    "Transition": (0.85, 0.0, 0.0, -0.6, 0.0),   # 0.25 + 0.6(1-C)
+}
+FISH_COMMIT_COEFFS: Dict[str, Tuple[float, float, float, float, float]] = {
+    "Park": (2.2, -1.2, 1.6, 0.0, 0.0),          # 1 + 1.6L + 1.2(1-E)
+    "Library": (1.0, 0.0, 0.0, 0.8, 1.4),        # 1 + 1.4Q + 0.8C
+    "Rest": (2.6, 0.0, 0.8, -1.6, 0.0),          # 1 + 1.6(1-C) + 0.8L
+    "Transition": (0.55, 0.0, 0.0, 0.0, 0.0),
+}
+
+
+def maybe_edge_pause_fish(agent: Agent, z: Optional[Zone], p: MotionProfile, near: bool):
     if z is None:
         agent.fish_edge_pause_latch = False
         return
 
-    near = z.near_edge(agent.pos, p.soft_edge_margin)
     if near and not agent.fish_edge_pause_latch and agent.fish_pause_cooldown_s <= 0.0:
-        hold = random.uniform(p.fish_pause_min_s, p.fish_pause_max_s) * z.pause_bias
+        hold = _uniform(p.fish_pause_min_s, p.fish_pause_max_s) * z.pause_bias
         agent.fish_pause_hold_s = max(agent.fish_pause_hold_s, hold)
         agent.fish_edge_pause_latch = True
     elif not near:
@@ -408,89 +464,90 @@ def pick_commit_zone_fish(agent: Agent, zones: List[Zone], p: MotionProfile) ->
     if agent.fish_commit_cooldown_ticks > 0:
         return None
 
+    # the commit roll comes first: weights are only needed when it hits
+    if _random() >= p.fish_commit_p:
+        return None
+
     s = agent.state
-    weights: Dict[str, float] = {}
+    e, l, c, q = s.energy, s.load, s.coherence, s.curiosity
+    names: List[str] = []
+    cum: List[float] = []
+    total = 0.0
 
+    # running sums built in the same pass as the weights
     for z in zones:
-        w = 1.0 * z.commit_bias
-        if z.name == "Park":
-            w *= (1.0 + 1.6 * s.load + 1.2 * (1.0 - s.energy))
-        elif z.name == "Library":
-            w *= (1.0 + 1.4 * s.curiosity + 0.8 * s.coherence)
-        elif z.name == "Rest":
-            w *= (1.0 + 1.6 * (1.0 - s.coherence) + 0.8 * s.load)
-        elif z.name == "Transition":
-            w *= 0.55
-        weights[z.name] = w
-
-    if random.random() < p.fish_commit_p:
-        total = sum(weights.values())
-        r = random.random() * total
-        acc = 0.0
-        for name, w in weights.items():
-            acc += w
-            if r <= acc:
-                return name
-    return None
+        k = z.fish_commit_k
+        total += z.commit_bias * (k[0] + k[1] * e + k[2] * l + k[3] * c + k[4] * q)
+        names.append(z.name)
+        cum.append(total)
+
+    # nothing to weigh (e.g. every commit_bias zeroed): no commit rather than a silent first-zone pick
+    if total <= 0.0:
+        return None
+
+    # one random() draw scaled by the total, bisected into the running sums
+    return _choices(names, cum_weights=cum, k=1)[0]
 
 
-def decide_target_fish(agent: Agent, zones: List[Zone], p: MotionProfile) -> pygame.Vector2:
+def decide_target_fish(agent: Agent, zones: List[Zone], p: MotionProfile,
+                       current: Optional[Zone], near: bool) -> pygame.Vector2:
+    # current / near: zone_at(agent.pos) and its near_edge result, already computed this tick
     s = agent.state
 
     # honor commit: aim for committed zone center
     if agent.fish_commit_ticks_left > 0 and agent.fish_commit_zone is not None:
         for z in zones:
             if z.name == agent.fish_commit_zone:
-                return z.center()
+                return z.center_vec
 
     # leaving lock: keep current target briefly
     if agent.fish_leaving_lock_ticks > 0:
         return agent.target
 
-    current = zone_at(zones, agent.pos)
     if current is not None and agent.dwell_ticks < p.fish_min_dwell_ticks:
-        return current.center()
+        return current.center_vec
 
-    scores: Dict[str, float] = {}
-    current_name = current.name if current else "None"
+    # scores[i] belongs to zones[i]; max() keeps the first of equal scores, as the dict did
+    scores: List[float] = []
 
+    e, l, c, q = s.energy, s.load, s.coherence, s.curiosity
     for z in zones:
-        score = 0.0
-        if z.name == "Park":
-            score += 2.0 * (1.0 - s.energy)
-            score += 1.5 * s.load
-            score += 0.3 * (1.0 - s.coherence)
-        if z.name == "Library":
-            score += 2.0 * s.curiosity
-            score += 1.2 * s.coherence
-            score -= 1.2 * s.load
-        if z.name == "Rest":
-            score += 1.6 * (1.0 - s.coherence)
-            score += 1.0 * s.load
-            score += 0.6 * (1.0 - s.energy)
-        if z.name == "Transition":
-            score += 0.25
-            score += 0.6 * (1.0 - s.coherence)
-
-        if current is not None and current.name == z.name and current.near_edge(agent.pos, p.soft_edge_margin):
+        k = z.fish_target_k
+        score = k[0] + k[1] * e + k[2] * l + k[3] * c + k[4] * q
+
+        if near and z is current:
             score -= 0.35
 
-        score += random.uniform(-0.08, 0.08)
-        scores[z.name] = score
+        score += _uniform(-0.08, 0.08)
+        scores.append(score)
 
-    best_name = max(scores, key=scores.get)
+    best = zones[max(range(len(scores)), key=scores.__getitem__)]
 
-    if current is not None and best_name != current_name:
-        if not current.near_edge(agent.pos, p.soft_edge_margin):
-            return current.center()
+    if current is not None and best is not current:
+        if not near:
+            return current.center_vec
         else:
             agent.fish_leaving_lock_ticks = p.fish_exit_lock_ticks
 
-    for z in zones:
-        if z.name == best_name:
-            return z.center()
+    return best.center_vec
 
-    return pygame.Vector2(W / 2, H / 2)
+
+# one fish movement step on plain floats (no Vector2 in/out): steer toward (tx, ty), lerp, integrate.
+# returns the new (px, py, vx, vy); within 1px of the target the glide just bleeds off
+def glide_step(px: float, py: float, vx: float, vy: float, tx: float, ty: float,
+               dt: float, speed: float, turn_rate: float) -> Tuple[float, float, float, float]:
+    dx, dy = tx - px, ty - py
+    dist_sq = dx * dx + dy * dy
+    if dist_sq <= 1.0:
+        return px, py, vx * 0.85, vy * 0.85
+
+    dist = math.sqrt(dist_sq)
+    # glide smoothing
+    t = dt * turn_rate
+    t = 0.0 if t < 0.0 else 1.0 if t > 1.0 else t  # clamp inlined
+    vx = vx * (1 - t) + dx / dist * speed * t
+    vy = vy * (1 - t) + dy / dist * speed * t
+    return px + vx * dt, py + vy * dt, vx, vy
 
 
 def update_agent_fish(agent: Agent, zones: List[Zone], dt: float, tick_running: bool, p: MotionProfile):
@@ -507,7 +564,7 @@ def update_agent_fish(agent: Agent, zones: List[Zone], dt: float, tick_running:
         agent.fish_commit_ticks_left -= 1
         if agent.fish_commit_ticks_left <= 0:
             agent.fish_commit_zone = None
-            agent.fish_commit_cooldown_ticks = random.randint(p.fish_commit_cooldown_min, p.fish_commit_cooldown_max)
+            agent.fish_commit_cooldown_ticks = _randint(p.fish_commit_cooldown_min, p.fish_commit_cooldown_max)
 
     # zone + dwell
     z = zone_at(zones, agent.pos)
@@ -518,21 +575,28 @@ def update_agent_fish(agent: Agent, zones: List[Zone], dt: float, tick_running:
         agent.current_zone = zname
         agent.dwell_ticks = 0
 
+    # pos does not move until the movement block below, so z / near hold for the whole decision phase
+    near = z is not None and z.near_edge(agent.pos, p.soft_edge_margin)
+
     if tick_running:
         apply_zone_effects(agent, z, dt)
 
-    maybe_edge_pause_fish(agent, z, p)
+    maybe_edge_pause_fish(agent, z, p, near)
 
     # commit start
     if tick_running and agent.fish_commit_zone is None and agent.fish_commit_ticks_left <= 0:
         cz = pick_commit_zone_fish(agent, zones, p)
         if cz is not None:
             agent.fish_commit_zone = cz
-            agent.fish_commit_ticks_left = random.randint(p.fish_commit_min, p.fish_commit_max)
+            agent.fish_commit_ticks_left = _randint(p.fish_commit_min, p.fish_commit_max)
 
-    # decide target occasionally
-    if tick_running and (agent.dwell_ticks % 8 == 0 or agent.target.length_squared() == 0):
-        agent.target = decide_target_fish(agent, zones, p)
+    # decide target on a fixed cadence (dwell_ticks resets at every zone crossing, so it is no clock)
+    if tick_running:
+        if agent.fish_decide_cooldown <= 0 or agent.target.length_squared() == 0:
+            agent.target = decide_target_fish(agent, zones, p, z, near)
+            agent.fish_decide_cooldown = FISH_DECIDE_EVERY - 1
+        else:
+            agent.fish_decide_cooldown -= 1
 
     # pause
     if agent.fish_pause_hold_s > 0.0:
@@ -543,16 +607,11 @@ def update_agent_fish(agent: Agent, zones: List[Zone], dt: float, tick_running:
 
     # movement
     if tick_running and not agent.paused:
-        to = (agent.target - agent.pos)
-        dist = to.length()
-        if dist > 1.0:
-            desired = to.normalize() * p.fish_base_speed
-            # glide smoothing
-            t = clamp(dt * p.fish_turn_rate, 0.0, 1.0)
-            agent.vel = agent.vel.lerp(desired, t)
-            agent.pos += agent.vel * dt
-        else:
-            agent.vel *= 0.85
+        pos, vel, target = agent.pos, agent.vel, agent.target
+        px, py, vx, vy = glide_step(pos.x, pos.y, vel.x, vel.y, target.x, target.y,
+                                    dt, p.fish_base_speed, p.fish_turn_rate)
+        vel.update(vx, vy)
+        pos.update(px, py)
     else:
         agent.vel *= 0.85
 
@@ -560,7 +619,8 @@ def update_agent_fish(agent: Agent, zones: List[Zone], dt: float, tick_running:
 # -------------------------
 # Rendering
 # -------------------------
-def draw_hud(screen: pygame.Surface, font: pygame.font.Font, agent: Agent, hud_on: bool, p: MotionProfile, csv_path: str):
+def draw_hud(screen: pygame.Surface, font: pygame.font.Font, agent: Agent, hud_on: bool, p: MotionProfile, csv_path: str,
+             is_fish: bool):
     if not hud_on:
         return
 
@@ -570,7 +630,7 @@ def draw_hud(screen: pygame.Surface, font: pygame.font.Font, agent: Agent, hud_o
     commit_label = "-"
     commit_left = 0
 
-    if model == "fish":
+    if is_fish:
         commit_label = agent.fish_commit_zone if agent.fish_commit_zone else "-"
         commit_left = agent.fish_commit_ticks_left
     else:
@@ -588,28 +648,42 @@ def draw_hud(screen: pygame.Surface, font: pygame.font.Font, agent: Agent, hud_o
     y = 12
     for i, t in enumerate(lines):
         col = TXT if i < 2 else SUBTXT
-        surf = font.render(t, True, col)
-        screen.blit(surf, (12, y))
+        screen.blit(render_text(font, t, col), (12, y))
         y += 22
 
 
-def draw_world(screen: pygame.Surface, zones: List[Zone], agent: Agent, trail: List[pygame.Vector2], p: MotionProfile):
-    screen.fill(BG)
+# (zones, margin, surface) of the last static background; zones never change within a run
+_world_bg: Optional[Tuple[List[Zone], int, pygame.Surface]] = None
 
+
+def _build_world_background(zones: List[Zone], margin: int) -> pygame.Surface:
+    bg = pygame.Surface((W, H)).convert()
+    bg.fill(BG)
     for z in zones:
-        rounded_rect(screen, z.rect, z.color, radius=26, width=0)
-        r_in = inner_rect(z.rect, p.soft_edge_margin)
-        rounded_rect(screen, r_in, (245, 245, 248), radius=20, width=2)
+        rounded_rect(bg, z.rect, z.color, radius=26, width=0)
+        r_in = inner_rect(z.rect, margin)
+        rounded_rect(bg, r_in, (245, 245, 248), radius=20, width=2)
+    return bg
+
+
+def draw_world(screen: pygame.Surface, zones: List[Zone], agent: Agent, trail: Deque[Tuple[float, float]], p: MotionProfile,
+               is_fish: bool):
+    global _world_bg
+    margin = p.soft_edge_margin
+
+    # zones + inner margin outlines are static: rebuild only when the profile's margin changes
+    if _world_bg is None or _world_bg[0] is not zones or _world_bg[1] != margin:
+        _world_bg = (zones, margin, _build_world_background(zones, margin))
+    screen.blit(_world_bg[2], (0, 0))
 
     # trail length scales with energy (only for ant model; fish uses streak)
-    if p.model == "ant":
+    if not is_fish:
         max_len = int(18 + 90 * agent.state.energy)
-        if len(trail) > max_len:
-            del trail[:-max_len]
-        for i in range(1, len(trail)):
-            a = trail[i - 1]
-            b = trail[i]
-            pygame.draw.line(screen, (175, 255, 220), a, b, width=2)
+        while len(trail) > max_len:
+            trail.popleft()
+        # whole polyline in one call
+        if len(trail) >= 2:
+            pygame.draw.lines(screen, (175, 255, 220), False, trail, width=2)
     else:
         # fish streak (like v1.1.7)
         streak_len = 22
@@ -625,7 +699,7 @@ def draw_world(screen: pygame.Surface, zones: List[Zone], agent: Agent, trail: L
     pygame.draw.circle(screen, AGENT_COLOR, (int(agent.pos.x), int(agent.pos.y)), 8)
 
     # ant nose indicator
-    if p.model == "ant":
+    if not is_fish:
         spd = agent.vel.length()
         nose_len = max(8.0, min(18.0, spd * 0.15))
         if spd > 0.5:
@@ -642,12 +716,16 @@ def main():
     screen = pygame.display.set_mode((W, H))
     clock = pygame.time.Clock()
     font = pygame.font.SysFont("consolas", 18)
+    # only QUIT / KEYDOWN (+ expose, for the paused redraw) are handled: keep mouse motion etc. off the queue
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE])
 
     zones = build_zones()
     zmap = {z.name: z for z in zones}
 
     # default profile
     p = get_profile("fish")
+    is_fish = p.model == "fish"  # refreshed on every profile switch
 
     # agent start
     agent = Agent(pos=v2(250, 310), vel=v2(0, 0), target=v2(250, 310))
@@ -656,22 +734,23 @@ def main():
     agent.commit_zone = zmap["Library"]
     agent.commit_ticks = random.randint(p.commit_min, p.commit_max)
     agent.last_choice = "Library"
-    agent.target = zmap["Library"].center()
-
-    # init FISH target
-    agent.target = zmap["Library"].center()
+    agent.target = zmap["Library"].center_vec  # also the FISH start target
 
     hud_on = True
     running = True
     tick_running = True
     step_once = False
 
-    # trail list for ant model
-    trail: List[pygame.Vector2] = [agent.pos.copy()]
+    # while paused the frame is static: redraw only after a key press or when the window is re-exposed
+    redraw = True
+    redraw_events = (pygame.KEYDOWN, pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE)
+
+    # trail for ant model (bounded; trimmed further to the energy-scaled length when drawn)
+    trail: Deque[Tuple[float, float]] = deque([(agent.pos.x, agent.pos.y)], maxlen=TRAIL_MAX_LEN)
 
     # telemetry
     csv_path = ensure_telemetry_paths()
-    f = open(csv_path, "w", newline="", encoding="utf-8")
+    f = open(csv_path, "w", newline="", encoding="utf-8", buffering=1 << 16)
     w = csv.writer(f)
     w.writerow([
         "t_sec","dt","x","y","vx","vy","speed",
@@ -680,6 +759,7 @@ def main():
         "profile","model"
     ])
     t_sec = 0.0
+    rows: List[tuple] = []
 
     try:
         while running:
@@ -687,6 +767,8 @@ def main():
             dt = min(dt, p.dt_clamp)
 
             for event in pygame.event.get():
+                if event.type in redraw_events:
+                    redraw = True
                 if event.type == pygame.QUIT:
                     running = False
                 if event.type == pygame.KEYDOWN:
@@ -702,12 +784,15 @@ def main():
                     # switch profiles
                     elif event.key == pygame.K_1:
                         p = get_profile("fish")
+                        is_fish = p.model == "fish"
                         pygame.display.set_caption(f"SandboxTown v1.1.12 — {p.name}")
                     elif event.key == pygame.K_2:
                         p = get_profile("ant_slow")
+                        is_fish = p.model == "fish"
                         pygame.display.set_caption(f"SandboxTown v1.1.12 — {p.name}")
                     elif event.key == pygame.K_3:
                         p = get_profile("ant_fast")
+                        is_fish = p.model == "fish"
                         pygame.display.set_caption(f"SandboxTown v1.1.12 — {p.name}")
 
             ran = tick_running or step_once
@@ -715,14 +800,14 @@ def main():
             if ran:
                 before = agent.pos.copy()
 
-                if p.model == "fish":
+                if is_fish:
                     update_agent_fish(agent, zones, dt, True, p)
                 else:
                     update_agent_ant(agent, zones, dt, p)
 
                     # ant trail update (only if moved enough)
                     if (agent.pos - before).length() >= p.trail_move_eps:
-                        trail.append(agent.pos.copy())
+                        trail.append((agent.pos.x, agent.pos.y))
 
                 # telemetry row
                 t_sec += dt
@@ -730,30 +815,38 @@ def main():
                 zone = agent.current_zone
                 speed = agent.vel.length()
 
-                if p.model == "fish":
+                if is_fish:
                     commit_zone = agent.fish_commit_zone if agent.fish_commit_zone else "-"
                     commit_left = agent.fish_commit_ticks_left
                 else:
                     commit_zone = agent.commit_zone.name if agent.commit_zone else "-"
                     commit_left = agent.commit_ticks
 
-                w.writerow([
-                    round(t_sec, 4), round(dt, 4),
-                    round(agent.pos.x, 2), round(agent.pos.y, 2),
-                    round(agent.vel.x, 2), round(agent.vel.y, 2),
-                    round(speed, 2),
+                # precision is fixed by the format specs (no round() + float repr per column)
+                rows.append((
+                    f"{t_sec:.4f}", f"{dt:.4f}",
+                    f"{agent.pos.x:.2f}", f"{agent.pos.y:.2f}",
+                    f"{agent.vel.x:.2f}", f"{agent.vel.y:.2f}",
+                    f"{speed:.2f}",
                     zone, commit_zone, commit_left, agent.dwell_ticks,
-                    round(s.energy, 4), round(s.load, 4), round(s.coherence, 4), round(s.curiosity, 4),
+                    f"{s.energy:.4f}", f"{s.load:.4f}", f"{s.coherence:.4f}", f"{s.curiosity:.4f}",
                     p.name, p.model
-                ])
+                ))
+                if len(rows) >= TELEMETRY_BATCH_ROWS:
+                    w.writerows(rows)
+                    rows.clear()
 
                 step_once = False
 
-            draw_world(screen, zones, agent, trail, p)
-            draw_hud(screen, font, agent, hud_on, p, csv_path)
-            pygame.display.flip()
+            if ran or redraw:
+                draw_world(screen, zones, agent, trail, p, is_fish)
+                draw_hud(screen, font, agent, hud_on, p, csv_path, is_fish)
+                pygame.display.flip()
+                redraw = False
 
     finally:
+        if rows:
+            w.writerows(rows)
         f.close()
         pygame.quit()
 
@@ -7,10 +7,13 @@
 import math
 import os
 import csv
+import queue
 import random
+import threading
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, Optional, List, Tuple
+from typing import Deque, Dict, Optional, List, Tuple
 
 import pygame
 
@@ -41,6 +44,7 @@ TRAIL_COLORS = {
     "SLOW_ANT": (155, 240, 210),
     "FISH":     (160, 235, 255),
 }
+TRAIL_MAX_LEN = 109  # longest energy-scaled trail (14 + 95 * energy)
 
 # -------------------------
 # World / Zones
@@ -54,6 +58,21 @@ DWELL_RAMP_RATE = 1 / 240.0
 # Hysteresis (prevents flip-flop in target selection)
 HYSTERESIS_EPS = 0.12
 
+# -------------------------
+# RNG
+# -------------------------
+# bound to the module-level generator, so random.seed() still drives them
+_random = random.random
+_randint = random.randint
+_getrandbits = random.getrandbits
+
+# unit wander directions, sampled with _getrandbits(WANDER_BITS): one draw, no cos/sin per tick
+WANDER_BITS = 12
+_WANDER: Tuple[Tuple[float, float], ...] = tuple(
+    (math.cos(a), math.sin(a))
+    for a in (i * math.tau / (1 << WANDER_BITS) for i in range(1 << WANDER_BITS))
+)
+
 # -------------------------
 # Common helper
 # -------------------------
@@ -82,27 +101,52 @@ def inner_rect(rect: pygame.Rect, margin: int) -> pygame.Rect:
 # -------------------------
 # Data models
 # -------------------------
-@dataclass
+@dataclass(slots=True)
 class Zone:
     name: str
     rect: pygame.Rect
     deltas: Dict[str, float]
     color: Tuple[int, int, int]
 
+    # per-tick deltas rescaled to per-second-at-60fps and flattened (energy, load, coherence, curiosity)
+    dvec60: Tuple[float, float, float, float] = field(init=False, repr=False)
+
+    # flat bounds, cached once (zones never move); tests are half-open like Rect.collidepoint
+    left: int = field(init=False, repr=False)
+    top: int = field(init=False, repr=False)
+    right: int = field(init=False, repr=False)
+    bottom: int = field(init=False, repr=False)
+    # margin -> inner (left, top, right, bottom)
+    _soft_bounds: Dict[int, Tuple[int, int, int, int]] = field(init=False, repr=False, default_factory=dict)
+
+    def __post_init__(self):
+        d = self.deltas
+        self.dvec60 = tuple(d.get(k, 0.0) * 60.0 for k in ("energy", "load", "coherence", "curiosity"))
+        r = self.rect
+        self.left, self.top, self.right, self.bottom = r.left, r.top, r.right, r.bottom
+
     def contains(self, pos: pygame.Vector2) -> bool:
-        return self.rect.collidepoint(pos.x, pos.y)
+        return self.left <= pos.x < self.right and self.top <= pos.y < self.bottom
+
+    def soft_bounds(self, margin: int) -> Tuple[int, int, int, int]:
+        b = self._soft_bounds.get(margin)
+        if b is None:
+            r = inner_rect(self.rect, margin)
+            b = self._soft_bounds[margin] = (r.left, r.top, r.right, r.bottom)
+        return b
 
     def soft_contains(self, pos: pygame.Vector2, margin: int) -> bool:
-        return inner_rect(self.rect, margin).collidepoint(pos.x, pos.y)
+        l, t, r, b = self.soft_bounds(margin)
+        return l <= pos.x < r and t <= pos.y < b
 
-@dataclass
+@dataclass(slots=True)
 class AgentState:
     energy: float = 0.70
     load: float = 0.20
     coherence: float = 0.60
     curiosity: float = 0.70
 
-@dataclass
+@dataclass(slots=True)
 class Profile:
     name: str
 
@@ -125,7 +169,10 @@ class Profile:
     # trail shaping
     trail_move_eps: float
 
-@dataclass
+    # settle quietly once parked on the target inside the committed zone (skip wander/steer)
+    quiet_when_arrived: bool = False
+
+@dataclass(slots=True)
 class Agent:
     agent_id: str
     profile: Profile
@@ -135,6 +182,7 @@ class Agent:
     state: AgentState = field(default_factory=AgentState)
 
     current_zone: str = "None"
+    current_zone_idx: int = -1  # index into zones of current_zone (-1 = none)
     dwell_ticks: int = 0
 
     # pause controls
@@ -145,9 +193,10 @@ class Agent:
     commit_zone: Optional[Zone] = None
     commit_ticks: int = 0
     last_choice: str = "None"
+    last_choice_idx: int = -1  # ZONE_IDX of last_choice (-1 = none yet)
 
     # visuals
-    trail: List[pygame.Vector2] = field(default_factory=list)
+    trail: Deque[Tuple[float, float]] = field(default_factory=lambda: deque(maxlen=TRAIL_MAX_LEN))
 
 # -------------------------
 # Profiles (FAST ANT + SLOW ANT + FISH)
@@ -180,6 +229,7 @@ PROFILES: Dict[str, Profile] = {
         edge_pause_ticks=8,
         edge_pause_cooldown=18,
         trail_move_eps=2.0,
+        quiet_when_arrived=True,
     ),
     "FISH": Profile(
         name="FISH",
@@ -227,100 +277,126 @@ def build_zones() -> List[Zone]:
     )
     return [library, park, transition, rest]
 
+# zone lookup grid: each ZONE_CELL x ZONE_CELL cell lists the zones overlapping it (list order,
+# so the first match still wins); a lookup tests only those candidates instead of every zone
+ZONE_CELL = 32
+
+# (zones, grid) of the last built lookup grid; zones never change within a run
+_zone_grid: Optional[Tuple[List[Zone], List[List[Tuple[int, ...]]]]] = None
+
+def _build_zone_grid(zones: List[Zone]) -> List[List[Tuple[int, ...]]]:
+    cols = (W + ZONE_CELL - 1) // ZONE_CELL
+    rows = (H + ZONE_CELL - 1) // ZONE_CELL
+    grid: List[List[Tuple[int, ...]]] = [[() for _ in range(cols)] for _ in range(rows)]
+    for i, z in enumerate(zones):
+        r = z.rect
+        for row in range(max(0, r.top // ZONE_CELL), min(rows, (r.bottom - 1) // ZONE_CELL + 1)):
+            for col in range(max(0, r.left // ZONE_CELL), min(cols, (r.right - 1) // ZONE_CELL + 1)):
+                grid[row][col] += (i,)
+    return grid
+
+def zone_index_at(zones: List[Zone], pos: pygame.Vector2) -> int:
+    global _zone_grid
+    if _zone_grid is None or _zone_grid[0] is not zones:
+        _zone_grid = (zones, _build_zone_grid(zones))
+    grid = _zone_grid[1]
+
+    x, y = pos.x, pos.y
+    if x < 0.0 or y < 0.0:
+        return -1
+    row, col = int(y) // ZONE_CELL, int(x) // ZONE_CELL
+    if row >= len(grid) or col >= len(grid[0]):
+        return -1
+    for i in grid[row][col]:
+        if zones[i].contains(pos):
+            return i
+    return -1
+
 def zone_at(zones: List[Zone], pos: pygame.Vector2) -> Optional[Zone]:
-    for z in zones:
-        if z.contains(pos):
-            return z
-    return None
+    i = zone_index_at(zones, pos)
+    return zones[i] if i >= 0 else None
 
 def pick_point_in_zone(z: Zone, pad: int = 45) -> pygame.Vector2:
-    r = z.rect
-    x = random.randint(r.left + pad, r.right - pad)
-    y = random.randint(r.top + pad, r.bottom - pad)
-    return v2(x, y)
+    # uniform over the padded box: one random() per axis instead of randint's range sampling
+    left, top = z.left + pad, z.top + pad
+    x = left + _random() * (z.right - pad - left)
+    y = top + _random() * (z.bottom - pad - top)
+    return pygame.Vector2(x, y)
 
 # -------------------------
 # Dwell / Soft-edge / Exposure shaping
 # -------------------------
-def dwell_ramp(agent: Agent) -> float:
-    return min(DWELL_RAMP_CAP, 1.0 + agent.dwell_ticks * DWELL_RAMP_RATE)
-
-def soft_edge_factor(z: Zone, pos: pygame.Vector2, margin: int) -> float:
-    inner = inner_rect(z.rect, margin)
-    if inner.collidepoint(pos.x, pos.y):
-        return 1.0
-
-    dx = 0.0
-    if pos.x < inner.left:
-        dx = inner.left - pos.x
-    elif pos.x > inner.right:
-        dx = pos.x - inner.right
+# shaping kernels: plain ints / floats in, float out (no Vector2, no Agent)
+def dwell_ramp(dwell_ticks: int) -> float:
+    return min(DWELL_RAMP_CAP, 1.0 + dwell_ticks * DWELL_RAMP_RATE)
 
-    dy = 0.0
-    if pos.y < inner.top:
-        dy = inner.top - pos.y
-    elif pos.y > inner.bottom:
-        dy = pos.y - inner.bottom
+def soft_edge_factor(z: Zone, x: float, y: float, margin: int) -> float:
+    left, top, right, bottom = z.soft_bounds(margin)
 
-    d = math.hypot(dx, dy)
-    if d <= 0:
+    # distance outside the inner rect per axis (0 when inside on that axis)
+    dx = left - x if x < left else x - right if x > right else 0.0
+    dy = top - y if y < top else y - bottom if y > bottom else 0.0
+    if dx == 0.0 and dy == 0.0:
         return 1.0
 
+    d = math.hypot(dx, dy)
     t = max(0.0, min(1.0, 1.0 - (d / max(1.0, float(margin)))))
     return t
 
-def exposure_factor(z: Zone, pos: pygame.Vector2) -> float:
+def exposure_factor(z: Zone, x: float, y: float) -> float:
     # Transition/Rest: stronger effects when centered (feels like "settling in")
     if z.name not in ("Transition", "Rest"):
         return 1.0
     cx, cy = z.rect.center
-    dx = (pos.x - cx) / max(1.0, z.rect.width / 2)
-    dy = (pos.y - cy) / max(1.0, z.rect.height / 2)
+    dx = (x - cx) / max(1.0, z.rect.width / 2)
+    dy = (y - cy) / max(1.0, z.rect.height / 2)
     d = math.sqrt(dx * dx + dy * dy)
     return max(0.35, 1.15 - d)
 
 # -------------------------
 # Target selection (shared)
 # -------------------------
-def decide_target_zone(agent: Agent, zones: List[Zone]) -> Zone:
-    zmap = {z.name: z for z in zones}
-    park = zmap["Park"]
-    lib = zmap["Library"]
-    trans = zmap["Transition"]
-    rest = zmap["Rest"]
+# zone slots used by decide_target_zone and last_choice_idx (independent of build_zones() order)
+ZONE_ORDER = ("Library", "Park", "Transition", "Rest")
+ZONE_IDX = {name: i for i, name in enumerate(ZONE_ORDER)}
+# max() scan order over the slots: Park first, so ties go where the old name-keyed dict sent them
+_DECIDE_SCAN = (1, 0, 2, 3)
+
+# (zones, zones by slot) of the last resolved slot table; zones never change within a run
+_zone_slots: Optional[Tuple[List[Zone], Tuple[Zone, ...]]] = None
+
+def zone_slots(zones: List[Zone]) -> Tuple[Zone, ...]:
+    global _zone_slots
+    if _zone_slots is None or _zone_slots[0] is not zones:
+        by_name = {z.name: z for z in zones}
+        _zone_slots = (zones, tuple(by_name[name] for name in ZONE_ORDER))
+    return _zone_slots[1]
 
+def decide_target_zone(agent: Agent, zones: List[Zone]) -> Zone:
     s = agent.state
-    score_park = (1.0 - s.energy) * 1.25 + s.load * 1.20 + (1.0 - s.coherence) * 0.15
-    score_lib = s.curiosity * 1.10 + s.coherence * 0.75 - s.load * 0.30
-    score_trans = (1.0 - s.coherence) * 1.25 + s.load * 0.35
-    score_rest = (1.0 - s.energy) * 0.55 + s.load * 0.85 + (1.0 - s.coherence) * 0.25
-
-    scores = {
-        "Park": score_park,
-        "Library": score_lib,
-        "Transition": score_trans,
-        "Rest": score_rest,
-    }
+    e, l, c, q = s.energy, s.load, s.coherence, s.curiosity
+    scores = (
+        q * 1.10 + c * 0.75 - l * 0.30,                               # Library
+        (1.0 - e) * 1.25 + l * 1.20 + (1.0 - c) * 0.15,               # Park
+        (1.0 - c) * 1.25 + l * 0.35,                                  # Transition
+        (1.0 - e) * 0.55 + l * 0.85 + (1.0 - c) * 0.25,               # Rest
+    )
 
-    best_name = max(scores.keys(), key=lambda k: scores[k])
-    best_score = scores[best_name]
+    best = max(_DECIDE_SCAN, key=scores.__getitem__)
 
     # hysteresis: stick with last choice unless clearly better
-    if agent.last_choice in scores and agent.last_choice in zmap:
-        last_score = scores[agent.last_choice]
-        if best_name != agent.last_choice and (best_score - last_score) < HYSTERESIS_EPS:
-            best_name = agent.last_choice
+    last = agent.last_choice_idx
+    if last >= 0 and best != last and (scores[best] - scores[last]) < HYSTERESIS_EPS:
+        best = last
 
-    return zmap.get(best_name, trans)
+    return zone_slots(zones)[best]
 
 # -------------------------
 # Edge pause (per-agent profile)
 # -------------------------
 def edge_pause_check(agent: Agent, prev_zone: Optional[Zone], now_zone: Optional[Zone]):
+    # caller only calls this once pause_cooldown has run out (the countdown is ticked inline)
     p = agent.profile
-    if agent.pause_cooldown > 0:
-        agent.pause_cooldown -= 1
-        return
 
     # boundary cross or near soft edge triggers a brief pause
     if (prev_zone is None and now_zone is not None) or (prev_zone is not None and now_zone is None):
@@ -353,73 +429,114 @@ def update_agent(agent: Agent, zones: List[Zone], dt: float):
         agent.vel *= 0.88
         return
 
-    prev_zone = next((z for z in zones if z.name == agent.current_zone), None) if agent.current_zone != "None" else None
-    now_zone = zone_at(zones, agent.pos)
-    now_name = now_zone.name if now_zone else "None"
+    prev_idx = agent.current_zone_idx
+    prev_zone = zones[prev_idx] if prev_idx >= 0 else None
+    now_idx = zone_index_at(zones, agent.pos)
+    now_zone = zones[now_idx] if now_idx >= 0 else None
 
     # dwell tracking
-    if now_name == agent.current_zone:
+    if now_idx == prev_idx:
         agent.dwell_ticks += 1
     else:
-        agent.current_zone = now_name
+        agent.current_zone = now_zone.name if now_zone else "None"
+        agent.current_zone_idx = now_idx
         agent.dwell_ticks = 0
 
-    # edge pause trigger
-    edge_pause_check(agent, prev_zone, now_zone)
+    # edge pause trigger (cooldown ticks down here: most frames never need the full check)
+    if agent.pause_cooldown > 0:
+        agent.pause_cooldown -= 1
+    else:
+        edge_pause_check(agent, prev_zone, now_zone)
 
     # apply zone effects
     if now_zone:
-        ramp = dwell_ramp(agent)
-        soft = soft_edge_factor(now_zone, agent.pos, SOFT_EDGE_MARGIN)
-        expo = exposure_factor(now_zone, agent.pos)
+        px, py = agent.pos.x, agent.pos.y
+        ramp = dwell_ramp(agent.dwell_ticks)
+        soft = soft_edge_factor(now_zone, px, py, SOFT_EDGE_MARGIN)
+        expo = exposure_factor(now_zone, px, py)
         strength = ramp * soft * expo
 
+        k = strength * dt
+        de, dl, dc, dq = now_zone.dvec60
         st = agent.state
-        st.energy = clamp01(st.energy + now_zone.deltas.get("energy", 0.0) * strength * dt * 60.0)
-        st.load = clamp01(st.load + now_zone.deltas.get("load", 0.0) * strength * dt * 60.0)
-        st.coherence = clamp01(st.coherence + now_zone.deltas.get("coherence", 0.0) * strength * dt * 60.0)
-        st.curiosity = clamp01(st.curiosity + now_zone.deltas.get("curiosity", 0.0) * strength * dt * 60.0)
+        # clamp01 inlined
+        e = st.energy + de * k
+        l = st.load + dl * k
+        c = st.coherence + dc * k
+        q = st.curiosity + dq * k
+        st.energy = 0.0 if e < 0.0 else 1.0 if e > 1.0 else e
+        st.load = 0.0 if l < 0.0 else 1.0 if l > 1.0 else l
+        st.coherence = 0.0 if c < 0.0 else 1.0 if c > 1.0 else c
+        st.curiosity = 0.0 if q < 0.0 else 1.0 if q > 1.0 else q
 
     # commit selection
     if agent.commit_ticks <= 0 or agent.commit_zone is None:
         chosen = decide_target_zone(agent, zones)
         agent.last_choice = chosen.name
+        agent.last_choice_idx = ZONE_IDX[chosen.name]
         agent.commit_zone = chosen
-        agent.commit_ticks = random.randint(p.commit_min, p.commit_max)
+        agent.commit_ticks = _randint(p.commit_min, p.commit_max)
         agent.target = pick_point_in_zone(chosen, pad=55)
     else:
         agent.commit_ticks -= 1
 
     # inside-zone micro retarget (fish stronger than ant)
-    if agent.commit_zone and agent.commit_zone.contains(agent.pos):
-        if random.random() < p.inside_zone_retarget_p:
+    in_commit = agent.commit_zone is not None and agent.commit_zone.contains(agent.pos)
+    if in_commit:
+        if _random() < p.inside_zone_retarget_p:
             agent.target = pick_point_in_zone(agent.commit_zone, pad=55)
-        if random.random() < p.orbit_impulse_p:
-            agent.target += v2(random.randint(-90, 90), random.randint(-60, 60))
-
-    # motion: target + wander blend
-    to_target = agent.target - agent.pos
-    desired = safe_normalize(to_target)
+        if _random() < p.orbit_impulse_p:
+            agent.target += v2(_randint(-90, 90), _randint(-60, 60))
+
+    pos, vel = agent.pos, agent.vel
+    dx, dy = agent.target.x - pos.x, agent.target.y - pos.y
+    d2 = dx * dx + dy * dy
+
+    # arrived (within 2px of the target, inside the committed zone): glide to rest, no wander/steer math
+    if in_commit and p.quiet_when_arrived and d2 < 4.0:
+        vx, vy = vel.x * 0.92, vel.y * 0.92
+        vel.update(vx, vy)
+        pos.update(pos.x + vx * dt, pos.y + vy * dt)
+        return
 
-    ang = random.random() * math.tau
-    wander = v2(math.cos(ang), math.sin(ang))
-    desired = safe_normalize(desired + p.wander_mix * wander)
+    # motion: target + wander blend (plain floats; pos / vel are written back in place)
+    if d2 <= 1e-9:  # safe_normalize inlined
+        dx = dy = 0.0
+    else:
+        d = math.sqrt(d2)
+        dx, dy = dx / d, dy / d
+
+    wx, wy = _WANDER[_getrandbits(WANDER_BITS)]
+    mix = p.wander_mix
+    dx += mix * wx
+    dy += mix * wy
+    d2 = dx * dx + dy * dy
+    if d2 <= 1e-9:
+        dx = dy = 0.0
+    else:
+        d = math.sqrt(d2)
+        dx, dy = dx / d, dy / d
 
     # energy-dependent speed with crawl minimum
     speed = p.base_speed * (0.35 + 1.05 * agent.state.energy)
     speed = max(p.crawl_speed_min, speed)
 
-    steer = desired * speed
-    agent.vel = agent.vel.lerp(steer, p.steer_lerp)
-    agent.pos += agent.vel * dt
+    # lerp toward the steer vector, then integrate
+    k = p.steer_lerp
+    vx = vel.x * (1 - k) + dx * speed * k
+    vy = vel.y * (1 - k) + dy * speed * k
+    vel.update(vx, vy)
 
     # clamp to screen
-    agent.pos.x = max(20, min(W - 20, agent.pos.x))
-    agent.pos.y = max(20, min(H - 20, agent.pos.y))
+    x = pos.x + vx * dt
+    y = pos.y + vy * dt
+    pos.update(max(20, min(W - 20, x)), max(20, min(H - 20, y)))
 
 # -------------------------
 # Telemetry
 # -------------------------
+TELEMETRY_BATCH_ROWS = 90  # rows held between writerows() calls (~30 frames x 3 agents)
+
 class TelemetryWriter:
     def __init__(self, enabled: bool = True):
         self.enabled = enabled
@@ -427,6 +544,7 @@ class TelemetryWriter:
         self.writer = None
         self.path = None
         self.t0 = pygame.time.get_ticks() / 1000.0
+        self._buf: List[tuple] = []
 
     def start(self):
         if not self.enabled:
@@ -444,15 +562,18 @@ class TelemetryWriter:
             "energy","load","coherence","curiosity"
         ])
 
-    def log(self, dt: float, agent: Agent):
+    def now(self) -> float:
+        return pygame.time.get_ticks() / 1000.0 - self.t0
+
+    def log(self, t: float, dt: float, agent: Agent):
+        # t: seconds since start, read once per frame (now()) so all agents in a frame share it
         if not self.enabled or self.writer is None:
             return
-        t = (pygame.time.get_ticks() / 1000.0) - self.t0
         spd = agent.vel.length()
         cz = agent.current_zone
         commit = agent.commit_zone.name if agent.commit_zone else "None"
         s = agent.state
-        self.writer.writerow([
+        self._buf.append((
             f"{t:.4f}", f"{dt:.4f}",
             agent.agent_id, agent.profile.name,
             f"{agent.pos.x:.2f}", f"{agent.pos.y:.2f}",
@@ -460,11 +581,17 @@ class TelemetryWriter:
             f"{spd:.2f}",
             cz, commit, agent.commit_ticks, agent.dwell_ticks,
             f"{s.energy:.4f}", f"{s.load:.4f}", f"{s.coherence:.4f}", f"{s.curiosity:.4f}"
-        ])
+        ))
+        if len(self._buf) >= TELEMETRY_BATCH_ROWS:
+            self.writer.writerows(self._buf)
+            self._buf.clear()
 
     def close(self):
         if self.fp:
             try:
+                if self._buf:
+                    self.writer.writerows(self._buf)
+                    self._buf.clear()
                 self.fp.flush()
                 self.fp.close()
             except Exception:
@@ -472,9 +599,46 @@ class TelemetryWriter:
         self.fp = None
         self.writer = None
 
+# -------------------------
+# Sim step (whole population)
+# -------------------------
+def step_agents(agents: List[Agent], zones: List[Zone], dt: float, telemetry: TelemetryWriter,
+                t_sec: Optional[float] = None):
+    # one tick for every agent: update, trail, telemetry
+    # (telemetry on/off is checked once per frame; log() keeps its own guard as a safety net)
+    # t_sec: frame time stamp taken by the caller; read from the telemetry clock if omitted
+    log = telemetry.log if telemetry.enabled and telemetry.writer is not None else None
+    if t_sec is None:
+        t_sec = telemetry.now() if log is not None else 0.0
+    for a in agents:
+        bx, by = a.pos.x, a.pos.y
+        update_agent(a, zones, dt)
+
+        # only add to trail if moved enough (plain floats: no before/after Vector2 copies)
+        dx, dy = a.pos.x - bx, a.pos.y - by
+        if math.sqrt(dx * dx + dy * dy) >= a.profile.trail_move_eps:
+            a.trail.append((a.pos.x, a.pos.y))
+
+        if log is not None:
+            log(t_sec, dt, a)
+
 # -------------------------
 # Drawing
 # -------------------------
+# rendered text memo for the HUD header lines: (font, text, color) -> Surface; cleared when it fills up.
+# keyed by the exact string, so a telemetry toggle / new path simply renders a new entry
+_TEXT_CACHE: Dict[Tuple[pygame.font.Font, str, Tuple[int, int, int]], pygame.Surface] = {}
+_TEXT_CACHE_MAX = 64
+
+def render_text(font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    key = (font, text, color)
+    surf = _TEXT_CACHE.get(key)
+    if surf is None:
+        if len(_TEXT_CACHE) >= _TEXT_CACHE_MAX:
+            _TEXT_CACHE.clear()
+        surf = _TEXT_CACHE[key] = font.render(text, True, color)
+    return surf
+
 def draw_hud(screen: pygame.Surface, font: pygame.font.Font, agents: List[Agent], hud_on: bool, telemetry: TelemetryWriter):
     if not hud_on:
         return
@@ -491,11 +655,10 @@ def draw_hud(screen: pygame.Surface, font: pygame.font.Font, agents: List[Agent]
     y = 12
     for i, t in enumerate(lines):
         col = TXT if i < 2 else SUBTXT
-        surf = font.render(t, True, col)
-        screen.blit(surf, (12, y))
+        screen.blit(render_text(font, t, col), (12, y))
         y += 22
 
-    # small per-agent readout (compact)
+    # small per-agent readout (compact); changes every tick, so rendered live
     y += 6
     for a in agents:
         s = a.state
@@ -504,29 +667,57 @@ def draw_hud(screen: pygame.Surface, font: pygame.font.Font, agents: List[Agent]
         screen.blit(font.render(t, True, SUBTXT), (12, y))
         y += 20
 
-def draw_world(screen: pygame.Surface, zones: List[Zone], agents: List[Agent]):
-    screen.fill(BG)
+# (zones, surface) of the last static background; zones never change within a run
+_world_bg: Optional[Tuple[List[Zone], pygame.Surface]] = None
 
-    # zones
+def _build_world_background(zones: List[Zone]) -> pygame.Surface:
+    bg = pygame.Surface((W, H)).convert()
+    bg.fill(BG)
     for z in zones:
-        rounded_rect(screen, z.rect, z.color, radius=26, width=0)
+        rounded_rect(bg, z.rect, z.color, radius=26, width=0)
         r_in = inner_rect(z.rect, SOFT_EDGE_MARGIN)
-        rounded_rect(screen, r_in, (245, 245, 248), radius=20, width=2)
+        rounded_rect(bg, r_in, (245, 245, 248), radius=20, width=2)
+    return bg
+
+# agent body sprites, rendered once per color: colorkeyed so a blit copies exactly the circle's pixels
+AGENT_RADIUS = 8
+_SPRITE_HALF = AGENT_RADIUS + 2
+_agent_sprites: Dict[Tuple[int, int, int], pygame.Surface] = {}
+
+def agent_sprite(col: Tuple[int, int, int]) -> pygame.Surface:
+    spr = _agent_sprites.get(col)
+    if spr is None:
+        spr = pygame.Surface((2 * _SPRITE_HALF, 2 * _SPRITE_HALF)).convert()
+        spr.fill((0, 0, 0))
+        spr.set_colorkey((0, 0, 0))
+        pygame.draw.circle(spr, col, (_SPRITE_HALF, _SPRITE_HALF), AGENT_RADIUS)
+        _agent_sprites[col] = spr
+    return spr
+
+def draw_world(screen: pygame.Surface, zones: List[Zone], agents: List[Agent]):
+    global _world_bg
+
+    # zones: pre-rendered once, one blit per frame
+    if _world_bg is None or _world_bg[0] is not zones:
+        _world_bg = (zones, _build_world_background(zones))
+    screen.blit(_world_bg[1], (0, 0))
 
     # draw trails then agents
     for a in agents:
         # trail length scales with energy (fish longer when energetic)
         max_len = int(14 + 95 * a.state.energy)
-        if len(a.trail) > max_len:
-            del a.trail[:-max_len]
+        trail = a.trail
+        while len(trail) > max_len:
+            trail.popleft()
 
         c = TRAIL_COLORS.get(a.profile.name, (175, 255, 220))
-        for i in range(1, len(a.trail)):
-            pygame.draw.line(screen, c, a.trail[i - 1], a.trail[i], width=2)
+        # whole polyline in one call
+        if len(trail) >= 2:
+            pygame.draw.lines(screen, c, False, trail, width=2)
 
     for a in agents:
         col = AGENT_COLORS.get(a.profile.name, (210, 255, 230))
-        pygame.draw.circle(screen, col, (int(a.pos.x), int(a.pos.y)), 8)
+        screen.blit(agent_sprite(col), (int(a.pos.x) - _SPRITE_HALF, int(a.pos.y) - _SPRITE_HALF))
 
         # "nose" direction hint (short when slow)
         spd = a.vel.length()
@@ -570,8 +761,9 @@ def spawn_agents(zones: List[Zone]) -> List[Agent]:
         a.commit_zone = zmap["Library"]
         a.commit_ticks = random.randint(a.profile.commit_min, a.profile.commit_max)
         a.last_choice = "Library"
+        a.last_choice_idx = ZONE_IDX["Library"]
         a.target = pick_point_in_zone(a.commit_zone, pad=60)
-        a.trail = [a.pos.copy()]
+        a.trail = deque([(a.pos.x, a.pos.y)], maxlen=TRAIL_MAX_LEN)
 
     return [a_fast, a_slow, fish]
 
@@ -596,54 +788,86 @@ def main():
     telemetry = TelemetryWriter(enabled=True)
     telemetry.start()
 
-    while running:
-        dt = clock.tick(FPS) / 1000.0
-        dt = min(dt, DT_CLAMP)
-
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
+    # Sim thread: steps all agents once per (dt, t, agents, telemetry) tick handed over by
+    # the main loop, so the step overlaps the previous frame's flip. Events + drawing
+    # stay on the main thread (pygame requires it); state_lock guards the agents while
+    # drawing. R / T wait for the queue to drain (ticks.join) before swapping agents or
+    # telemetry, so the RNG is consumed in the same order as a single-threaded run.
+    ticks: "queue.Queue[Optional[Tuple[float, float, List[Agent], TelemetryWriter]]]" = queue.Queue(maxsize=1)
+    state_lock = threading.Lock()
+    sim_failed = threading.Event()
+    sim_error: List[BaseException] = []
+
+    def sim_loop():
+        while True:
+            tick = ticks.get()
+            try:
+                if tick is None:
+                    return
+                if not sim_failed.is_set():
+                    tick_dt, tick_t, tick_agents, tick_telemetry = tick
+                    with state_lock:
+                        step_agents(tick_agents, zones, tick_dt, tick_telemetry, tick_t)
+            except BaseException as e:
+                # keep draining ticks so ticks.join() in the main loop can't hang
+                sim_error.append(e)
+                sim_failed.set()
+            finally:
+                ticks.task_done()
+
+    sim = threading.Thread(target=sim_loop, name="sim", daemon=True)
+    sim.start()
+
+    try:
+        while running:
+            dt = clock.tick(FPS) / 1000.0
+            dt = min(dt, DT_CLAMP)
+
+            if sim_failed.is_set():
+                raise sim_error[0]
+
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
                     running = False
-                elif event.key == pygame.K_SPACE:
-                    sim_running = not sim_running
-                elif event.key == pygame.K_n:
-                    step_once = True
-                elif event.key == pygame.K_o:
-                    hud_on = not hud_on
-                elif event.key == pygame.K_r:
-                    agents = spawn_agents(zones)
-                elif event.key == pygame.K_t:
-                    # toggle telemetry
-                    telemetry.close()
-                    telemetry.enabled = not telemetry.enabled
-                    if telemetry.enabled:
-                        telemetry = TelemetryWriter(enabled=True)
-                        telemetry.start()
-                    else:
-                        telemetry = TelemetryWriter(enabled=False)
-
-        if sim_running or step_once:
-            for a in agents:
-                before = a.pos.copy()
-                update_agent(a, zones, dt)
-
-                # only add to trail if moved enough
-                if (a.pos - before).length() >= a.profile.trail_move_eps:
-                    a.trail.append(a.pos.copy())
-
-                telemetry.log(dt, a)
-
-            step_once = False
-
-        draw_world(screen, zones, agents)
-        draw_hud(screen, font, agents, hud_on, telemetry)
-        pygame.display.flip()
-
-    telemetry.close()
-    pygame.quit()
+
+                if event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_ESCAPE:
+                        running = False
+                    elif event.key == pygame.K_SPACE:
+                        sim_running = not sim_running
+                    elif event.key == pygame.K_n:
+                        step_once = True
+                    elif event.key == pygame.K_o:
+                        hud_on = not hud_on
+                    elif event.key == pygame.K_r:
+                        ticks.join()
+                        agents = spawn_agents(zones)
+                    elif event.key == pygame.K_t:
+                        # toggle telemetry
+                        ticks.join()
+                        telemetry.close()
+                        telemetry.enabled = not telemetry.enabled
+                        if telemetry.enabled:
+                            telemetry = TelemetryWriter(enabled=True)
+                            telemetry.start()
+                        else:
+                            telemetry = TelemetryWriter(enabled=False)
+
+            if sim_running or step_once:
+                # time stamp taken here, not on the sim thread, so it belongs to this frame
+                ticks.put((dt, telemetry.now(), agents, telemetry))
+                step_once = False
+
+            with state_lock:
+                draw_world(screen, zones, agents)
+                draw_hud(screen, font, agents, hud_on, telemetry)
+            pygame.display.flip()
+
+    finally:
+        ticks.put(None)
+        sim.join()
+        telemetry.close()
+        pygame.quit()
 
 if __name__ == "__main__":
     main()
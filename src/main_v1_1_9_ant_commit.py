@@ -2,6 +2,8 @@ import os
 import csv
 import math
 import random
+from collections import deque
+from itertools import islice
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -53,7 +55,7 @@ class TelemetryLogger:
         if not self.enabled or self.writer is None:
             return
 
-        vx, vy = agent.vel.x, agent.vel.y
+        vx, vy = agent.vx, agent.vy
         speed = math.hypot(vx, vy)
 
         self.writer.writerow([
@@ -67,8 +69,8 @@ class TelemetryLogger:
             round(agent.state.load, 4),
             round(agent.state.coherence, 4),
             round(agent.state.curiosity, 4),
-            round(agent.pos.x, 3),
-            round(agent.pos.y, 3),
+            round(agent.px, 3),
+            round(agent.py, 3),
             round(vx, 4),
             round(vy, 4),
             round(speed, 4),
@@ -107,6 +109,10 @@ HYSTERESIS_BAND = 18   # extra stability band to prevent edge flicker/ping-pong
 COMMIT_MIN = 45
 COMMIT_MAX = 95
 COMMIT_TRIGGER_DWELL = 18  # must dwell this long before committing
+# Inside its commit zone the agent may re-steer only 1 tick in N and coast on the last desired
+# velocity in between (cheaper ticks). 1 = steer every tick (exact). Larger values lag the turns
+# and shift zone occupancy noticeably (N=4: ~half the off-zone time), so treat it as a tuning knob.
+COMMIT_STEER_EVERY = 1
 
 # Movement feel
 BASE_SPEED = 160.0
@@ -119,6 +125,12 @@ CRAWL_PULSE = 32.0         # stop-go cadence when low energy
 TRAIL_MIN = 8
 TRAIL_MAX = 46
 
+# RNG: bound to the module-level generator, so random.seed() still drives them
+_random = random.random
+_randint = random.randint
+_uniform = random.uniform
+_choice = random.choice
+
 
 def clamp(x: float, lo: float, hi: float) -> float:
     return lo if x < lo else hi if x > hi else x
@@ -143,6 +155,17 @@ class Zone:
     d_load: float = 0.0
     d_coherence: float = 0.0
     d_curiosity: float = 0.0
+    # margin -> (x_lo, x_hi, y_lo, y_hi) for rand_point_in_zone
+    _pick_bounds: dict[int, tuple[int, int, int, int]] = field(init=False, repr=False, compare=False, default_factory=dict)
+
+    def pick_bounds(self, margin: int) -> tuple[int, int, int, int]:
+        b = self._pick_bounds.get(margin)
+        if b is None:
+            inner = rect_inflate(self.rect, margin)
+            if inner.width <= 10 or inner.height <= 10:
+                inner = self.rect
+            b = self._pick_bounds[margin] = (inner.left + 10, inner.right - 10, inner.top + 10, inner.bottom - 10)
+        return b
 
 
 @dataclass
@@ -155,9 +178,13 @@ class AgentState:
 
 @dataclass
 class Agent:
-    pos: pygame.Vector2
-    vel: pygame.Vector2
-    target: pygame.Vector2
+    # position / velocity / target as plain floats (no Vector2 per-op allocations)
+    px: float
+    py: float
+    vx: float
+    vy: float
+    tx: float
+    ty: float
     state: AgentState = field(default_factory=AgentState)
 
     current_zone: str = "None"
@@ -174,7 +201,11 @@ class Agent:
     wander_phase: float = 0.0
     crawl_phase: float = 0.0
 
-    trail: list = field(default_factory=list)
+    # last steered (desired) velocity, reused on coast ticks
+    steer_vx: float = 0.0
+    steer_vy: float = 0.0
+
+    trail: deque = field(default_factory=lambda: deque(maxlen=TRAIL_MAX))
 
 
 def build_zones() -> list[Zone]:
@@ -215,17 +246,65 @@ def build_zones() -> list[Zone]:
     return [library, park, transition, rest]
 
 
-def zone_at(pos: pygame.Vector2, zones: list[Zone], margin: int) -> Zone | None:
-    for z in zones:
-        inner = rect_inflate(z.rect, margin)
-        if inner.width <= 0 or inner.height <= 0:
-            inner = z.rect
-        if inner.collidepoint(pos.x, pos.y):
+# inflated (left, top, right, bottom) by zone name (in zone order), memoized per margin;
+# dropped if the zones list changes
+_bounds_zones: list[Zone] | None = None
+_bounds_cache: dict[int, dict[str, tuple[int, int, int, int]]] = {}
+
+# zone lookup grid per margin: each ZONE_CELL x ZONE_CELL cell lists (zone, l, t, r, b) for the
+# inflated zones overlapping it, in zone order (so the first match still wins)
+ZONE_CELL = 64
+_grid_cache: dict[int, list[list[tuple]]] = {}
+
+
+def zone_bounds(zones: list[Zone], margin: int) -> dict[str, tuple[int, int, int, int]]:
+    global _bounds_zones
+    if zones is not _bounds_zones:
+        _bounds_zones = zones
+        _bounds_cache.clear()
+        _grid_cache.clear()
+    bounds = _bounds_cache.get(margin)
+    if bounds is None:
+        bounds = {}
+        for z in zones:
+            inner = rect_inflate(z.rect, margin)
+            if inner.width <= 0 or inner.height <= 0:
+                inner = z.rect
+            bounds[z.name] = (inner.left, inner.top, inner.right, inner.bottom)
+        _bounds_cache[margin] = bounds
+    return bounds
+
+
+def zone_grid(zones: list[Zone], margin: int) -> list[list[tuple]]:
+    bounds = zone_bounds(zones, margin)  # also drops stale grids if the zones list changed
+    grid = _grid_cache.get(margin)
+    if grid is None:
+        cols = (WIDTH + ZONE_CELL - 1) // ZONE_CELL
+        rows = (HEIGHT + ZONE_CELL - 1) // ZONE_CELL
+        grid = [[() for _ in range(cols)] for _ in range(rows)]
+        for z, (left, top, right, bottom) in zip(zones, bounds.values()):
+            for row in range(max(0, top // ZONE_CELL), min(rows, (bottom - 1) // ZONE_CELL + 1)):
+                for col in range(max(0, left // ZONE_CELL), min(cols, (right - 1) // ZONE_CELL + 1)):
+                    grid[row][col] += ((z, left, top, right, bottom),)
+        _grid_cache[margin] = grid
+    return grid
+
+
+def zone_at(x: float, y: float, zones: list[Zone], margin: int) -> Zone | None:
+    grid = zone_grid(zones, margin)
+    if x < 0.0 or y < 0.0:
+        return None
+    row, col = int(y) // ZONE_CELL, int(x) // ZONE_CELL
+    if row >= len(grid) or col >= len(grid[0]):
+        return None
+    # half-open like Rect.collidepoint
+    for z, left, top, right, bottom in grid[row][col]:
+        if left <= x < right and top <= y < bottom:
             return z
     return None
 
 
-def stable_zone(agent: Agent, zones: list[Zone], margin: int) -> Zone | None:
+def stable_zone(agent: Agent, zones: list[Zone], zmap: dict[str, Zone], margin: int) -> Zone | None:
     """
     Soft edges + hysteresis:
     - If we have a current zone, we keep it until we are clearly out of it
@@ -233,36 +312,31 @@ def stable_zone(agent: Agent, zones: list[Zone], margin: int) -> Zone | None:
     """
     # If currently in a zone, keep it unless we exit a smaller "stay" region
     if agent.current_zone and agent.current_zone != "None":
-        z_cur = next((z for z in zones if z.name == agent.current_zone), None)
+        z_cur = zmap.get(agent.current_zone)
         if z_cur:
-            stay_margin = margin + HYSTERESIS_BAND
-            stay_rect = rect_inflate(z_cur.rect, stay_margin)
-            if stay_rect.width <= 0 or stay_rect.height <= 0:
-                stay_rect = z_cur.rect
-            if stay_rect.collidepoint(agent.pos.x, agent.pos.y):
+            left, top, right, bottom = zone_bounds(zones, margin + HYSTERESIS_BAND)[z_cur.name]
+            if left <= agent.px < right and top <= agent.py < bottom:
                 return z_cur
 
     # Otherwise choose zone normally
-    return zone_at(agent.pos, zones, margin)
+    return zone_at(agent.px, agent.py, zones, margin)
 
 
-def rand_point_in_zone(z: Zone, margin: int) -> pygame.Vector2:
-    inner = rect_inflate(z.rect, margin)
-    if inner.width <= 10 or inner.height <= 10:
-        inner = z.rect
-    x = random.uniform(inner.left + 10, inner.right - 10)
-    y = random.uniform(inner.top + 10, inner.bottom - 10)
-    return pygame.Vector2(x, y)
+def rand_point_in_zone(z: Zone, margin: int) -> tuple[float, float]:
+    x_lo, x_hi, y_lo, y_hi = z.pick_bounds(margin)
+    x = _uniform(x_lo, x_hi)
+    y = _uniform(y_lo, y_hi)
+    return x, y
 
 
-def decide_target(agent: Agent, zones: list[Zone], margin: int) -> tuple[pygame.Vector2, Zone | None]:
+def decide_target(agent: Agent, zmap: dict[str, Zone], margin: int) -> tuple[tuple[float, float], Zone | None]:
     """
     Decide next target point.
     Returns (target_point, chosen_zone_or_None)
     """
     # If committed, wander within commit zone
     if agent.commit_zone and agent.commit_left > 0:
-        z = next((zz for zz in zones if zz.name == agent.commit_zone), None)
+        z = zmap.get(agent.commit_zone)
         if z:
             return rand_point_in_zone(z, margin), z
         # If commit zone missing, drop commit safely
@@ -271,10 +345,10 @@ def decide_target(agent: Agent, zones: list[Zone], margin: int) -> tuple[pygame.
 
     # Not committed: pick based on state bias
     # Bias: if energy low -> prefer Park/Rest, if load high -> prefer Park/Rest, else explore Library/Transition
-    park = next((z for z in zones if z.name == "Park"), None)
-    library = next((z for z in zones if z.name == "Library"), None)
-    rest = next((z for z in zones if z.name == "Rest"), None)
-    transition = next((z for z in zones if z.name == "Transition"), None)
+    park = zmap.get("Park")
+    library = zmap.get("Library")
+    rest = zmap.get("Rest")
+    transition = zmap.get("Transition")
 
     e = agent.state.energy
     l = agent.state.load
@@ -299,15 +373,74 @@ def decide_target(agent: Agent, zones: list[Zone], margin: int) -> tuple[pygame.
             if z: choices.append(z)
 
     if not choices:
-        return agent.target, None
+        return (agent.tx, agent.ty), None
 
-    z_pick = random.choice(choices)
+    z_pick = _choice(choices)
     return rand_point_in_zone(z_pick, margin), z_pick
 
 
-def update_agent(agent: Agent, zones: list[Zone], dt: float, margin: int):
+def _steer_velocity(
+    px: float, py: float, tx: float, ty: float,
+    wander_phase: float, crawl_phase: float, e: float,
+) -> tuple[float, float]:
+    """
+    Desired velocity on the agent's plain floats: pull to target + orbit + wander,
+    scaled by energy (speed) and the low-energy crawl pulse.
+    """
+    speed = BASE_SPEED * lerp(0.35, 1.15, e)  # low energy = slower crawl
+
+    # Crawl pulse when very low energy
+    crawl_gate = 1.0
+    if e < 0.28:
+        pulse = math.sin(crawl_phase)
+        crawl_gate = 0.35 + 0.65 * (pulse if pulse > 0.0 else 0.0)
+
+    e_scale = 0.35 + 0.65 * e
+    wander = WANDER_STRENGTH * e_scale
+    orbit = ORBIT_STRENGTH * e_scale
+
+    # Steering: unit vector to target (scaled by 1/dist, as the Vector2 version did)
+    dx, dy = tx - px, ty - py
+    inv = 1.0 / max(1.0, math.sqrt(dx * dx + dy * dy))
+    dx, dy = dx * inv, dy * inv
+
+    # to-target pull + gentle perpendicular "orbit" (-dy, dx) + sine/cos wander
+    wx = math.cos(wander_phase) * wander
+    wy = math.sin(wander_phase) * wander
+    sx = dx * RETURN_STRENGTH + -dy * orbit + wx
+    sy = dy * RETURN_STRENGTH + dx * orbit + wy
+    n = math.sqrt(sx * sx + sy * sy)
+    if n > 0:
+        sx, sy = sx / n, sy / n
+
+    return sx * speed * crawl_gate, sy * speed * crawl_gate
+
+
+def _step_motion(
+    px: float, py: float, vx: float, vy: float, dvx: float, dvy: float, dt: float,
+) -> tuple[float, float, float, float]:
+    """
+    Ease velocity toward (dvx, dvy) and integrate.
+    Returns the new (px, py, vx, vy), already clamped to the window.
+    """
+    # Smooth velocity (dt-stable)
+    alpha = dt * 6.5
+    alpha = 0.0 if alpha < 0.0 else 1.0 if alpha > 1.0 else alpha  # clamp inlined
+    vx = lerp(vx, dvx, alpha)
+    vy = lerp(vy, dvy, alpha)
+
+    # Integrate + keep inside window
+    # (clamps inlined)
+    px += vx * dt
+    px = 10.0 if px < 10.0 else WIDTH - 10.0 if px > WIDTH - 10.0 else px
+    py += vy * dt
+    py = 10.0 if py < 10.0 else HEIGHT - 10.0 if py > HEIGHT - 10.0 else py
+    return px, py, vx, vy
+
+
+def update_agent(agent: Agent, zones: list[Zone], zmap: dict[str, Zone], dt: float, margin: int):
     # Update zone + dwell
-    z = stable_zone(agent, zones, margin)
+    z = stable_zone(agent, zones, zmap, margin)
     zone_name = z.name if z else "None"
 
     if zone_name == agent.current_zone:
@@ -318,18 +451,24 @@ def update_agent(agent: Agent, zones: list[Zone], dt: float, margin: int):
 
     # Effects
     if z:
-        agent.state.energy = clamp(agent.state.energy + z.d_energy * dt, 0.0, 1.0)
-        agent.state.load = clamp(agent.state.load + z.d_load * dt, 0.0, 1.0)
-        agent.state.coherence = clamp(agent.state.coherence + z.d_coherence * dt, 0.0, 1.0)
-        agent.state.curiosity = clamp(agent.state.curiosity + z.d_curiosity * dt, 0.0, 1.0)
+        # (clamps to 0..1 inlined: this runs every tick the agent is in a zone)
+        s = agent.state
+        v = s.energy + z.d_energy * dt
+        s.energy = 0.0 if v < 0.0 else 1.0 if v > 1.0 else v
+        v = s.load + z.d_load * dt
+        s.load = 0.0 if v < 0.0 else 1.0 if v > 1.0 else v
+        v = s.coherence + z.d_coherence * dt
+        s.coherence = 0.0 if v < 0.0 else 1.0 if v > 1.0 else v
+        v = s.curiosity + z.d_curiosity * dt
+        s.curiosity = 0.0 if v < 0.0 else 1.0 if v > 1.0 else v
 
     # Commit trigger
     if agent.commit_left <= 0 and agent.dwell_ticks >= COMMIT_TRIGGER_DWELL and z and z.name in ("Library", "Park"):
         # Probabilistic commit (more likely as dwell increases)
         p = clamp(0.25 + (agent.dwell_ticks - COMMIT_TRIGGER_DWELL) * 0.02, 0.25, 0.85)
-        if random.random() < p:
+        if _random() < p:
             agent.commit_zone = z.name
-            agent.commit_left = random.randint(COMMIT_MIN, COMMIT_MAX)
+            agent.commit_left = _randint(COMMIT_MIN, COMMIT_MAX)
 
     # Commit countdown
     if agent.commit_left > 0:
@@ -344,7 +483,7 @@ def update_agent(agent: Agent, zones: list[Zone], dt: float, margin: int):
         if agent.pause_cooldown <= 0:
             base = 6
             extra = int(10 * clamp(agent.state.load, 0.0, 1.0)) + int(10 * (1.0 - agent.state.energy))
-            agent.pause_hold = base + random.randint(0, extra)
+            agent.pause_hold = base + _randint(0, extra)
             agent.pause_cooldown = 25  # prevents constant pausing
 
     if agent.pause_cooldown > 0:
@@ -352,63 +491,45 @@ def update_agent(agent: Agent, zones: list[Zone], dt: float, margin: int):
 
     # Select / refresh target
     # If close to target, pick new target
-    if agent.pos.distance_to(agent.target) < 18:
-        agent.target, _zpick = decide_target(agent, zones, margin)
+    dx, dy = agent.tx - agent.px, agent.ty - agent.py
+    if dx * dx + dy * dy < 324.0:  # within 18 px (squared: no sqrt)
+        (agent.tx, agent.ty), _zpick = decide_target(agent, zmap, margin)
 
     # Movement: energy scales speed + wander
     e = agent.state.energy
-    speed = BASE_SPEED * lerp(0.35, 1.15, e)  # low energy = slower crawl
 
-    # Crawl pulse when very low energy
+    # Crawl pulse (stop-go when very low energy) + wander phase
     agent.crawl_phase += dt * CRAWL_PULSE
-    crawl_gate = 1.0
-    if e < 0.28:
-        crawl_gate = 0.35 + 0.65 * max(0.0, math.sin(agent.crawl_phase))
-
-    # Wander phase
     agent.wander_phase += dt * (0.9 + 1.6 * e)
-    wander = WANDER_STRENGTH * (0.35 + 0.65 * e)
-    orbit = ORBIT_STRENGTH * (0.35 + 0.65 * e)
-
-    # Steering
-    to_t = (agent.target - agent.pos)
-    dist = max(1.0, to_t.length())
-    dir_to = to_t / dist
-
-    # add a gentle perpendicular “orbit” (fish/ant curve)
-    perp = pygame.Vector2(-dir_to.y, dir_to.x)
-
-    # noise-ish wander (sine/cos)
-    w = pygame.Vector2(math.cos(agent.wander_phase), math.sin(agent.wander_phase))
-
-    desired = dir_to * RETURN_STRENGTH + perp * orbit + w * wander
-    if desired.length() > 0:
-        desired = desired.normalize()
-
-    desired_vel = desired * speed * crawl_gate
 
     # Edge pause hold overrides movement briefly
-    if agent.pause_hold > 0:
+    hold = agent.pause_hold > 0
+    if hold:
         agent.pause_hold -= 1
-        desired_vel *= 0.15  # still drifts slightly (feels alive)
-
-    # Smooth velocity (dt-stable)
-    alpha = clamp(dt * 6.5, 0.0, 1.0)
-    agent.vel.x = lerp(agent.vel.x, desired_vel.x, alpha)
-    agent.vel.y = lerp(agent.vel.y, desired_vel.y, alpha)
 
-    # Integrate
-    agent.pos += agent.vel * dt
+    # Deep in a commit (inside the commit zone, no pause) the target only changes on arrival:
+    # re-steer every COMMIT_STEER_EVERY ticks and coast on the last desired velocity in between
+    if hold or agent.commit_left % COMMIT_STEER_EVERY == 0 or agent.current_zone != agent.commit_zone:
+        dvx, dvy = _steer_velocity(
+            agent.px, agent.py, agent.tx, agent.ty, agent.wander_phase, agent.crawl_phase, e,
+        )
+        agent.steer_vx, agent.steer_vy = dvx, dvy
+        if hold:
+            dvx *= 0.15  # still drifts slightly (feels alive)
+            dvy *= 0.15
+    else:
+        dvx, dvy = agent.steer_vx, agent.steer_vy
 
-    # Keep inside window
-    agent.pos.x = clamp(agent.pos.x, 10, WIDTH - 10)
-    agent.pos.y = clamp(agent.pos.y, 10, HEIGHT - 10)
+    agent.px, agent.py, agent.vx, agent.vy = _step_motion(
+        agent.px, agent.py, agent.vx, agent.vy, dvx, dvy, dt,
+    )
 
     # Trail length scales with energy
+    # (the deque's maxlen evicts the oldest point; it is only rebuilt when the length changes)
     trail_len = int(lerp(TRAIL_MIN, TRAIL_MAX, e))
-    agent.trail.append((agent.pos.x, agent.pos.y))
-    if len(agent.trail) > trail_len:
-        agent.trail = agent.trail[-trail_len:]
+    if agent.trail.maxlen != trail_len:
+        agent.trail = deque(agent.trail, maxlen=trail_len)
+    agent.trail.append((agent.px, agent.py))
 
 
 # =========================================================
@@ -437,19 +558,40 @@ def draw_zone_visuals(surf: pygame.Surface, zones: list[Zone]):
             inner = z.rect.inflate(-46, -46)
             pygame.draw.rect(surf, (245, 245, 245), inner, width=2, border_radius=16)
 
+# trail segment colors (older -> newer) per trail length L: TRAIL_COLORS[L][i - 1] for segment i of L points
+TRAIL_COLORS: list[list[tuple[int, int, int]]] = [
+    [(int(140 + 80 * (i / L)), int(220 + 10 * (i / L)), int(200 + 20 * (i / L))) for i in range(1, L)]
+    for L in range(TRAIL_MAX + 1)
+]
+
 def draw_agent(surf: pygame.Surface, agent: Agent):
     # Trail (older -> newer)
-    if len(agent.trail) >= 2:
-        for i in range(1, len(agent.trail)):
-            a = i / len(agent.trail)
-            x1, y1 = agent.trail[i - 1]
-            x2, y2 = agent.trail[i]
-            col = (int(140 + 80 * a), int(220 + 10 * a), int(200 + 20 * a))
-            pygame.draw.line(surf, col, (x1, y1), (x2, y2), width=2)
+    trail = agent.trail
+    if len(trail) >= 2:
+        prev = trail[0]
+        for col, p in zip(TRAIL_COLORS[len(trail)], islice(trail, 1, None)):
+            pygame.draw.line(surf, col, prev, p, width=2)
+            prev = p
 
     # Agent body
-    pygame.draw.circle(surf, (180, 255, 235), (int(agent.pos.x), int(agent.pos.y)), 8)
-    pygame.draw.circle(surf, (90, 200, 160), (int(agent.pos.x), int(agent.pos.y)), 8, width=2)
+    center = (int(agent.px), int(agent.py))
+    pygame.draw.circle(surf, (180, 255, 235), center, 8)
+    pygame.draw.circle(surf, (90, 200, 160), center, 8, width=2)
+
+# rendered HUD lines by exact text: (font, text) -> Surface; cleared when it fills up
+_TEXT_CACHE: dict[tuple[pygame.font.Font, str], pygame.Surface] = {}
+_TEXT_CACHE_MAX = 256
+
+
+def render_text(font, text: str) -> pygame.Surface:
+    key = (font, text)
+    img = _TEXT_CACHE.get(key)
+    if img is None:
+        if len(_TEXT_CACHE) >= _TEXT_CACHE_MAX:
+            _TEXT_CACHE.clear()
+        img = _TEXT_CACHE[key] = font.render(text, True, (235, 235, 235))
+    return img
+
 
 def draw_hud(surf: pygame.Surface, font, agent: Agent, margin: int, title: str):
     z = agent.current_zone
@@ -462,8 +604,7 @@ def draw_hud(surf: pygame.Surface, font, agent: Agent, margin: int, title: str):
     ]
     y = 14
     for s in lines:
-        img = font.render(s, True, (235, 235, 235))
-        surf.blit(img, (14, y))
+        surf.blit(render_text(font, s), (14, y))
         y += 22
 
 
@@ -479,15 +620,16 @@ def main():
     font = pygame.font.SysFont("consolas", 18)
 
     zones = build_zones()
+    zmap = {z.name: z for z in zones}
 
     agent = Agent(
-        pos=pygame.Vector2(300, 300),
-        vel=pygame.Vector2(0, 0),
-        target=pygame.Vector2(300, 300),
+        px=300.0, py=300.0,
+        vx=0.0, vy=0.0,
+        tx=300.0, ty=300.0,
     )
 
     # Start with a target
-    agent.target, _ = decide_target(agent, zones, SOFT_EDGE_MARGIN)
+    (agent.tx, agent.ty), _ = decide_target(agent, zmap, SOFT_EDGE_MARGIN)
 
     hud_on = True
     paused = False
@@ -522,7 +664,7 @@ def main():
             # Update
             do_update = (not paused) or step_one
             if do_update:
-                update_agent(agent, zones, dt, SOFT_EDGE_MARGIN)
+                update_agent(agent, zones, zmap, dt, SOFT_EDGE_MARGIN)
                 step_one = False
 
             # Render
@@ -2,7 +2,7 @@
 from __future__ import annotations
 from dataclasses import dataclass
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MotionProfile:
     name: str
     model: str  # "fish" or "ant"
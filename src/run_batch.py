@@ -30,10 +30,10 @@ def ensure_runs_dir() -> str:
     return out_dir
 
 
-def make_run_path(variant: str, seed: int) -> str:
+def make_run_path(variant: str, seed: int, ext: str = "csv") -> str:
     out_dir = ensure_runs_dir()
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-    return os.path.join(out_dir, f"run_{ts}_{variant.lower()}_seed{seed}.csv")
+    return os.path.join(out_dir, f"run_{ts}_{variant.lower()}_seed{seed}.{ext}")
 
 
 def build_agents(zmap):
@@ -72,18 +72,26 @@ def build_agents(zmap):
             ag.commit_ticks = random.randint(ag.profile.commit_min, ag.profile.commit_max)
             ag.last_choice = ag.commit_zone.name
             ag.target = sim.pick_point_in_zone(ag.commit_zone, pad=55)
-            ag.trail = [ag.pos.copy()]
+            ag.trail.append((ag.pos.x, ag.pos.y))
 
     return agents
 
 
-def run_one(variant: str, seconds: float, seed: int, fps: int, summarize: bool) -> str:
+def run_one(
+    variant: str,
+    seconds: float,
+    seed: int,
+    fps: int,
+    summarize: bool,
+    out_format: str = "csv",
+    log_hz: float | None = None,
+) -> str:
     random.seed(seed)
 
     # Use the same VARIANT switch your main.py uses
     sim.VARIANT = variant
 
-    zones = sim.build_zones()
+    zones = sim.build_zones(variant)
     zmap = {z.name: z for z in zones}
     agents = build_agents(zmap)
 
@@ -93,59 +101,111 @@ def run_one(variant: str, seconds: float, seed: int, fps: int, summarize: bool)
     dt = min(dt, min(a.profile.dt_clamp for a in agents))
 
     steps = int(seconds / dt)
-
-    run_csv_path = make_run_path(variant, seed)
-
-    with open(run_csv_path, "w", newline="", encoding="utf-8") as f:
+    # telemetry sampling: one row set every log_every ticks (None = every tick); the sim still steps every tick
+    log_every = max(1, int(fps / log_hz)) if log_hz else 1
+
+    # Telemetry sink: CSV (formatted strings) or Parquet (raw values, same columns)
+    raw_rows = out_format == "parquet"
+    run_csv_path = make_run_path(variant, seed, ext="parquet" if raw_rows else "csv")
+    columns = [
+        "t_sec","dt","agent_id",
+        "x","y","vx","vy","speed",
+        "zone","commit_zone","commit_left","dwell_ticks","work_units","output_score",
+        "energy","load","coherence","curiosity",
+        "profile","model"
+    ]
+
+    if raw_rows:
+        w = sim.ParquetTelemetry(run_csv_path, ncols=len(columns))
+        close_sink = w.close
+    else:
+        f = open(run_csv_path, "w", newline="", encoding="utf-8", buffering=1 << 20)
         w = csv.writer(f)
-        w.writerow([
-            "t_sec","dt","agent_id",
-            "x","y","vx","vy","speed",
-            "zone","commit_zone","commit_left","dwell_ticks","work_units","output_score",
-            "energy","load","coherence","curiosity",
-            "profile","model"
-        ])
-
+        w.writerow(columns)
+        close_sink = f.close
+
+    # per-agent dispatch resolved once per run: (agent, is_fish, profile name, model, trail_eps_sq)
+    plan = [
+        (ag, ag.profile.model == "fish", ag.profile.name, ag.profile.model, ag.profile.trail_move_eps ** 2)
+        for ag in agents
+    ]
+    update_fish = sim.update_agent_fish
+    update_ant = sim.update_agent_ant
+    dt_out = f"{dt:.4f}"  # fixed timestep: same value on every row
+
+    # rows held in memory between writerows() calls
+    row_buf = []
+    buf_rows = sim.TELEMETRY_BUF_ROWS
+
+    try:
         t_sec = 0.0
-        for _ in range(steps):
+        for step in range(steps):
             t_sec += dt
-            for ag in agents:
-                before = ag.pos.copy()
-
-                if ag.profile.model == "fish":
-                    sim.update_agent_fish(ag, zones, dt)
+            log_tick = step % log_every == 0
+            if log_tick:
+                t_out = f"{t_sec:.4f}"
+            for ag, is_fish, prof_name, model, trail_eps_sq in plan:
+                if is_fish:
+                    update_fish(ag, zones, dt, variant)
                 else:
-                    sim.update_agent_ant(ag, zones, dt)
+                    bx, by = ag.pos.x, ag.pos.y  # float snapshot (no Vector2 copy per tick)
+                    update_ant(ag, zones, dt)
                     # trails not needed for headless, but harmless if you want parity
-                    if (ag.pos - before).length() >= ag.profile.trail_move_eps:
-                        ag.trail.append(ag.pos.copy())
+                    mx, my = ag.pos.x - bx, ag.pos.y - by
+                    if mx * mx + my * my >= trail_eps_sq:
+                        ag.trail.append((ag.pos.x, ag.pos.y))
 
-                s = ag.state
-                speed = ag.vel.length()
+                if not log_tick:
+                    continue
 
-                if ag.profile.model == "fish":
-                    commit_zone = ag.fish_commit_zone if getattr(ag, "fish_commit_zone", None) else "-"
-                    commit_left = getattr(ag, "fish_commit_ticks_left", 0)
+                if is_fish:
+                    commit_zone = ag.fish_commit_zone if ag.fish_commit_zone else "-"
+                    commit_left = ag.fish_commit_ticks_left
                 else:
                     commit_zone = ag.commit_zone.name if ag.commit_zone else "-"
                     commit_left = ag.commit_ticks
 
-                w.writerow([
-                    round(t_sec, 4), round(dt, 4), ag.agent_id,
-                    round(ag.pos.x, 2), round(ag.pos.y, 2),
-                    round(ag.vel.x, 2), round(ag.vel.y, 2),
-                    round(speed, 2),
+                s = ag.state
+                pos, vel = ag.pos, ag.vel
+                speed = vel.length()
+
+                if raw_rows:
+                    row_buf.append((
+                        t_sec, dt, ag.agent_id,
+                        pos.x, pos.y, vel.x, vel.y, speed,
+                        ag.current_zone, commit_zone, commit_left, ag.dwell_ticks, ag.work_units, ag.output_score,
+                        s.energy, s.load, s.coherence, s.curiosity,
+                        prof_name, model,
+                    ))
+                    continue
+
+                # precision is fixed by the format specs (no round() + float repr per column)
+                row_buf.append([
+                    t_out, dt_out, ag.agent_id,
+                    f"{pos.x:.2f}", f"{pos.y:.2f}",
+                    f"{vel.x:.2f}", f"{vel.y:.2f}",
+                    f"{speed:.2f}",
                     ag.current_zone, commit_zone, commit_left, ag.dwell_ticks,
-                    getattr(ag, "work_units", 0),
-                    round(getattr(ag, "output_score", 0.0), 4),
-                    round(s.energy, 4), round(s.load, 4), round(s.coherence, 4), round(s.curiosity, 4),
-                    ag.profile.name, ag.profile.model
+                    ag.work_units,
+                    f"{ag.output_score:.4f}",
+                    f"{s.energy:.4f}", f"{s.load:.4f}", f"{s.coherence:.4f}", f"{s.curiosity:.4f}",
+                    prof_name, model
                 ])
 
+            if len(row_buf) >= buf_rows:
+                w.writerows(row_buf)
+                row_buf.clear()
+    finally:
+        if row_buf:
+            w.writerows(row_buf)
+        close_sink()
+
     # Optional: auto-run summary tool after each batch run
     if summarize:
         tool = os.path.join(REPO, "telemetry_tools", "summarize_run.py")
-        if os.path.isfile(tool):
+        if raw_rows:
+            print(f"[warn] summarize_run.py reads CSV; skipped for: {run_csv_path}")
+        elif os.path.isfile(tool):
             subprocess.run([sys.executable, tool, run_csv_path], cwd=REPO)
         else:
             print(f"[warn] summarize_run.py not found at: {tool}")
@@ -161,11 +221,13 @@ def main():
     ap.add_argument("--seed", type=int, default=123, help="base seed (seed+i per run)")
     ap.add_argument("--fps", type=int, default=60, help="fixed timestep fps")
     ap.add_argument("--summarize", action="store_true", help="auto-run telemetry_tools/summarize_run.py")
+    ap.add_argument("--format", choices=("csv", "parquet"), default="csv", help="telemetry file format (parquet needs pyarrow)")
+    ap.add_argument("--log-hz", type=float, default=None, help="telemetry rows per second (default: every tick)")
     args = ap.parse_args()
 
     for i in range(args.runs):
         run_seed = args.seed + i
-        out = run_one(args.variant, args.seconds, run_seed, args.fps, args.summarize)
+        out = run_one(args.variant, args.seconds, run_seed, args.fps, args.summarize, args.format, args.log_hz)
         print(f"Saved -> {out}")
 
 